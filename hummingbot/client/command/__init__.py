@@ -16,6 +16,7 @@ from .silly_commands import SillyCommands
 from .start_command import StartCommand
 from .status_command import StatusCommand
 from .stop_command import StopCommand
+from .tick_stats_command import TickStatsCommand
 from .ticker_command import TickerCommand
 
 __all__ = [
@@ -37,5 +38,6 @@ __all__ = [
     StartCommand,
     StatusCommand,
     StopCommand,
+    TickStatsCommand,
     TickerCommand,
 ]
@@ -30,6 +30,9 @@ class ExitCommand:
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
+        if self._metrics_exporter is not None:
+            await self._metrics_exporter.stop()
+
         self.notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple
 
 import pandas as pd
 
@@ -46,11 +46,13 @@ class OrderBookCommand:
         else:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
-        def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+        def get_top_levels(lines: int) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+            bids, asks = order_book.top_levels(lines)
+            return [(row.price, row.amount) for row in bids], [(row.price, row.amount) for row in asks]
+
+        def get_order_book(top_levels: Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]):
+            bids = pd.DataFrame(data=top_levels[0], columns=["bid_price", "bid_volume"], dtype="float64")
+            asks = pd.DataFrame(data=top_levels[1], columns=["ask_price", "ask_volume"], dtype="float64")
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = [
                 "    " + line
@@ -62,8 +64,16 @@ class OrderBookCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
+            lines = min(lines, 35)
+            displayed_levels = None
+            displayed_text = None
             while self.app.live_updates:
-                await self.cls_display_delay(get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update.", 0.5)
+                top_levels = get_top_levels(lines)
+                # The table is redrawn every interval but only rebuilt when the displayed levels change
+                if top_levels != displayed_levels:
+                    displayed_text = get_order_book(top_levels) + "\n\n Press escape key to stop update."
+                    displayed_levels = top_levels
+                await self.cls_display_delay(displayed_text, 0.5)
             self.notify("Stopped live orderbook display update.")
         else:
-            self.notify(get_order_book(lines))
+            self.notify(get_order_book(get_top_levels(lines)))
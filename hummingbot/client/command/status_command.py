@@ -13,9 +13,13 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor
+from hummingbot.core.utils.order_tracing import ORDER_STAGES
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -126,9 +130,82 @@ class StatusCommand:
         return validation_errors
 
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               perf: bool = False):
+        if perf:
+            safe_ensure_future(self.perf_status_check(live=live), loop=self.ev_loop)
+            return
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
 
+    async def perf_status_check(self,  # type: HummingbotApplication
+                                live: bool = False):
+        if live:
+            await self.stop_live_update()
+            self.app.live_updates = True
+            while self.app.live_updates:
+                await self.cls_display_delay(self.perf_status() + "\n\n Press escape key to stop update.", 1)
+            self.notify("Stopped live performance status display update.")
+        else:
+            self.notify(self.perf_status())
+
+    def perf_status(self,  # type: HummingbotApplication
+                    ) -> str:
+        loop_monitor = LoopMonitor.get_instance()
+        lines = []
+        if not loop_monitor.started:
+            lines.append("\n  The event loop monitor is not running.")
+        lag = loop_monitor.lag_histogram
+        lines.extend([
+            "\n  Event loop lag:",
+            f"    Last: {loop_monitor.last_lag * 1e3:.1f} ms    Mean: {lag.mean * 1e3:.1f} ms    "
+            f"p99: {lag.percentile(99) * 1e3:.1f} ms    Max: {lag.max * 1e3:.1f} ms",
+        ])
+
+        live_tasks = sorted(loop_monitor.live_tasks().items(), key=lambda item: item[1], reverse=True)
+        created_tasks = loop_monitor.created_tasks
+        lines.append(f"\n  Live tasks ({sum(count for _, count in live_tasks)}):")
+        df = pd.DataFrame(data=[[name, count, created_tasks.get(name, "")]
+                                for name, count in live_tasks[:self.PERF_STATUS_ROWS_LIMIT]],
+                          columns=["Coroutine", "Live", "Created"])
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df, self.client_config_map.tables_format).split("\n")])
+
+        slow_callbacks = sorted(loop_monitor.slow_callbacks.items(), key=lambda item: item[1].sum, reverse=True)
+        if len(slow_callbacks) > 0:
+            lines.append(f"\n  Slow callbacks (over {loop_monitor.SLOW_CALLBACK_DURATION * 1e3:.0f} ms):")
+            df = pd.DataFrame(data=[[source, histogram.count, round(histogram.mean * 1e3, 1),
+                                     round(histogram.max * 1e3, 1)]
+                                    for source, histogram in slow_callbacks[:self.PERF_STATUS_ROWS_LIMIT]],
+                              columns=["Source", "Count", "Mean (ms)", "Max (ms)"])
+            lines.extend(["    " + line for line in format_df_for_printout(
+                df, self.client_config_map.tables_format).split("\n")])
+
+        backlogs = sorted(loop_monitor.queue_backlogs().items(), key=lambda item: item[1], reverse=True)
+        if len(backlogs) > 0:
+            lines.append("\n  Queue backlogs:")
+            df = pd.DataFrame(data=backlogs[:self.PERF_STATUS_ROWS_LIMIT], columns=["Queue", "Items"])
+            lines.extend(["    " + line for line in format_df_for_printout(
+                df, self.client_config_map.tables_format).split("\n")])
+
+        order_stage_rows = [
+            [market.display_name, stage.value, histogram.count, round(histogram.mean * 1e3, 1),
+             round(histogram.percentile(99) * 1e3, 1), round(histogram.max * 1e3, 1)]
+            for market in self.markets.values() if isinstance(market, ExchangePyBase)
+            for stage, histogram in sorted(market.order_stage_latencies.items(),
+                                           key=lambda item: ORDER_STAGES.index(item[0]))
+        ]
+        if len(order_stage_rows) > 0:
+            lines.append("\n  Order creation stages (time since the previous stage):")
+            df = pd.DataFrame(data=order_stage_rows,
+                              columns=["Market", "Stage", "Orders", "Mean (ms)", "p99 (ms)", "Max (ms)"])
+            lines.extend(["    " + line for line in format_df_for_printout(
+                df, self.client_config_map.tables_format).split("\n")])
+
+        if self.clock is not None:
+            lines.append("\n  Clock ticks:")
+            lines.append(self.tick_stats_report(self.clock.profiler))
+        return "\n".join(lines)
+
     async def status_check_all(self,  # type: HummingbotApplication
                                notify_success=True,
                                live=False) -> bool:
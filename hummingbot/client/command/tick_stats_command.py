@@ -0,0 +1,65 @@
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class TickStatsCommand:
+    def tick_stats(self,  # type: HummingbotApplication
+                   reset: bool = False,
+                   profile_threshold: Optional[float] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.tick_stats, reset, profile_threshold)
+            return
+        if self.clock is None:
+            self.notify("\n This command can only be used while a strategy is running")
+            return
+        profiler: ClockProfiler = self.clock.profiler
+        if profile_threshold is not None:
+            profiler.profile_threshold = profile_threshold
+            if profiler.profile_threshold is None:
+                self.notify("\n Slow ticks profiling disabled.")
+            else:
+                self.notify(f"\n The tick following a tick slower than {profiler.profile_threshold}s will be profiled "
+                            f"and logged.")
+        if reset:
+            profiler.reset()
+            self.notify("\n Clock tick statistics reset.")
+            return
+        self.notify(self.tick_stats_report(profiler))
+
+    def tick_stats_report(self,  # type: HummingbotApplication
+                          profiler: ClockProfiler) -> str:
+        ticks = profiler.tick_histogram
+        lines = [
+            f"\n  Tick size: {profiler.tick_size}s",
+            f"  Ticks: {ticks.count}    Overruns: {profiler.overruns_count}    "
+            f"Skipped ticks: {profiler.skipped_ticks_count}",
+        ]
+        if ticks.count == 0:
+            return "\n".join(lines)
+        columns = ["Iterator", "Ticks", "Mean (ms)", "p50 (ms)", "p99 (ms)", "Max (ms)"]
+        data = [["Total tick"] + self._histogram_row(ticks)]
+        for stats in sorted(profiler.iterator_stats, key=lambda s: s.histogram.sum, reverse=True):
+            data.append([stats.name] + self._histogram_row(stats.histogram))
+        df = pd.DataFrame(data=data, columns=columns)
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df, self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
+
+    @staticmethod
+    def _histogram_row(histogram: LatencyHistogram) -> List[Any]:
+        return [
+            histogram.count,
+            round(histogram.mean * 1e3, 3),
+            round(histogram.percentile(50) * 1e3, 3),
+            round(histogram.percentile(99) * 1e3, 3),
+            round(histogram.max * 1e3, 3),
+        ]
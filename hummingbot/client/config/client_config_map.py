@@ -432,10 +432,35 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: float = Field(
+        default=5.0,
+        description=("Seconds a Gateway quote price is reused for the same trading pair, side and amount."
+                     "\nConcurrent requests of the same quote always share a single call to Gateway."),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "For how many seconds should a Gateway quote price be reused? (0 to disable)",
+        ),
+    )
+    gateway_quote_cache_per_block: bool = Field(
+        default=False,
+        description="Whether the cached Gateway quote prices also expire when a new block is mined.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Should the cached Gateway quote prices expire with each new block? (Yes/No)",
+        ),
+    )
 
     class Config:
         title = "gateway"
 
+    @validator("gateway_quote_cache_per_block", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class GlobalTokenConfigMap(BaseClientModel):
     global_token_name: str = Field(
@@ -679,6 +704,16 @@ class ClientConfigMap(BaseClientModel):
             prompt=lambda cm: f"Select the desired metrics mode ({'/'.join(list(METRICS_MODES.keys()))})",
         ),
     )
+    metrics_exporter_port: int = Field(
+        default=0,
+        description=("Local port serving the bot performance metrics in the Prometheus text format"
+                     "\n(http://127.0.0.1:<port>/metrics). Set to 0 to disable the metrics exporter."),
+        ge=0,
+        le=65535,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "On which local port do you want to serve the performance metrics? (0 to disable)",
+        ),
+    )
     command_shortcuts: List[CommandShortcutModel] = Field(
         default=[
             CommandShortcutModel(
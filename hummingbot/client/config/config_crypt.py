@@ -1,6 +1,8 @@
 import binascii
 import json
+import threading
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
 
 from eth_account import Account
 from eth_keyfile.keyfile import (
@@ -8,14 +10,17 @@ from eth_keyfile.keyfile import (
     SCRYPT_P,
     SCRYPT_R,
     Random,
-    _pbkdf2_hash,
-    _scrypt_hash,
+    _derive_pbkdf_key,
+    _derive_scrypt_key,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
     int_to_big_endian,
     keccak,
+    normalize_keys,
 )
 from pydantic import SecretStr
 
@@ -41,14 +46,42 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def needs_reencryption(self, value: str) -> bool:
+        """
+        Whether an encrypted value should be encrypted again, to use the current encryption parameters.
+        """
+        return False
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts each secret value as an Ethereum V3 keyfile.
+
+    Deriving the key from the password is by design the expensive part of the encryption, so the derived keys are
+    kept in memory for the session, indexed by their KDF parameters (including the salt).
+
+    The values are encrypted with a shared salt, so they are all decrypted with a single key derivation. The salt is
+    the one of the first value decrypted with the default KDF parameters (the password verification word on login),
+    or a random one. All the values encrypted with it share the same derived key, each with its own random IV and MAC.
+    Values with other KDF parameters (e.g. their own salt) are still decrypted, and `needs_reencryption` reports them
+    so they can be saved again with the shared salt.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._encryption_salt: Optional[bytes] = None
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+        self._derivation_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._derivation_locks_lock = threading.Lock()
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
         password_bytes = self._password.encode()
         value_bytes = value.encode()
-        keyfile_json = _create_v3_keyfile_json(value_bytes, password_bytes)
+        keyfile_json = _create_v3_keyfile_json(
+            value_bytes, password_bytes, salt=self.encryption_salt, derived_keys_cache=self
+        )
         json_str = json.dumps(keyfile_json)
         encrypted_value = binascii.hexlify(json_str.encode()).decode()
         return encrypted_value
@@ -57,9 +90,58 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
         value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = normalize_keys(json.loads(value.decode()))
+        if keyfile_json.get("version") != 3:
+            return Account.decrypt(value.decode(), self._password).decode()
+
+        crypto = keyfile_json["crypto"]
+        derived_key = self.derived_key(crypto["kdf"], crypto["kdfparams"])
+        ciphertext = decode_hex(crypto["ciphertext"])
+        mac = keccak(derived_key[16:32] + ciphertext)
+        if mac != decode_hex(crypto["mac"]):
+            raise ValueError("MAC mismatch")
+        iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+        decrypted_value = decrypt_aes_ctr(ciphertext, derived_key[:16], iv).decode()
+        if self._encryption_salt is None and _has_default_kdfparams(crypto):
+            with self._derivation_locks_lock:
+                if self._encryption_salt is None:
+                    self._encryption_salt = decode_hex(crypto["kdfparams"]["salt"])
         return decrypted_value
 
+    def needs_reencryption(self, value: str) -> bool:
+        try:
+            keyfile_json = normalize_keys(json.loads(binascii.unhexlify(value).decode()))
+        except (ValueError, TypeError):
+            return False
+        crypto = keyfile_json.get("crypto", {})
+        return not (keyfile_json.get("version") == 3
+                    and _has_default_kdfparams(crypto)
+                    and decode_hex(crypto["kdfparams"]["salt"]) == self.encryption_salt)
+
+    @property
+    def encryption_salt(self) -> bytes:
+        with self._derivation_locks_lock:
+            if self._encryption_salt is None:
+                self._encryption_salt = Random.get_random_bytes(16)
+        return self._encryption_salt
+
+    def derived_key(self, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+        """
+        Returns the key derived from the password for the KDF parameters, deriving it only once per session.
+        Concurrent derivations of the same key wait for the first one, derivations of different keys run in parallel.
+        """
+        cache_key = (kdf, json.dumps(kdfparams, sort_keys=True))
+        derived_key = self._derived_keys.get(cache_key)
+        if derived_key is None:
+            with self._derivation_locks_lock:
+                derivation_lock = self._derivation_locks.setdefault(cache_key, threading.Lock())
+            with derivation_lock:
+                derived_key = self._derived_keys.get(cache_key)
+                if derived_key is None:
+                    derived_key = _derive_key(kdf, kdfparams, self._password.encode())
+                    self._derived_keys[cache_key] = derived_key
+        return derived_key
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,39 +162,51 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
+def _has_default_kdfparams(crypto: Dict[str, Any]) -> bool:
+    kdfparams = crypto.get("kdfparams", {})
+    return (crypto.get("kdf") == "pbkdf2"
+            and "salt" in kdfparams
+            and kdfparams == _pbkdf2_kdfparams(decode_hex(kdfparams["salt"]), get_default_work_factor_for_kdf("pbkdf2")))
+
+
+def _pbkdf2_kdfparams(salt: bytes, work_factor: int) -> Dict[str, Any]:
+    return {
+        'c': work_factor,
+        'dklen': DKLEN,
+        'prf': 'hmac-sha256',
+        'salt': encode_hex_no_prefix(salt),
+    }
+
+
+def _derive_key(kdf: str, kdfparams: Dict[str, Any], password: bytes) -> bytes:
+    if kdf == 'pbkdf2':
+        derived_key = _derive_pbkdf_key({'kdfparams': kdfparams}, password)
+    elif kdf == 'scrypt':
+        derived_key = _derive_scrypt_key({'kdfparams': kdfparams}, password)
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
+    return derived_key
+
+
+def _create_v3_keyfile_json(message_to_encrypt,
+                            password,
+                            kdf="pbkdf2",
+                            work_factor=None,
+                            salt: Optional[bytes] = None,
+                            derived_keys_cache: Optional[ETHKeyFileSecretManger] = None):
     """
     Encrypt message by a given password.
     Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    A salt and a secrets manager caching the derived keys can be provided to reuse the key derivation.
     """
-    salt = Random.get_random_bytes(16)
+    salt = salt or Random.get_random_bytes(16)
 
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
-        kdfparams = {
-            'c': work_factor,
-            'dklen': DKLEN,
-            'prf': 'hmac-sha256',
-            'salt': encode_hex_no_prefix(salt),
-        }
+        kdfparams = _pbkdf2_kdfparams(salt, work_factor)
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -123,6 +217,11 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
     else:
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
 
+    if derived_keys_cache is not None:
+        derived_key = derived_keys_cache.derived_key(kdf, kdfparams)
+    else:
+        derived_key = _derive_key(kdf, kdfparams, password)
+
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
     ciphertext = encrypt_aes_ctr(message_to_encrypt, encrypt_key, iv)
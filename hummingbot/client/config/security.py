@@ -1,6 +1,7 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -10,6 +11,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -48,13 +50,39 @@ class Security:
 
     @classmethod
     def decrypt_all(cls):
+        """
+        Decrypts the connector configs. The first file is decrypted on its own to derive (and cache) the key shared
+        by the values encrypted with the shared salt, the remaining files are decrypted in a thread pool (the key
+        derivation functions release the GIL). The configs with values using other salts are then saved again.
+        """
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        if len(encrypted_files) > 0:
+            cls.decrypt_connector_config(encrypted_files[0])
+        if len(encrypted_files) > 1:
+            with ThreadPoolExecutor(thread_name_prefix="decrypt_connector_config") as executor:
+                configs = list(executor.map(load_connector_config_map_from_file, encrypted_files[1:]))
+            for file_path, config_map in zip(encrypted_files[1:], configs):
+                cls._secure_configs[connector_name_from_file(file_path)] = config_map
+        cls.reencrypt_connector_configs(encrypted_files)
         cls._decryption_done.set()
 
+    @classmethod
+    def reencrypt_connector_configs(cls, file_paths: List[Path]):
+        """
+        Saves again the connector configs having values the secrets manager would encrypt differently (e.g. values
+        encrypted with their own salt), so they benefit from the shared key derivation in the next sessions.
+        """
+        for file_path in file_paths:
+            config_map = cls._secure_configs[connector_name_from_file(file_path)]
+            if any(config_map.is_secure(attr)
+                   and isinstance(value, str)
+                   and cls.secrets_manager.needs_reencryption(value)
+                   for attr, value in read_yml_file(file_path).items()
+                   if attr in config_map.keys()):
+                save_to_yml(file_path, config_map)
+
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
@@ -31,6 +31,9 @@ from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.status_monitor import StatusMonitor as GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.loop_monitor import LoopMonitor
+from hummingbot.core.utils.metrics_exporter import MetricsExporter
+from hummingbot.core.utils.metrics_registry import MetricSample, MetricsRegistry
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
@@ -49,6 +52,7 @@ class HummingbotApplication(*commands):
     KILL_TIMEOUT = 10.0
     APP_WARNING_EXPIRY_DURATION = 3600.0
     APP_WARNING_STATUS_LIMIT = 6
+    PERF_STATUS_ROWS_LIMIT = 15
 
     _main_app: Optional["HummingbotApplication"] = None
 
@@ -102,6 +106,7 @@ class HummingbotApplication(*commands):
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
+        self._metrics_exporter: Optional[MetricsExporter] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -254,8 +259,27 @@ class HummingbotApplication(*commands):
         return success
 
     async def run(self):
+        LoopMonitor.get_instance().start()
+        await self.start_metrics_exporter()
         await self.app.run()
 
+    async def start_metrics_exporter(self):
+        port = self.client_config_map.metrics_exporter_port
+        if not port or self._metrics_exporter is not None:
+            return
+        registry = MetricsRegistry.get_instance()
+        registry.register_collector(LoopMonitor.get_instance().metrics)
+        registry.register_collector(self._clock_metrics)
+        exporter = MetricsExporter(port, registry)
+        try:
+            await exporter.start()
+            self._metrics_exporter = exporter
+        except Exception:
+            self.logger().error(f"Error starting the metrics exporter on port {port}.", exc_info=True)
+
+    def _clock_metrics(self) -> List[MetricSample]:
+        return self.clock.profiler.metrics() if self.clock is not None else []
+
     def add_application_warning(self, app_warning: ApplicationWarning):
         self._expire_old_application_warnings()
         self._app_warnings.append(app_warning)
@@ -3,8 +3,8 @@ import json
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
-from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from os.path import exists, getmtime, join, realpath
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
@@ -34,6 +34,9 @@ CLIENT_CONFIG_PATH = CONF_DIR_PATH / "conf_client.yml"
 TRADE_FEES_CONFIG_PATH = CONF_DIR_PATH / "conf_fee_overrides.yml"
 STRATEGIES_CONF_DIR_PATH = CONF_DIR_PATH / "strategies"
 CONNECTORS_CONF_DIR_PATH = CONF_DIR_PATH / "connectors"
+CONNECTOR_SETTINGS_MANIFEST_PATH = CONF_DIR_PATH / "connector_settings_manifest.json"
+CONNECTOR_SETTINGS_MANIFEST_VERSION = 1
+TRADING_PAIRS_CACHE_PATH = CONF_DIR_PATH / "trading_pairs_cache.json"
 CONF_PREFIX = "conf_"
 CONF_POSTFIX = "_strategy"
 PMM_SCRIPTS_PATH = root_path() / "pmm_scripts"
@@ -233,16 +236,19 @@ class ConnectorSetting(NamedTuple):
 
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
+        config_keys = self.config_keys
+        if config_keys is None and self.name in AllConnectorSettings._pending_config_keys:
+            config_keys = AllConnectorSettings.get_connector_config_keys(self.name)
         kwargs = {}
-        if isinstance(self.config_keys, Dict):
-            kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
-        elif self.config_keys is not None:
+        if isinstance(config_keys, Dict):
+            kwargs = {key: (config.value or "") for key, config in config_keys.items()}  # legacy
+        elif config_keys is not None:
             kwargs = {
                 traverse_item.attr: traverse_item.value.get_secret_value()
                 if isinstance(traverse_item.value, SecretStr)
                 else traverse_item.value or ""
                 for traverse_item
-                in ClientConfigAdapter(self.config_keys).traverse()
+                in ClientConfigAdapter(config_keys).traverse()
                 if traverse_item.attr != "connector"
             }
         kwargs = self.conn_init_parameters(kwargs)
@@ -256,14 +262,23 @@ class ConnectorSetting(NamedTuple):
 
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
+    # Connectors created from the settings manifest, whose config keys are loaded from their utils module on demand
+    # (connector name -> (utils module path, domain))
+    _pending_config_keys: Dict[str, Tuple[str, Optional[str]]] = {}
 
     @classmethod
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The settings exported by the connectors utils modules are cached in the settings manifest (keyed on the
+        modification time of the connector files), so that the utils modules are only imported for the connectors
+        that changed since the manifest was generated, or when the config keys of a connector are required.
         """
         cls.all_connector_settings = {}  # reset
+        cls._pending_config_keys = {}
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        manifest: Dict[str, Dict[str, Any]] = cls._load_connector_settings_manifest()
+        updated_manifest: Dict[str, Dict[str, Any]] = {}
 
         type_dirs: List[DirEntry] = [
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
@@ -279,48 +294,29 @@ class AllConnectorSettings:
                     continue
                 if connector_dir.name in cls.all_connector_settings:
                     raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
+                util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                                        f"{connector_dir.name}.{connector_dir.name}_utils"
+                if not exists(join(connector_dir.path, f"{connector_dir.name}_utils.py")):
                     continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                files_mtime = cls._connector_files_mtime(connector_dir)
+                manifest_entry = manifest.get(connector_dir.name)
+                if (manifest_entry is None
+                        or manifest_entry["mtime"] != files_mtime
+                        or manifest_entry["type"] != type_dir.name):
+                    try:
+                        util_module = importlib.import_module(util_module_path)
+                    except ModuleNotFoundError:
+                        continue
+                    manifest_entry = cls._connector_settings_manifest_entry(
+                        connector_dir.name, type_dir.name, files_mtime, util_module
                     )
+                    cls._add_connector_settings(connector_dir.name, manifest_entry, util_module_path, util_module)
+                else:
+                    cls._add_connector_settings(connector_dir.name, manifest_entry, util_module_path)
+                updated_manifest[connector_dir.name] = manifest_entry
+
+        if updated_manifest != manifest:
+            cls._save_connector_settings_manifest(updated_manifest)
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -345,6 +341,112 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def _add_connector_settings(cls,
+                                name: str,
+                                manifest_entry: Dict[str, Any],
+                                util_module_path: str,
+                                util_module: Optional[Any] = None):
+        """
+        Registers the settings of a connector (and its other domains) described by its manifest entry.
+        Without the utils module the config keys are left to be loaded on demand.
+        """
+        cls.all_connector_settings[name] = ConnectorSetting(
+            name=name,
+            type=ConnectorType[manifest_entry["type"].capitalize()],
+            centralised=manifest_entry["centralised"],
+            example_pair=manifest_entry["example_pair"],
+            use_ethereum_wallet=manifest_entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(manifest_entry["trade_fee_schema"]),
+            config_keys=None if util_module is None else getattr(util_module, "KEYS", None),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=manifest_entry["use_eth_gas_lookup"],
+        )
+        if util_module is None:
+            cls._pending_config_keys[name] = (util_module_path, None)
+        # Adds other domains of connector
+        for domain, domain_entry in manifest_entry["other_domains"].items():
+            parent = cls.all_connector_settings[name]
+            cls.all_connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=domain_entry["example_pair"],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                trade_fee_schema=TradeFeeSchema.from_json(domain_entry["trade_fee_schema"]),
+                config_keys=None if util_module is None else getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=domain_entry["domain_parameter"],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup,
+            )
+            if util_module is None:
+                cls._pending_config_keys[domain] = (util_module_path, domain)
+
+    @classmethod
+    def _connector_settings_manifest_entry(cls,
+                                           name: str,
+                                           type_name: str,
+                                           files_mtime: float,
+                                           util_module: Any) -> Dict[str, Any]:
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(name, trade_fee_settings)
+        other_domains: Dict[str, Dict[str, Any]] = {}
+        for domain in getattr(util_module, "OTHER_DOMAINS", []):
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            other_domains[domain] = {
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "trade_fee_schema": cls._validate_trade_fee_schema(domain, trade_fee_settings).to_json(),
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+            }
+        return {
+            "type": type_name,
+            "mtime": files_mtime,
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            "trade_fee_schema": trade_fee_schema.to_json(),
+            "other_domains": other_domains,
+        }
+
+    @staticmethod
+    def _connector_files_mtime(connector_dir: DirEntry) -> float:
+        return max(getmtime(f.path) for f in scandir(connector_dir.path) if f.name.endswith((".py", ".pyx", ".pxd")))
+
+    @staticmethod
+    def _load_connector_settings_manifest() -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(CONNECTOR_SETTINGS_MANIFEST_PATH) as fd:
+                manifest = json.load(fd)
+            if manifest.get("version") == CONNECTOR_SETTINGS_MANIFEST_VERSION:
+                return manifest["connectors"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    @staticmethod
+    def _save_connector_settings_manifest(connectors_manifest: Dict[str, Dict[str, Any]]):
+        try:
+            with open(CONNECTOR_SETTINGS_MANIFEST_PATH, "w") as fd:
+                json.dump({"version": CONNECTOR_SETTINGS_MANIFEST_VERSION, "connectors": connectors_manifest}, fd)
+        except OSError:
+            # The manifest is only a cache, the settings are generated again in the next start
+            pass
+
+    @classmethod
+    def _load_pending_config_keys(cls, connector: str):
+        if connector not in cls._pending_config_keys:
+            return
+        util_module_path, domain = cls._pending_config_keys.pop(connector)
+        util_module = importlib.import_module(util_module_path)
+        config_keys = (getattr(util_module, "KEYS", None)
+                       if domain is None
+                       else getattr(util_module, "OTHER_DOMAINS_KEYS")[domain])
+        cls.all_connector_settings[connector] = cls.all_connector_settings[connector]._replace(config_keys=config_keys)
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
@@ -364,6 +466,8 @@ class AllConnectorSettings:
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
+                if e in cls._pending_config_keys:
+                    cls._pending_config_keys[f"{e}_paper_trade"] = cls._pending_config_keys[e]
 
     @classmethod
     def get_all_connectors(cls) -> List[str]:
@@ -390,12 +494,13 @@ class AllConnectorSettings:
 
     @classmethod
     def get_connector_config_keys(cls, connector: str) -> Optional["BaseConnectorConfigMap"]:
-        return cls.get_connector_settings()[connector].config_keys
+        connector_settings = cls.get_connector_settings()
+        cls._load_pending_config_keys(connector)
+        return connector_settings[connector].config_keys
 
     @classmethod
     def reset_connector_config_keys(cls, connector: str):
-        current_settings = cls.get_connector_settings()[connector]
-        current_keys = current_settings.config_keys
+        current_keys = cls.get_connector_config_keys(connector)
         new_keys = (
             current_keys if current_keys is None else current_keys.__class__.construct()
         )
@@ -404,6 +509,7 @@ class AllConnectorSettings:
     @classmethod
     def update_connector_config_keys(cls, new_config_keys: "BaseConnectorConfigMap"):
         current_settings = cls.get_connector_settings()[new_config_keys.connector]
+        cls._pending_config_keys.pop(new_config_keys.connector, None)
         new_keys_settings_dict = current_settings._asdict()
         new_keys_settings_dict.update({"config_keys": new_config_keys})
         cls.get_connector_settings()[new_config_keys.connector] = ConnectorSetting(
@@ -80,6 +80,8 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
 
     status_parser = subparsers.add_parser("status", help="Get the market status of the current bot")
     status_parser.add_argument("--live", default=False, action="store_true", dest="live", help="Show status updates")
+    status_parser.add_argument("--perf", default=False, action="store_true", dest="perf",
+                               help="Show the event loop and clock performance statistics")
     status_parser.set_defaults(func=hummingbot.status)
 
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
@@ -140,6 +142,13 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    tick_stats_parser = subparsers.add_parser("tick_stats", help="Show the timing statistics of the clock ticks")
+    tick_stats_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                                   help="Reset the statistics")
+    tick_stats_parser.add_argument("--profile-threshold", type=float, default=None, dest="profile_threshold",
+                                   help="Profile the tick following a tick slower than this many seconds (0 disables)")
+    tick_stats_parser.set_defaults(func=hummingbot.tick_stats)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -1,8 +1,9 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 from cachetools import TTLCache
 
@@ -21,9 +22,24 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+from hummingbot.core.utils.order_tracing import ORDER_STAGES, OrderStage, strategy_tick_start
 from hummingbot.logger.logger import HummingbotLogger
 
 cot_logger = None
+ORDER_CREATION_METRIC = MetricsRegistry.get_instance().histogram(
+    "order_creation_seconds",
+    "Time between the submission of a new order and its acknowledgement by the exchange.",
+    ("connector", "trade_type"),
+)
+ORDER_STAGE_METRIC = MetricsRegistry.get_instance().histogram(
+    "order_stage_seconds",
+    "Time taken by each stage of the order creation, measured from the previous stage recorded for the order.",
+    ("connector", "stage"),
+)
+# The stages aggregated when an order is acknowledged by the exchange
+ACKNOWLEDGED_ORDER_STAGES: List[OrderStage] = list(ORDER_STAGES[:ORDER_STAGES.index(OrderStage.EXCHANGE_ACK) + 1])
 
 
 class ClientOrderTracker:
@@ -53,6 +69,13 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        # Secondary index of the active and cached orders by exchange order id. Orders that did not have an exchange
+        # order id when they were last seen by the tracker are kept aside until their id gets assigned.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_pending_exchange_order_id: Set[str] = set()
+        # Stages recorded for the orders submitted but not tracked yet
+        self._submitted_order_stages: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        self._stage_latencies: Dict[OrderStage, LatencyHistogram] = {}
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -77,7 +100,9 @@ class ClientOrderTracker:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        orders = dict(self._in_flight_orders)
+        orders.update(self._cached_orders.items())
+        return orders
 
     @property
     def current_timestamp(self) -> int:
@@ -86,8 +111,34 @@ class ClientOrderTracker:
         """
         return self._connector.current_timestamp
 
+    @property
+    def order_stage_latencies(self) -> Dict[OrderStage, LatencyHistogram]:
+        """
+        Returns the distribution of the time taken by each stage of the creation of the orders of the connector.
+        """
+        return self._stage_latencies.copy()
+
+    def register_order_submission(self, client_order_id: str):
+        """
+        Records the submission of an order by the connector (buy/sell call), and the start of the strategy tick that
+        decided it. The stages are moved to the order once it is tracked.
+        """
+        stages = {}
+        decision_timestamp = strategy_tick_start()
+        if decision_timestamp is not None:
+            stages[OrderStage.DECISION] = decision_timestamp
+        stages[OrderStage.SUBMITTED] = time.perf_counter()
+        self._submitted_order_stages[client_order_id] = stages
+
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
+        submitted_stages = self._submitted_order_stages.pop(order.client_order_id, None)
+        if submitted_stages is not None:
+            for stage, timestamp in submitted_stages.items():
+                order.record_stage(stage, timestamp)
+        elif order.is_pending_create:
+            order.record_stage(OrderStage.SUBMITTED)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -115,15 +166,90 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id)
 
         return found_order
 
+    def update_exchange_order_id(self, order: InFlightOrder, exchange_order_id: str):
+        """
+        Assigns the exchange order id to a tracked order and indexes the order by it.
+        """
+        order.update_exchange_order_id(exchange_order_id)
+        self._index_order(order)
+
+    def _is_tracked(self, order: InFlightOrder) -> bool:
+        client_order_id = order.client_order_id
+        return (self._in_flight_orders.get(client_order_id) is order
+                or self._cached_orders.get(client_order_id) is order)
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_pending_exchange_order_id.add(order.client_order_id)
+            if len(self._orders_pending_exchange_order_id) > 2 * (len(self._in_flight_orders) + self.MAX_CACHE_SIZE):
+                self._evict_untracked_orders_from_index()
+        else:
+            self._orders_pending_exchange_order_id.discard(order.client_order_id)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            if len(self._orders_by_exchange_order_id) > 2 * (len(self._in_flight_orders) + self.MAX_CACHE_SIZE):
+                self._evict_untracked_orders_from_index()
+
+    def _evict_untracked_orders_from_index(self):
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order
+            for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if self._is_tracked(order)
+        }
+        self._orders_pending_exchange_order_id = {
+            client_order_id
+            for client_order_id in self._orders_pending_exchange_order_id
+            if client_order_id in self._in_flight_orders or client_order_id in self._cached_orders
+        }
+
+    def _fetch_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        found_order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if found_order is not None:
+            if found_order.exchange_order_id == exchange_order_id and self._is_tracked(found_order):
+                return found_order
+            # The order expired from the cache or its exchange order id changed
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            found_order = None
+
+        # Connectors can assign the exchange order id directly on the order, index those orders lazily
+        for client_order_id in list(self._orders_pending_exchange_order_id):
+            order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+            if order is None:
+                self._orders_pending_exchange_order_id.discard(client_order_id)
+            elif order.exchange_order_id is not None:
+                self._index_order(order)
+                if order.exchange_order_id == exchange_order_id:
+                    found_order = order
+
+        return found_order
+
+    def _record_order_stage(self, order: InFlightOrder, stage: OrderStage):
+        if not order.record_stage(stage):
+            return
+        if stage is OrderStage.EXCHANGE_ACK:
+            submitted_timestamp = order.stage_timestamps.get(OrderStage.SUBMITTED)
+            if submitted_timestamp is not None:
+                ORDER_CREATION_METRIC.labels(self._connector.name, order.trade_type.name).add(
+                    order.stage_timestamps[stage] - submitted_timestamp
+                )
+            stages = ACKNOWLEDGED_ORDER_STAGES
+        else:
+            stages = [stage]
+        for aggregated_stage in stages:
+            latency = order.stage_latency(aggregated_stage)
+            if latency is not None:
+                histogram = self._stage_latencies.get(aggregated_stage)
+                if histogram is None:
+                    histogram = ORDER_STAGE_METRIC.labels(self._connector.name, aggregated_stage.value)
+                    self._stage_latencies[aggregated_stage] = histogram
+                histogram.add(latency)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -275,7 +401,13 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            if tracked_order.client_order_id in self._orders_pending_exchange_order_id:
+                self._index_order(tracked_order)
             if updated:
+                if (previous_state == OrderState.PENDING_CREATE
+                        and not tracked_order.is_pending_create
+                        and not tracked_order.is_failure):
+                    self._record_order_stage(tracked_order, OrderStage.EXCHANGE_ACK)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
 
@@ -295,6 +427,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._record_order_stage(tracked_order, OrderStage.FIRST_FILL)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -10,6 +10,7 @@ from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -277,6 +278,35 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def batch_order_create(self, orders_to_create: List[LimitOrder], order_type: OrderType = OrderType.LIMIT,
+                           **kwargs) -> List[LimitOrder]:
+        """
+        Creates several limit orders at once. This default implementation places the orders one by one, connectors
+        supporting batch order endpoints override it.
+        :param orders_to_create: The orders to create (their client order ids are ignored)
+        :param order_type: The order type used for all the orders (LIMIT or LIMIT_MAKER)
+        :returns The orders to create, with the client order ids assigned by the connector
+        """
+        cdef:
+            list created_orders = []
+            str order_id
+        for order in orders_to_create:
+            if order.is_buy:
+                order_id = self.c_buy(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            else:
+                order_id = self.c_sell(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            created_orders.append(order.copy_with_id(order_id))
+        return created_orders
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels several orders at once. This default implementation cancels the orders one by one, connectors
+        supporting batch cancel endpoints override it.
+        :param orders_to_cancel: The orders to cancel
+        """
+        for order in orders_to_cancel:
+            self.c_cancel(order.trading_pair, order.client_order_id)
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
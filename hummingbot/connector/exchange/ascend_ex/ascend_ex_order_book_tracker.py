@@ -1,17 +1,11 @@
 #!/usr/bin/env python
 import asyncio
-import bisect
 import logging
-import time
-from collections import defaultdict, deque
-from typing import Deque, Dict, List, Optional
+from typing import List, Optional
 
 import hummingbot.connector.exchange.ascend_ex.ascend_ex_constants as constants
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_api_order_book_data_source import AscendExAPIOrderBookDataSource
-from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book import AscendExOrderBook
-from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book_message import AscendExOrderBookMessage
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -42,15 +36,6 @@ class AscendExOrderBookTracker(OrderBookTracker):
             trading_pairs,
         )
 
-        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
-        self._process_msg_deque_task: Optional[asyncio.Task] = None
-        self._past_diffs_windows: Dict[str, Deque] = {}
-        self._order_books: Dict[str, AscendExOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[AscendExOrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
-
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
 
     @property
@@ -81,59 +66,3 @@ class AscendExOrderBookTracker(OrderBookTracker):
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
         """
         await asyncio.sleep(delay)
-
-    async def _track_single_book(self, trading_pair: str):
-        """
-        Update an order book with changes from the latest batch of received messages
-        """
-        past_diffs_window: Deque[AscendExOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: AscendExOrderBook = self._order_books[trading_pair]
-
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: AscendExOrderBookMessage = None
-                saved_messages: Deque[AscendExOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    # bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs = list(past_diffs_window)
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
-                    for diff in replay_diffs:
-                        order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
-
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error processing order book messages for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg="Unexpected error processing order book messages. Retrying after 5 seconds.",
-                )
-                await self._sleep(5.0)
@@ -20,6 +20,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    SEQUENTIAL_DIFF_UPDATE_IDS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -342,10 +342,6 @@ class BinanceExchange(ExchangePyBase):
                 or (self.in_flight_orders and small_interval_current_tick > small_interval_last_tick)):
             query_time = int(self._last_trades_poll_binance_timestamp * 1e3)
             self._last_trades_poll_binance_timestamp = self._time_synchronizer.time()
-            order_by_exchange_id_map = {}
-            for order in self._order_tracker.all_orders.values():
-                order_by_exchange_id_map[order.exchange_order_id] = order
-
             tasks = []
             trading_pairs = self.trading_pairs
             for trading_pair in trading_pairs:
@@ -372,9 +368,9 @@ class BinanceExchange(ExchangePyBase):
                     continue
                 for trade in trades:
                     exchange_order_id = str(trade["orderId"])
-                    if exchange_order_id in order_by_exchange_id_map:
+                    tracked_order = self._order_tracker.fetch_order(exchange_order_id=exchange_order_id)
+                    if tracked_order is not None:
                         # This is a fill for a tracked order
-                        tracked_order = order_by_exchange_id_map[exchange_order_id]
                         fee = TradeFeeBase.new_spot_fee(
                             fee_schema=self.trade_fee_schema(),
                             trade_type=tracked_order.trade_type,
@@ -430,6 +426,8 @@ class BinanceExchange(ExchangePyBase):
 
         tracked_orders: List[InFlightOrder] = list(self.in_flight_orders.values())
         if current_tick > last_tick and len(tracked_orders) > 0:
+            # Open orders are reconciled in bulk, only the orders missing from the open orders list are queried
+            tracked_orders = await self._reconcile_orders_with_bulk_status(tracked_orders)
 
             tasks = [self._api_get(
                 path_url=CONSTANTS.ORDER_PATH_URL,
@@ -468,6 +466,30 @@ class BinanceExchange(ExchangePyBase):
                     )
                     self._order_tracker.process_order_update(update)
 
+    @property
+    def _order_status_limit_id(self) -> Optional[str]:
+        return CONSTANTS.ORDER_PATH_URL
+
+    @property
+    def _bulk_order_status_limit_id(self) -> Optional[str]:
+        return CONSTANTS.OPEN_ORDERS_PATH_URL
+
+    async def _request_bulk_order_updates(self, trading_pair: str, orders: List[InFlightOrder]) -> List[OrderUpdate]:
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+            is_auth_required=True)
+        return [
+            OrderUpdate(
+                client_order_id=open_order["clientOrderId"],
+                exchange_order_id=str(open_order["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=open_order["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[open_order["status"]],
+            )
+            for open_order in open_orders
+        ]
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
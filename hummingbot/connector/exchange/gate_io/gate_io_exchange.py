@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -12,8 +12,10 @@ from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -81,6 +83,10 @@ class GateIoExchange(ExchangePyBase):
     def client_order_id_prefix(self):
         return CONSTANTS.HBOT_ORDER_ID
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_CREATE
+
     @property
     def trading_rules_request_path(self):
         return CONSTANTS.SYMBOL_PATH_URL
@@ -201,6 +207,37 @@ class GateIoExchange(ExchangePyBase):
         exchange_order_id = str(order_result["id"])
         return exchange_order_id, self.current_timestamp
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            {
+                "text": order.client_order_id,
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "side": order.trade_type.name.lower(),
+                "type": order.order_type.name.lower().split("_")[0],
+                "price": f"{order.price:f}",
+                "amount": f"{order.amount:f}",
+            }
+            for order in orders
+        ]
+        batch_result = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+        )
+        order_results = {order_result["text"]: order_result for order_result in batch_result}
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError({"label": "ORDER_REJECTED", "message": "Order missing in the batch response."}))
+            elif not order_result.get("succeeded", False) or order_result.get("status") in {"cancelled"}:
+                results.append(IOError({"label": order_result.get("label", "ORDER_REJECTED"),
+                                        "message": order_result.get("message", "Order rejected.")}))
+            else:
+                results.append((str(order_result["id"]), self.current_timestamp))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation-specific method is called by _cancel
@@ -220,6 +257,58 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Cancels the orders using the batch cancel endpoint (up to MAX_ORDERS_PER_BATCH_DELETE orders per request).
+        Orders without an exchange order id yet are cancelled one by one, waiting for the id.
+        """
+        tracked_orders = [self._order_tracker.fetch_tracked_order(order.client_order_id) for order in orders_to_cancel]
+        tracked_orders = [order for order in tracked_orders if order is not None]
+        orders_with_id = [order for order in tracked_orders if order.exchange_order_id is not None]
+        orders_without_id = [order for order in tracked_orders if order.exchange_order_id is None]
+        batches = [orders_with_id[index:index + CONSTANTS.MAX_ORDERS_PER_BATCH_DELETE]
+                   for index in range(0, len(orders_with_id), CONSTANTS.MAX_ORDERS_PER_BATCH_DELETE)]
+        results = await safe_gather(
+            *[self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL,
+                data=[{"currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                       "id": order.exchange_order_id}
+                      for order in batch],
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL)
+              for batch in batches],
+            *[self._execute_cancel(trading_pair=order.trading_pair, order_id=order.client_order_id)
+              for order in orders_without_id],
+            return_exceptions=True)
+
+        canceled_order_ids = set()
+        for batch, cancel_result in zip(batches, results):
+            if isinstance(cancel_result, Exception):
+                self.logger().error(
+                    f"Failed to cancel orders {[order.client_order_id for order in batch]} ({cancel_result})")
+                continue
+            orders_by_exchange_id = {order.exchange_order_id: order for order in batch}
+            for order_result in cancel_result:
+                order = orders_by_exchange_id.get(str(order_result["id"]))
+                if order is None:
+                    continue
+                if order_result.get("succeeded", False):
+                    canceled_order_ids.add(order.client_order_id)
+                    self._order_tracker.process_order_update(OrderUpdate(
+                        client_order_id=order.client_order_id,
+                        trading_pair=order.trading_pair,
+                        update_timestamp=self.current_timestamp,
+                        new_state=OrderState.CANCELED,
+                    ))
+                else:
+                    self.logger().error(f"Failed to cancel order {order.client_order_id} ({order_result.get('message')})")
+        for order, cancel_result in zip(orders_without_id, results[len(batches):]):
+            if cancel_result == order.client_order_id:
+                canceled_order_ids.add(order.client_order_id)
+
+        return [CancellationResult(order.client_order_id, order.client_order_id in canceled_order_ids)
+                for order in orders_to_cancel]
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
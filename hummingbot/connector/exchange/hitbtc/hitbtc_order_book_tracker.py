@@ -1,19 +1,16 @@
 #!/usr/bin/env python
 import asyncio
-import bisect
 import logging
-from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
-import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
-from collections import defaultdict, deque
-from typing import Optional, Dict, List, Deque
-from hummingbot.core.data_type.order_book_message import OrderBookMessageType
-from hummingbot.logger import HummingbotLogger
-from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
-from hummingbot.connector.exchange.hitbtc.hitbtc_order_book_message import HitbtcOrderBookMessage
+from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
 from hummingbot.connector.exchange.hitbtc.hitbtc_active_order_tracker import HitbtcActiveOrderTracker
 from hummingbot.connector.exchange.hitbtc.hitbtc_api_order_book_data_source import HitbtcAPIOrderBookDataSource
-from hummingbot.connector.exchange.hitbtc.hitbtc_order_book import HitbtcOrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.logger import HummingbotLogger
 
 
 class HitbtcOrderBookTracker(OrderBookTracker):
@@ -28,15 +25,6 @@ class HitbtcOrderBookTracker(OrderBookTracker):
     def __init__(self, trading_pairs: Optional[List[str]] = None,):
         super().__init__(HitbtcAPIOrderBookDataSource(trading_pairs), trading_pairs)
 
-        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
-        self._process_msg_deque_task: Optional[asyncio.Task] = None
-        self._past_diffs_windows: Dict[str, Deque] = {}
-        self._order_books: Dict[str, HitbtcOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[HitbtcOrderBookMessage]] = \
-            defaultdict(lambda: deque(maxlen=1000))
         self._active_order_trackers: Dict[str, HitbtcActiveOrderTracker] = defaultdict(HitbtcActiveOrderTracker)
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
         self._order_book_trade_listener_task: Optional[asyncio.Task] = None
@@ -48,62 +36,10 @@ class HitbtcOrderBookTracker(OrderBookTracker):
         """
         return Constants.EXCHANGE_NAME
 
-    async def _track_single_book(self, trading_pair: str):
-        """
-        Update an order book with changes from the latest batch of received messages
-        """
-        past_diffs_window: Deque[HitbtcOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: HitbtcOrderBook = self._order_books[trading_pair]
-        active_order_tracker: HitbtcActiveOrderTracker = self._active_order_trackers[trading_pair]
-
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: HitbtcOrderBookMessage = None
-                saved_messages: Deque[HitbtcOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[HitbtcOrderBookMessage] = list(past_diffs_window)
-                    # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-                    for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+    def _diff_message_rows(self, trading_pair: str,
+                           message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(message)
 
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error processing order book messages for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg="Unexpected error processing order book messages. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+    def _snapshot_message_rows(self, trading_pair: str,
+                               message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        return self._active_order_trackers[trading_pair].convert_snapshot_message_to_order_book_row(message)
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SEQUENTIAL_DIFF_UPDATE_IDS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -21,6 +21,8 @@ ACCOUNTS_PATH_URL = "/api/v1/accounts"
 SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v1/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
+BATCH_ORDERS_PATH_URL = "/api/v1/orders/multi"
+MAX_ORDERS_PER_BATCH = 5
 FEE_PATH_URL = "/api/v1/trade-fees"
 
 WS_CONNECTION_LIMIT_ID = "WSConnection"
@@ -29,6 +31,7 @@ WS_CONNECTION_TIME_INTERVAL = 60
 WS_REQUEST_LIMIT_ID = "WSRequest"
 GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
+POST_BATCH_ORDER_LIMIT_ID = "PostBatchOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
 WS_PING_HEARTBEAT = 10
 
@@ -51,5 +54,6 @@ RATE_LIMITS = [
     RateLimit(limit_id=GET_ORDER_LIMIT_ID, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=FEE_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
+    RateLimit(limit_id=POST_BATCH_ORDER_LIMIT_ID, limit=3, time_interval=3),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
 ]
@@ -1,6 +1,7 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -78,6 +79,10 @@ class KucoinExchange(ExchangePyBase):
     def client_order_id_prefix(self):
         return ""
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
     @property
     def trading_rules_request_path(self):
         return CONSTANTS.SYMBOLS_PATH_URL
@@ -194,6 +199,50 @@ class KucoinExchange(ExchangePyBase):
         )
         return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
 
+    def _split_batch_order_create(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        # The batch endpoint only accepts orders of a single symbol
+        orders_by_pair = defaultdict(list)
+        for order in orders:
+            orders_by_pair[order.trading_pair].append(order)
+        batches = []
+        for pair_orders in orders_by_pair.values():
+            batches.extend(super()._split_batch_order_create(pair_orders))
+        return batches
+
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        order_list = []
+        for order in orders:
+            order_data = {
+                "clientOid": order.client_order_id,
+                "side": order.trade_type.name.lower(),
+                "type": "limit",
+                "price": str(order.price),
+                "size": str(order.amount),
+            }
+            if order.order_type is OrderType.LIMIT_MAKER:
+                order_data["postOnly"] = True
+            order_list.append(order_data)
+        data = {
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair),
+            "orderList": order_list,
+        }
+        batch_result = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_BATCH_ORDER_LIMIT_ID,
+        )
+        order_results = {order_result["clientOid"]: order_result for order_result in batch_result["data"]["data"]}
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            if order_result is None or order_result.get("status") != "success":
+                message = "missing in the batch response" if order_result is None else order_result.get("failMsg")
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {message}"))
+            else:
+                results.append((str(order_result["id"]), self.current_timestamp))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
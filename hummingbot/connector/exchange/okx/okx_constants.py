@@ -22,9 +22,11 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_PLACE_ORDER_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
+OKX_MAX_ORDERS_PER_BATCH = 20
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
 
@@ -66,6 +68,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_PLACE_ORDER_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
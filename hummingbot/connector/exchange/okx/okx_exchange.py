@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -12,8 +12,10 @@ from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -73,6 +75,10 @@ class OkxExchange(ExchangePyBase):
     def client_order_id_prefix(self):
         return CONSTANTS.CLIENT_ID_PREFIX
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.OKX_MAX_ORDERS_PER_BATCH
+
     @property
     def trading_rules_request_path(self):
         return CONSTANTS.OKX_INSTRUMENTS_PATH
@@ -187,6 +193,39 @@ class OkxExchange(ExchangePyBase):
             raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
         return str(data["ordId"]), self.current_timestamp
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": "limit",
+                "side": order.trade_type.name.lower(),
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "sz": str(order.amount),
+                "px": str(order.price)
+            }
+            for order in orders
+        ]
+
+        batch_result = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
+        )
+        order_results = {order_result["clOrdId"]: order_result for order_result in batch_result["data"]}
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {batch_result['msg']}"))
+            elif order_result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_result['sMsg']}"))
+            else:
+                results.append((str(order_result["ordId"]), self.current_timestamp))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
@@ -210,6 +249,48 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Cancels the orders using the batch cancel endpoint (up to OKX_MAX_ORDERS_PER_BATCH orders per request)
+        """
+        tracked_orders = [self._order_tracker.fetch_tracked_order(order.client_order_id) for order in orders_to_cancel]
+        tracked_orders = [order for order in tracked_orders if order is not None]
+        batches = [tracked_orders[index:index + CONSTANTS.OKX_MAX_ORDERS_PER_BATCH]
+                   for index in range(0, len(tracked_orders), CONSTANTS.OKX_MAX_ORDERS_PER_BATCH)]
+        results = await safe_gather(
+            *[self._api_post(
+                path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+                data=[{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in batch],
+                is_auth_required=True)
+              for batch in batches],
+            return_exceptions=True)
+
+        canceled_order_ids = set()
+        for batch, cancel_result in zip(batches, results):
+            if isinstance(cancel_result, Exception):
+                self.logger().error(
+                    f"Failed to cancel orders {[order.client_order_id for order in batch]} ({cancel_result})")
+                continue
+            for order_result in cancel_result["data"]:
+                # 5140 means the order does not exist anymore
+                if order_result["sCode"] in ("0", "5140"):
+                    canceled_order_ids.add(order_result["clOrdId"])
+                else:
+                    self.logger().error(f"Failed to cancel order {order_result['clOrdId']} ({order_result['sMsg']})")
+
+        for order in tracked_orders:
+            if order.client_order_id in canceled_order_ids:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    update_timestamp=self.current_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                ))
+        return [CancellationResult(order.client_order_id, order.client_order_id in canceled_order_ids)
+                for order in orders_to_cancel]
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
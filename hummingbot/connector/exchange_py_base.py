@@ -3,7 +3,7 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -26,6 +26,8 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.order_tracing import OrderStage, traced_order
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -111,6 +113,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def client_order_id_prefix(self):
         raise NotImplementedError
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        The maximum number of orders accepted by the exchange batch order creation endpoint, 0 if there is none
+        """
+        return 0
+
     @property
     @abstractmethod
     def trading_rules_request_path(self):
@@ -149,6 +158,10 @@ class ExchangePyBase(ExchangeBase, ABC):
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._order_tracker.active_orders
 
+    @property
+    def order_stage_latencies(self) -> Dict[OrderStage, LatencyHistogram]:
+        return self._order_tracker.order_stage_latencies
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
@@ -299,6 +312,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        self._order_tracker.register_order_submission(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
@@ -328,6 +342,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        self._order_tracker.register_order_submission(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
@@ -374,6 +389,43 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, order_id))
         return order_id
 
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT,
+                           **kwargs) -> List[LimitOrder]:
+        """
+        Creates a promise to create several limit orders. All the orders are submitted by a single task, by default
+        concurrently with one request per order (see `_execute_batch_order_create`).
+
+        :param orders_to_create: the orders to create (their client order ids are ignored)
+        :param order_type: the type of order to create for all the orders (LIMIT, LIMIT_MAKER)
+        :param kwargs: additional order parameters (e.g. position_action), passed on to `_create_order`
+
+        :return: the orders to create, with the ids assigned by the connector (the client ids)
+        """
+        orders_with_ids = []
+        for order in orders_to_create:
+            order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            self._order_tracker.register_order_submission(order_id)
+            orders_with_ids.append(order.copy_with_id(order_id))
+        safe_ensure_future(self._execute_batch_order_create(
+            orders_to_create=orders_with_ids, order_type=order_type, **kwargs))
+        return orders_with_ids
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel several orders. All the cancellations are submitted by a single task, by default
+        concurrently with one request per order (see `_execute_batch_cancel`).
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -412,7 +464,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                             trading_pair: str,
                             amount: Decimal,
                             order_type: OrderType,
-                            price: Optional[Decimal] = None):
+                            price: Optional[Decimal] = None,
+                            **kwargs):
         """
         Creates a an order in the exchange using the parameters to configure it
 
@@ -424,6 +477,68 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the order price
         """
         exchange_order_id = ""
+        tracked_order = self._start_order_creation(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price)
+        if tracked_order is None:
+            return
+        amount = tracked_order.amount
+        price = tracked_order.price
+
+        try:
+            with traced_order(self._order_tracker.fetch_tracked_order(order_id)):
+                exchange_order_id, update_timestamp = await self._place_order(
+                    order_id=order_id,
+                    trading_pair=trading_pair,
+                    amount=amount,
+                    trade_type=trade_type,
+                    order_type=order_type,
+                    price=price)
+
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=trading_pair,
+                update_timestamp=update_timestamp,
+                new_state=OrderState.OPEN,
+            )
+            self._order_tracker.process_order_update(order_update)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
+                f"{amount} {trading_pair} {price}.",
+                exc_info=True,
+                app_warning_msg=f"Failed to submit buy order to {self.name_cap}. Check API key and network connection."
+            )
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        return order_id, exchange_order_id
+
+    def _start_order_creation(self,
+                              trade_type: TradeType,
+                              order_id: str,
+                              trading_pair: str,
+                              amount: Decimal,
+                              order_type: OrderType,
+                              price: Optional[Decimal] = None) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order amount and price, starts tracking the order and validates it against the trading rules
+
+        :param trade_type: the side of the order (BUY of SELL)
+        :param order_id: the id that should be assigned to the order (the client id)
+        :param trading_pair: the token pair to operate with
+        :param amount: the order amount
+        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
+        :param price: the order price
+
+        :return: the tracked order if it should be submitted to the exchange, None if it has been marked as failed
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -446,48 +561,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
                                   f" size {trading_rule.min_order_size}. The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
         if price is not None and amount * price < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. "
                                   "The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
 
-        try:
-            exchange_order_id, update_timestamp = await self._place_order(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price)
-
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order_id,
-                exchange_order_id=exchange_order_id,
-                trading_pair=trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=OrderState.OPEN,
-            )
-            self._order_tracker.process_order_update(order_update)
-
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            self.logger().network(
-                f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
-                f"{amount} {trading_pair} {price}.",
-                exc_info=True,
-                app_warning_msg=f"Failed to submit buy order to {self.name_cap}. Check API key and network connection."
-            )
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-        return order_id, exchange_order_id
+        return self._order_tracker.fetch_tracked_order(order_id)
 
     def _update_order_after_failure(self, order_id: str, trading_pair: str):
         order_update: OrderUpdate = OrderUpdate(
@@ -533,6 +621,98 @@ class ExchangePyBase(ExchangeBase, ABC):
                     f"Failed to cancel order {order_id}", exc_info=True)
         return None
 
+    async def _execute_batch_order_create(self, orders_to_create: List[LimitOrder], order_type: OrderType, **kwargs):
+        """
+        Creates the orders in the exchange. When the connector has a batch order creation endpoint
+        (`batch_order_create_max_size` > 0) the orders are placed with `_place_batch_orders`, otherwise each order is
+        created with its own request.
+
+        :param orders_to_create: the orders to create, with their client order ids
+        :param order_type: the type of order to create for all the orders (LIMIT, LIMIT_MAKER)
+        :param kwargs: additional order parameters, passed on to `_create_order`
+        """
+        if self.batch_order_create_max_size == 0:
+            await safe_gather(
+                *[self._create_order(
+                    trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.quantity,
+                    order_type=order_type,
+                    price=order.price,
+                    **kwargs)
+                  for order in orders_to_create],
+                return_exceptions=True)
+            return
+
+        tracked_orders = []
+        for order in orders_to_create:
+            tracked_order = self._start_order_creation(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order_type,
+                price=order.price)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+
+        await safe_gather(
+            *[self._create_orders_batch(orders_batch) for orders_batch in self._split_batch_order_create(tracked_orders)],
+            return_exceptions=True)
+
+    def _split_batch_order_create(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        """
+        Splits the orders to create in the batches to send to the exchange batch order creation endpoint.
+
+        :param orders: the tracked orders to create
+        """
+        max_size = self.batch_order_create_max_size
+        return [orders[i:i + max_size] for i in range(0, len(orders), max_size)]
+
+    async def _create_orders_batch(self, orders: List[InFlightOrder]):
+        try:
+            results = await self._place_batch_orders(orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            results = [request_error] * len(orders)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self.logger().network(
+                    f"Error submitting {order.trade_type.name.lower()} {order.order_type.name.upper()} order to "
+                    f"{self.name_cap} for {order.amount} {order.trading_pair} {order.price}.",
+                    exc_info=result,
+                    app_warning_msg=f"Failed to submit order to {self.name_cap}. "
+                                    f"Check API key and network connection."
+                )
+                self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+            else:
+                exchange_order_id, update_timestamp = result
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=exchange_order_id,
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                ))
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Requests the exchange to cancel the orders. Connectors supporting a batch cancel endpoint should override it.
+
+        :param orders_to_cancel: the orders to cancel
+
+        :return: a list of CancellationResult instances, one for each of the orders to be cancelled
+        """
+        results = await safe_gather(
+            *[self._execute_cancel(trading_pair=order.trading_pair, order_id=order.client_order_id)
+              for order in orders_to_cancel],
+            return_exceptions=True)
+        return [CancellationResult(order.client_order_id, result == order.client_order_id)
+                for order, result in zip(orders_to_cancel, results)]
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -608,6 +788,17 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Places the orders with a single request to the exchange batch order creation endpoint. Only called for
+        connectors with `batch_order_create_max_size` > 0.
+
+        :param orders: the tracked orders to place, at most `batch_order_create_max_size` of them
+
+        :return: for each order, the exchange order id and the update timestamp, or the error if it was rejected
+        """
+        raise NotImplementedError
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -841,6 +1032,99 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_status(),
         )
 
+    def _bulk_order_status_saves_weight(self, orders_count: int) -> bool:
+        """
+        Checks if a single bulk order status request costs less than querying the status of each order individually.
+        The weights are only compared in the rate limits shared by both endpoints (e.g. the account request weight),
+        the bulk request has to cost less in every one of them. Without shared rate limits the number of requests
+        counted in the own rate limit of each endpoint is compared.
+
+        :param orders_count: the number of orders of the trading pair
+
+        :return: True if the bulk request saves request weight
+        """
+        bulk_weights = self._throttler.request_weights(limit_id=self._bulk_order_status_limit_id)
+        order_weights = self._throttler.request_weights(limit_id=self._order_status_limit_id)
+        own_limit_ids = {self._bulk_order_status_limit_id, self._order_status_limit_id}
+        shared_limit_ids = (set(bulk_weights) & set(order_weights)) - own_limit_ids
+        if len(shared_limit_ids) == 0:
+            return (orders_count * order_weights.get(self._order_status_limit_id, 1)
+                    > bulk_weights.get(self._bulk_order_status_limit_id, 1))
+        return all(orders_count * order_weights[limit_id] > bulk_weights[limit_id] for limit_id in shared_limit_ids)
+
+    async def _reconcile_orders_with_bulk_status(self, tracked_orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the status of the tracked orders using the bulk order status endpoint declared by the connector
+        (see `_bulk_order_status_limit_id` and `_request_bulk_order_updates`).
+        Bulk requests are only sent for the trading pairs where they are cheaper than querying each order individually.
+        The saved request weight is reported to the throttler.
+
+        :param tracked_orders: the orders which status should be updated
+
+        :return: the orders missing from the bulk results, that still have to be queried individually
+        """
+        bulk_limit_id = self._bulk_order_status_limit_id
+        if bulk_limit_id is None or self._order_status_limit_id is None or len(tracked_orders) == 0:
+            return tracked_orders
+
+        orders_by_trading_pair: Dict[str, List[InFlightOrder]] = {}
+        for order in tracked_orders:
+            orders_by_trading_pair.setdefault(order.trading_pair, []).append(order)
+
+        bulk_trading_pairs = [trading_pair
+                              for trading_pair, orders in orders_by_trading_pair.items()
+                              if self._bulk_order_status_saves_weight(orders_count=len(orders))]
+        if len(bulk_trading_pairs) == 0:
+            return tracked_orders
+
+        results = await safe_gather(
+            *[self._request_bulk_order_updates(trading_pair=trading_pair,
+                                               orders=orders_by_trading_pair[trading_pair])
+              for trading_pair in bulk_trading_pairs],
+            return_exceptions=True)
+
+        pending_orders: List[InFlightOrder] = []
+        reconciled_orders_count = 0
+        successful_requests_count = 0
+        for trading_pair, updates in zip(bulk_trading_pairs, results):
+            orders = orders_by_trading_pair.pop(trading_pair)
+            if isinstance(updates, Exception):
+                self.logger().network(
+                    f"Error fetching bulk order status for {trading_pair}: {updates}.",
+                    app_warning_msg=f"Failed to fetch bulk order status for {trading_pair}."
+                )
+                pending_orders.extend(orders)
+                continue
+
+            successful_requests_count += 1
+            updates_by_client_id = {update.client_order_id: update
+                                    for update in updates if update.client_order_id is not None}
+            updates_by_exchange_id = {update.exchange_order_id: update
+                                      for update in updates if update.exchange_order_id is not None}
+            for order in orders:
+                update = updates_by_client_id.get(order.client_order_id)
+                if update is None and order.exchange_order_id is not None:
+                    update = updates_by_exchange_id.get(order.exchange_order_id)
+                if update is None:
+                    pending_orders.append(order)
+                else:
+                    self._order_tracker.process_order_update(order_update=update._replace(
+                        client_order_id=order.client_order_id))
+                    reconciled_orders_count += 1
+
+        if successful_requests_count > 0:
+            self._throttler.report_saved_requests(
+                limit_id=self._order_status_limit_id,
+                count=reconciled_orders_count,
+                replaced_by_limit_id=bulk_limit_id,
+                replaced_by_count=successful_requests_count)
+            self.logger().debug(f"Reconciled {reconciled_orders_count} orders with {successful_requests_count} bulk "
+                                f"order status requests.")
+
+        for orders in orders_by_trading_pair.values():
+            pending_orders.extend(orders)
+        return pending_orders
+
     async def _update_all_balances(self):
         await self._update_balances()
         if not self.real_time_balance_update:
@@ -866,6 +1150,34 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _update_order_status(self):
         raise NotImplementedError
 
+    @property
+    def _order_status_limit_id(self) -> Optional[str]:
+        """
+        The throttler limit id of the endpoint used to query the status of a single order
+        """
+        return None
+
+    @property
+    def _bulk_order_status_limit_id(self) -> Optional[str]:
+        """
+        The throttler limit id of the endpoint used by `_request_bulk_order_updates`.
+        Connectors supporting a bulk open orders (or bulk order query) endpoint should override it.
+        None means the connector does not support bulk order status reconciliation.
+        """
+        return None
+
+    async def _request_bulk_order_updates(self, trading_pair: str, orders: List[InFlightOrder]) -> List[OrderUpdate]:
+        """
+        Requests the status of several orders of a trading pair with a single API call.
+        Orders not present in the response are queried individually, so open orders endpoints can be used here.
+
+        :param trading_pair: the trading pair of the orders
+        :param orders: the tracked orders which status is required
+
+        :return: the order updates returned by the exchange
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _update_balances(self):
         raise NotImplementedError
@@ -1,11 +1,12 @@
 import asyncio
 import copy
+import functools
 import itertools as it
 import logging
 import re
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
 
 from async_timeout import timeout
 
@@ -27,12 +28,13 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
 
+from .gateway_nonce_manager import GatewayNonceManager
 from .gateway_price_shim import GatewayPriceShim
+from .gateway_quote_cache import GatewayQuoteCache
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -51,6 +53,8 @@ class GatewayEVMAMM(ConnectorBase):
     POLL_INTERVAL = 1.0
     UPDATE_BALANCE_INTERVAL = 30.0
     APPROVAL_ORDER_ID_PATTERN = re.compile(r"approve-(\w+)-(\w+)")
+    QUOTE_AMOUNT_SIGNIFICANT_DIGITS = 8
+    NONCE_CONFLICT_RETRIES = 1
 
     _connector_name: str
     _name: str
@@ -114,6 +118,16 @@ class GatewayEVMAMM(ConnectorBase):
         self._native_currency = None
         self._network_transaction_fee: Optional[TokenAmount] = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self)
+        self._quote_cache: GatewayQuoteCache = GatewayQuoteCache(
+            ttl=client_config_map.gateway.gateway_quote_cache_ttl,
+            amount_significant_digits=self.QUOTE_AMOUNT_SIGNIFICANT_DIGITS,
+        )
+        self._quote_cache_per_block: bool = client_config_map.gateway.gateway_quote_cache_per_block
+        self._nonce_manager: GatewayNonceManager = GatewayNonceManager.for_wallet(
+            chain, network, wallet_address, functools.partial(
+                self._fetch_next_nonce, GatewayHttpClient.get_instance(client_config_map), chain, network, wallet_address
+            )
+        )
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -305,12 +319,15 @@ class GatewayEVMAMM(ConnectorBase):
                                   trading_pair=token_symbol,
                                   is_approval=True)
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().approve_token(
-                self.chain,
-                self.network,
-                self.address,
-                token_symbol,
-                self.connector_name,
+            resp: Dict[str, Any] = await self._send_transaction(
+                lambda **transaction_args: self._get_gateway_instance().approve_token(
+                    self.chain,
+                    self.network,
+                    self.address,
+                    token_symbol,
+                    self.connector_name,
+                    **transaction_args
+                ),
                 **request_args
             )
 
@@ -352,7 +369,6 @@ class GatewayEVMAMM(ConnectorBase):
             ret_val[token] = Decimal(str(amount))
         return ret_val
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -361,7 +377,8 @@ class GatewayEVMAMM(ConnectorBase):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Retrieves a quote price. The quotes are cached by trading pair, side and amount bucket (see GatewayQuoteCache)
+        and the concurrent requests of the same quote share a single call to gateway.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -369,7 +386,18 @@ class GatewayEVMAMM(ConnectorBase):
         :param ignore_shim: Ignore the price shim, and return the real price on the network
         :return: The quote price.
         """
+        quote_key = (trading_pair, is_buy, self._quote_cache.amount_bucket(amount), ignore_shim)
+        return await self._quote_cache.get(
+            quote_key, lambda: self._fetch_quote_price(trading_pair, is_buy, amount, ignore_shim)
+        )
 
+    async def _fetch_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool
+    ) -> Optional[Decimal]:
         base, quote = trading_pair.split("-")
         side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
 
@@ -522,16 +550,19 @@ class GatewayEVMAMM(ConnectorBase):
                                   price=price,
                                   amount=amount)
         try:
-            order_result: Dict[str, Any] = await self._get_gateway_instance().amm_trade(
-                self.chain,
-                self.network,
-                self.connector_name,
-                self.address,
-                base,
-                quote,
-                trade_type,
-                amount,
-                price,
+            order_result: Dict[str, Any] = await self._send_transaction(
+                lambda **transaction_args: self._get_gateway_instance().amm_trade(
+                    self.chain,
+                    self.network,
+                    self.connector_name,
+                    self.address,
+                    base,
+                    quote,
+                    trade_type,
+                    amount,
+                    price,
+                    **transaction_args
+                ),
                 **request_args
             )
             transaction_hash: Optional[str] = order_result.get("txHash")
@@ -637,6 +668,7 @@ class GatewayEVMAMM(ConnectorBase):
                                     "txHash key not found in transaction status.")
                 continue
             if transaction_status["txStatus"] == 1:
+                self._nonce_manager.confirm(tracked_approval.nonce)
                 if transaction_status["txReceipt"]["status"] == 1:
                     self.logger().info(f"Token approval for {tracked_approval.client_order_id} on {self.connector_name} "
                                        f"successful.")
@@ -759,6 +791,8 @@ class GatewayEVMAMM(ConnectorBase):
                 continue
             tx_status: int = tx_details["txStatus"]
             tx_receipt: Optional[Dict[str, Any]] = tx_details["txReceipt"]
+            if tx_status == 1:
+                self._nonce_manager.confirm(tracked_order.nonce)
             if tx_status == 1 and (tx_receipt is not None and tx_receipt.get("status") == 1):
                 gas_used: int = tx_receipt["gasUsed"]
                 gas_price: Decimal = tracked_order.gas_price
@@ -795,6 +829,10 @@ class GatewayEVMAMM(ConnectorBase):
                 pass
 
             elif tx_status == -1 or (tx_receipt is not None and tx_receipt.get("status") == 0):
+                if tx_status == -1:
+                    # The transaction was dropped, its nonce was not used
+                    self._nonce_manager.release(tracked_order.nonce)
+                    self._schedule_nonce_gaps_filling()
                 self.logger().network(
                     f"Error fetching transaction status for the order {tracked_order.client_order_id}: {tx_details}.",
                     app_warning_msg=f"Failed to fetch transaction status for the order {tracked_order.client_order_id}."
@@ -835,6 +873,7 @@ class GatewayEVMAMM(ConnectorBase):
         }
 
     async def start_network(self):
+        self._nonce_manager.attach()
         if self._trading_required:
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
             self._auto_approve_task = safe_ensure_future(self.auto_approve())
@@ -842,6 +881,7 @@ class GatewayEVMAMM(ConnectorBase):
         self._get_chain_info_task = safe_ensure_future(self.get_chain_info())
 
     async def stop_network(self):
+        self._nonce_manager.detach()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
             self._status_polling_task = None
@@ -874,15 +914,96 @@ class GatewayEVMAMM(ConnectorBase):
             if self._poll_notifier is not None and not self._poll_notifier.is_set():
                 self._poll_notifier.set()
 
-    async def _update_nonce(self, new_nonce: Optional[int] = None):
+    @staticmethod
+    async def _fetch_next_nonce(gateway_instance: GatewayHttpClient, chain: str, network: str, address: str) -> int:
         """
-        Call the gateway API to get the current nonce for self.address
+        Call the gateway API to get the next nonce of the wallet. It does not use the connector, the nonce manager
+        shared by the connectors of the wallet keeps it.
         """
-        if not new_nonce:
-            resp_json: Dict[str, Any] = await self._get_gateway_instance().get_evm_nonce(self.chain, self.network, self.address)
-            new_nonce: int = resp_json.get("nonce")
+        resp_json: Dict[str, Any] = await gateway_instance.get_evm_nonce(chain, network, address)
+        return int(resp_json["nonce"])
 
-        self._nonce = new_nonce
+    async def _send_transaction(
+            self,
+            send_request: Callable[..., Awaitable[Dict[str, Any]]],
+            **request_args
+    ) -> Dict[str, Any]:
+        """
+        Sends a transaction with a nonce allocated by the local nonce manager (unless a nonce is given in request_args),
+        so the transactions can be sent back to back. When the network rejects the nonce, the nonces are synchronized
+        with the network again and the transaction is sent again with a new nonce.
+        :param send_request: the gateway client call sending the transaction, called with the nonce and request_args
+        :return: the gateway response, with the nonce of the transaction when it has been sent
+        """
+        if request_args.get("nonce") is not None:
+            return await send_request(**request_args)
+
+        attempt: int = 0
+        while True:
+            nonce: int = await self._nonce_manager.allocate()
+            try:
+                resp: Dict[str, Any] = await send_request(nonce=nonce, **request_args)
+            except asyncio.CancelledError:
+                self._nonce_manager.release(nonce)
+                raise
+            except Exception as e:
+                self._nonce_manager.release(nonce)
+                if not self._get_gateway_instance().is_nonce_error(e) or attempt >= self.NONCE_CONFLICT_RETRIES:
+                    self._schedule_nonce_gaps_filling()
+                    raise
+                attempt += 1
+                self.logger().info(f"The nonce {nonce} was rejected, retrying with a new nonce. ({e})")
+                await self._nonce_manager.resync()
+                continue
+            if resp.get("nonce") is not None:
+                self._nonce_manager.commit(nonce)
+            else:
+                self._nonce_manager.release(nonce)
+            self._schedule_nonce_gaps_filling()
+            return resp
+
+    def _schedule_nonce_gaps_filling(self):
+        if len(self._nonce_manager.gap_nonces) > 0:
+            safe_ensure_future(self._fill_nonce_gaps())
+
+    async def _fill_nonce_gaps(self):
+        """
+        Sends a cancel transaction (an empty transaction using the nonce) for each released nonce left below a
+        transaction already sent, so the transactions sent after it can be mined without waiting for a new order.
+        """
+        for nonce in self._nonce_manager.gap_nonces:
+            # The nonce may have been reused by a new transaction in the meantime
+            if not self._nonce_manager.reclaim(nonce):
+                continue
+            try:
+                resp: Dict[str, Any] = await self._get_gateway_instance().cancel_evm_transaction(
+                    self.chain, self.network, self.address, nonce
+                )
+            except asyncio.CancelledError:
+                self._nonce_manager.release(nonce)
+                raise
+            except Exception:
+                self._nonce_manager.release(nonce)
+                self.logger().network(
+                    f"Error filling the nonce gap {nonce} of {self.address}.",
+                    exc_info=True,
+                    app_warning_msg=f"Failed to fill the nonce gap {nonce} on {self.chain}-{self.network}."
+                )
+                continue
+            if resp.get("txHash") is not None:
+                self.logger().info(f"Filled the nonce gap {nonce} with the transaction {resp['txHash']}.")
+                self._nonce_manager.commit(nonce)
+            else:
+                self._nonce_manager.release(nonce)
+
+    async def _update_block_number(self):
+        """
+        Reports the current block number of the network to the quote cache, so the quotes expire with each new block
+        """
+        resp: Dict[str, Any] = await self._get_gateway_instance().get_network_status(self.chain, self.network)
+        block_number: Optional[int] = resp.get("currentBlockNumber")
+        if block_number is not None:
+            self._quote_cache.update_block_number(block_number)
 
     async def _status_polling_loop(self):
         await self.update_balances(on_interval=False)
@@ -890,12 +1011,15 @@ class GatewayEVMAMM(ConnectorBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
-                await safe_gather(
+                polling_tasks = [
                     self.update_balances(on_interval=True),
                     self.update_canceling_transactions(self.canceling_orders),
                     self.update_token_approval_status(self.approval_orders),
                     self.update_order_status(self.amm_orders)
-                )
+                ]
+                if self._quote_cache_per_block:
+                    polling_tasks.append(self._update_block_number())
+                await safe_gather(*polling_tasks)
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
                 raise
@@ -1021,13 +1145,13 @@ class GatewayEVMAMM(ConnectorBase):
 
         try:
             async with timeout(timeout_seconds):
-                for incomplete_order in incomplete_orders:
-                    try:
-                        canceling_order_id: Optional[str] = await self._execute_cancel(
-                            incomplete_order.client_order_id,
-                            cancel_age
-                        )
-                    except Exception:
+                # The cancel transactions reuse the nonces of the transactions they replace, they can be sent together.
+                canceling_order_ids: List[Union[Optional[str], Exception]] = await safe_gather(*[
+                    self._execute_cancel(incomplete_order.client_order_id, cancel_age)
+                    for incomplete_order in incomplete_orders
+                ], return_exceptions=True)
+                for canceling_order_id in canceling_order_ids:
+                    if isinstance(canceling_order_id, Exception):
                         continue
                     if canceling_order_id is not None:
                         canceling_id_set.remove(canceling_order_id)
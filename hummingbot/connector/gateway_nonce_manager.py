@@ -0,0 +1,178 @@
+import asyncio
+import heapq
+import logging
+import weakref
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class GatewayNonceManager:
+    """
+    Allocates the nonces of the transactions sent from a wallet locally, so several transactions can be sent to Gateway
+    back to back instead of each one waiting for Gateway to work out the next nonce of the wallet.
+
+    - The next nonce is fetched from the network once, then the nonces are allocated monotonically.
+    - The nonces of the transactions that could not be sent are released and reused first, so they do not leave gaps
+      blocking the transactions sent after them.
+    - When the network rejects a nonce, `resync` fetches the next nonce of the wallet again, and the nonces between
+      it and the highest nonce in use that are neither sent nor being sent are reused (gap recovery).
+    - A nonce belongs to the wallet, the connectors sending transactions from the same wallet (e.g. the two gateway
+      legs of an arbitrage) share the manager returned by `for_wallet`. The connectors attach to the manager when they
+      start and detach when they stop, the state of the wallet is dropped when the last one stops.
+    """
+    # Only the managers in use by a connector are kept
+    _wallet_managers: "weakref.WeakValueDictionary[Tuple[str, str, str], GatewayNonceManager]" = \
+        weakref.WeakValueDictionary()
+
+    def __init__(self, fetch_next_nonce: Callable[[], Awaitable[int]]):
+        """
+        :param fetch_next_nonce: coroutine function returning the next nonce of the wallet according to the network
+        """
+        self._fetch_next_nonce = fetch_next_nonce
+        self._next_nonce: Optional[int] = None
+        self._released_nonces: List[int] = []  # heap
+        self._allocated_nonces: Set[int] = set()  # allocated, transaction not sent yet
+        self._committed_nonces: Set[int] = set()  # transaction sent, maybe not mined yet
+        self._network_next_nonce: int = 0  # next nonce of the network at the last synchronization
+        self._users: int = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_wallet(cls,
+                   chain: str,
+                   network: str,
+                   address: str,
+                   fetch_next_nonce: Callable[[], Awaitable[int]]) -> "GatewayNonceManager":
+        """
+        Returns the nonce manager of a wallet, creating it when no connector uses it.
+
+        :param fetch_next_nonce: coroutine function returning the next nonce of the wallet according to the network,
+        used when the manager is created. It is kept by the manager, so it must not hold a connector.
+        """
+        wallet: Tuple[str, str, str] = (chain, network, address.lower())
+        manager: Optional[GatewayNonceManager] = cls._wallet_managers.get(wallet)
+        if manager is None:
+            manager = cls._wallet_managers[wallet] = cls(fetch_next_nonce)
+        return manager
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    @property
+    def next_nonce(self) -> Optional[int]:
+        return self._next_nonce
+
+    @property
+    def released_nonces(self) -> List[int]:
+        return sorted(self._released_nonces)
+
+    @property
+    def pending_nonces(self) -> Set[int]:
+        return self._allocated_nonces | self._committed_nonces
+
+    @property
+    def gap_nonces(self) -> List[int]:
+        """
+        The released nonces below a transaction already sent, which can not be mined until they are used.
+        """
+        if len(self._committed_nonces) == 0:
+            return []
+        highest_committed_nonce: int = max(self._committed_nonces)
+        return sorted(nonce for nonce in self._released_nonces if nonce < highest_committed_nonce)
+
+    def attach(self):
+        """
+        A connector sending transactions from the wallet started.
+        """
+        self._users += 1
+
+    def detach(self):
+        """
+        A connector sending transactions from the wallet stopped. When no connector is left, the nonces are dropped
+        and fetched from the network again by the next transaction.
+        """
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and len(self._allocated_nonces) == 0:
+            self._next_nonce = None
+            self._released_nonces = []
+            self._committed_nonces = set()
+            self._network_next_nonce = 0
+
+    async def allocate(self) -> int:
+        """
+        Allocates the nonce of a new transaction. The nonce must then be either committed or released.
+        """
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._network_next_nonce = await self._fetch_next_nonce()
+            if len(self._released_nonces) > 0:
+                nonce = heapq.heappop(self._released_nonces)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            self._allocated_nonces.add(nonce)
+            return nonce
+
+    def reclaim(self, nonce: int) -> bool:
+        """
+        Allocates a given released nonce, e.g. to fill a gap. The nonce must then be either committed or released.
+
+        :return: False if the nonce is not released anymore (reused by another transaction in the meantime)
+        """
+        if nonce not in self._released_nonces:
+            return False
+        self._released_nonces.remove(nonce)
+        heapq.heapify(self._released_nonces)
+        self._allocated_nonces.add(nonce)
+        return True
+
+    def commit(self, nonce: int):
+        """
+        The transaction with the nonce has been sent.
+        """
+        self._allocated_nonces.discard(nonce)
+        self._committed_nonces.add(nonce)
+
+    def confirm(self, nonce: int):
+        """
+        The transaction with the nonce has been mined.
+        """
+        self._committed_nonces.discard(nonce)
+
+    def release(self, nonce: int):
+        """
+        The transaction with the nonce could not be sent, or was dropped by the network after being sent. The nonce is
+        reused by the next transaction.
+        """
+        if nonce in self._allocated_nonces or nonce in self._committed_nonces:
+            self._allocated_nonces.discard(nonce)
+            self._committed_nonces.discard(nonce)
+            # A nonce below the next nonce of the network has been used by another transaction of the wallet.
+            if nonce >= self._network_next_nonce:
+                heapq.heappush(self._released_nonces, nonce)
+
+    async def resync(self):
+        """
+        Synchronizes the nonces with the network, after it rejected a nonce.
+        """
+        async with self._lock:
+            network_next_nonce: int = await self._fetch_next_nonce()
+            # The transactions below the next nonce of the network are mined (or replaced by other transactions).
+            self._committed_nonces = {nonce for nonce in self._committed_nonces if nonce >= network_next_nonce}
+            in_use_nonces: Set[int] = self._allocated_nonces | self._committed_nonces
+            next_nonce: int = max([network_next_nonce] + [nonce + 1 for nonce in in_use_nonces])
+            self._released_nonces = [nonce for nonce in range(network_next_nonce, next_nonce)
+                                     if nonce not in in_use_nonces]
+            heapq.heapify(self._released_nonces)
+            if next_nonce != self._next_nonce or len(self._released_nonces) > 0:
+                self.logger().info(f"Resynchronized the wallet nonces, next nonce {self._next_nonce} -> {next_nonce}"
+                                   f" (gaps to fill: {self._released_nonces}).")
+            self._next_nonce = next_nonce
+            self._network_next_nonce = network_next_nonce
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from cachetools import TTLCache
+
+
+class GatewayQuoteCache:
+    """
+    Caches the quotes requested to Gateway, so the identical quotes requested by a strategy on every tick (and by the
+    different legs of a strategy at the same time) do not all make a round trip to Gateway and the blockchain node.
+
+    - A quote is reused for `ttl` seconds.
+    - When block numbers are reported with `update_block_number`, the quotes also expire when a new block is seen.
+    - Concurrent requests of the same quote share a single in-flight request.
+    """
+
+    MAX_SIZE = 1000
+
+    def __init__(self, ttl: float, amount_significant_digits: Optional[int] = None):
+        """
+        :param ttl: seconds a quote is reused for
+        :param amount_significant_digits: significant digits of the amounts in the cache keys, the amounts only
+        differing after them share the same quote (None to use the exact amounts)
+        """
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._quotes: Optional[TTLCache] = TTLCache(maxsize=self.MAX_SIZE, ttl=ttl) if ttl > 0 else None
+        self._in_flight_requests: Dict[Hashable, asyncio.Task] = {}
+        self._block_number: Optional[int] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def block_number(self) -> Optional[int]:
+        return self._block_number
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        if self._amount_significant_digits is None or not amount.is_finite() or amount == 0:
+            return amount.normalize()
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        return amount.quantize(Decimal(1).scaleb(exponent)).normalize()
+
+    def update_block_number(self, block_number: int):
+        """
+        Expires all the quotes when the block number changes.
+        """
+        if block_number != self._block_number:
+            self._block_number = block_number
+            self.clear()
+
+    def clear(self):
+        if self._quotes is not None:
+            self._quotes.clear()
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached quote for the key, or the result of fetch() otherwise. While fetch() is running, the
+        requests for the same key wait for its result instead of fetching the quote again.
+        """
+        if self._quotes is not None and key in self._quotes:
+            return self._quotes[key]
+
+        request: Optional[asyncio.Task] = self._in_flight_requests.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch(key, fetch))
+            request.add_done_callback(self._retrieve_fetch_error)
+            self._in_flight_requests[key] = request
+        # The request is shared, cancelling one of the callers must not cancel it for the others.
+        return await asyncio.shield(request)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        block_number = self._block_number
+        try:
+            quote = await fetch()
+            # A quote fetched across a block change may be stale, it is returned to the callers but not cached.
+            if self._quotes is not None and block_number == self._block_number:
+                self._quotes[key] = quote
+            return quote
+        finally:
+            del self._in_flight_requests[key]
+
+    @staticmethod
+    def _retrieve_fetch_error(request: asyncio.Task):
+        # The callers waiting for the request report its error, but all of them may have been cancelled before it
+        # failed. Retrieving it here avoids the "exception was never retrieved" error of the shielded request.
+        if not request.cancelled() and request.exception() is not None:
+            logging.getLogger(__name__).debug(f"Gateway quote request failed: {request.exception()}")
@@ -12,10 +12,15 @@ from hummingbot.core.api_throttler.data_types import (
     RateLimit,
     TaskLog,
 )
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+from hummingbot.core.utils.order_tracing import OrderStage, record_traced_order_stage
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
+THROTTLER_WAIT_METRIC = MetricsRegistry.get_instance().histogram(
+    "throttler_wait_seconds", "Time spent waiting for rate limit capacity before sending a request.", ("limit_id",)
+)
 
 
 class AsyncRequestContextBase(ABC):
@@ -91,7 +96,10 @@ class AsyncRequestContextBase(ABC):
                 self._task_logs.append(task)
 
     async def __aenter__(self):
+        start = time.perf_counter()
         await self.acquire()
+        THROTTLER_WAIT_METRIC.labels(self._rate_limit.limit_id).add(time.perf_counter() - start)
+        record_traced_order_stage(OrderStage.THROTTLER_ACQUIRED)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
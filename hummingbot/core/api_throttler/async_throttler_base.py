@@ -54,6 +54,9 @@ class AsyncThrottlerBase(ABC):
         # List of TaskLog used to determine the API requests within a set time window.
         self._task_logs: List[TaskLog] = []
 
+        # Capacity, per limit id, that callers reported as not consumed thanks to request batching
+        self._saved_weights: Dict[str, int] = {}
+
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
@@ -79,6 +82,41 @@ class AsyncThrottlerBase(ABC):
 
         return rate_limit, related_limits
 
+    @property
+    def saved_weights(self) -> Dict[str, int]:
+        """
+        Returns the accumulated capacity, per limit id, reported as saved through `report_saved_requests`
+        """
+        return dict(self._saved_weights)
+
+    def request_weights(self, limit_id: str) -> Dict[str, int]:
+        """
+        Returns the capacity consumed in every related rate limit by a single request associated to the limit id
+        :param limit_id: the limit_id associated with the API request
+        """
+        _, related_limits = self.get_related_limits(limit_id=limit_id)
+        return {rate_limit.limit_id: weight for rate_limit, weight in related_limits}
+
+    def report_saved_requests(self,
+                              limit_id: str,
+                              count: int,
+                              replaced_by_limit_id: Optional[str] = None,
+                              replaced_by_count: int = 1) -> Dict[str, int]:
+        """
+        Registers that `count` requests associated to `limit_id` were not sent because they were replaced by
+        `replaced_by_count` requests associated to `replaced_by_limit_id` (a bulk endpoint for example).
+        :return: the net capacity saved in each rate limit (negative values mean the replacement was more expensive)
+        """
+        saved: Dict[str, int] = {}
+        for related_limit_id, weight in self.request_weights(limit_id=limit_id).items():
+            saved[related_limit_id] = saved.get(related_limit_id, 0) + weight * count
+        if replaced_by_limit_id is not None:
+            for related_limit_id, weight in self.request_weights(limit_id=replaced_by_limit_id).items():
+                saved[related_limit_id] = saved.get(related_limit_id, 0) - weight * replaced_by_count
+        for related_limit_id, weight in saved.items():
+            self._saved_weights[related_limit_id] = self._saved_weights.get(related_limit_id, 0) + weight
+        return saved
+
     @abstractmethod
     def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
         raise NotImplementedError
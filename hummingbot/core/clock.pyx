@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -36,6 +37,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = ClockProfiler(tick_size)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +59,13 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def profiler(self) -> ClockProfiler:
+        """
+        Tick timing statistics of the real time mode.
+        """
+        return self._profiler
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +99,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_tick_start
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -110,11 +121,14 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                self._profiler.tick_started(<int>round((next_tick_time - self._current_tick) / self._tick_size) - 1)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                tick_start = time.perf_counter()
                 for ci in self._current_context:
                     child_iterator = ci
+                    iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +136,8 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    self._profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
+                self._profiler.tick_finished(self._current_tick, time.perf_counter() - tick_start)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -0,0 +1,180 @@
+import cProfile
+import io
+import logging
+import pstats
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.metrics_registry import MetricSample
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class IteratorTickStats(NamedTuple):
+    name: str
+    histogram: LatencyHistogram
+
+
+class ClockProfiler:
+    """
+    Collects the wall time spent by the clock in each tick, in total and per child iterator, and detects the ticks
+    that took longer than the tick size (overruns) and the skipped tick boundaries, either because of an overrun or
+    because the clock loop itself was delayed.
+
+    When a profile threshold is set, a tick slower than the threshold arms cProfile for the following tick, and the
+    most expensive calls of that tick are logged.
+    """
+
+    PROFILE_STATS_LINES = 25
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, tick_size: float, profile_threshold: Optional[float] = None):
+        self._tick_size = tick_size
+        self._profile_threshold = profile_threshold
+        self._tick_histogram = LatencyHistogram()
+        self._iterator_stats: Dict[Any, IteratorTickStats] = {}
+        self._overruns_count: int = 0
+        self._skipped_ticks_count: int = 0
+        self._profile_next_tick: bool = False
+        self._active_profile: Optional[cProfile.Profile] = None
+        self._last_profile_stats: Optional[str] = None
+        self._tick_slowest_iterator: Optional[str] = None
+        self._tick_slowest_duration: float = 0.0
+        self._previous_tick_duration: Optional[float] = None
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def tick_histogram(self) -> LatencyHistogram:
+        return self._tick_histogram
+
+    @property
+    def iterator_stats(self) -> List[IteratorTickStats]:
+        return list(self._iterator_stats.values())
+
+    @property
+    def overruns_count(self) -> int:
+        return self._overruns_count
+
+    @property
+    def skipped_ticks_count(self) -> int:
+        return self._skipped_ticks_count
+
+    @property
+    def profile_threshold(self) -> Optional[float]:
+        return self._profile_threshold
+
+    @profile_threshold.setter
+    def profile_threshold(self, value: Optional[float]):
+        self._profile_threshold = value if value else None
+        self._profile_next_tick = False
+
+    @property
+    def last_profile_stats(self) -> Optional[str]:
+        return self._last_profile_stats
+
+    def tick_started(self, skipped_ticks: int):
+        """
+        Called by the clock before running the child iterators.
+        :param skipped_ticks: number of tick boundaries elapsed since the previous tick without running a tick
+        """
+        if skipped_ticks > 0:
+            self._skipped_ticks_count += skipped_ticks
+            if self._previous_tick_duration is not None and self._previous_tick_duration > self._tick_size:
+                cause = (f"the previous tick took {self._previous_tick_duration:.3f}s, longer than the tick size of "
+                         f"{self._tick_size}s")
+            else:
+                cause = "the clock loop was delayed (e.g. by other tasks blocking the event loop or a system pause)"
+            self.logger().warning(
+                f"The clock skipped {skipped_ticks} tick(s), {cause}.",
+                extra={"clock_skipped_ticks": skipped_ticks,
+                       "clock_tick_size": self._tick_size,
+                       "clock_previous_tick_duration": self._previous_tick_duration},
+            )
+        self._tick_slowest_iterator = None
+        self._tick_slowest_duration = 0.0
+        if self._profile_next_tick:
+            self._profile_next_tick = False
+            self._active_profile = cProfile.Profile()
+            self._active_profile.enable()
+
+    def record_iterator_tick(self, iterator: Any, duration: float):
+        stats = self._iterator_stats.get(iterator)
+        if stats is None:
+            stats = IteratorTickStats(self._iterator_name(iterator), LatencyHistogram())
+            self._iterator_stats[iterator] = stats
+        stats.histogram.add(duration)
+        if duration >= self._tick_slowest_duration:
+            self._tick_slowest_iterator = stats.name
+            self._tick_slowest_duration = duration
+
+    def tick_finished(self, timestamp: float, duration: float):
+        """
+        Called by the clock once all the child iterators ran.
+        :param timestamp: the tick timestamp
+        :param duration: the wall time taken by the tick
+        """
+        if self._active_profile is not None:
+            self._active_profile.disable()
+            self._log_profile_stats(timestamp)
+            self._active_profile = None
+        self._tick_histogram.add(duration)
+        self._previous_tick_duration = duration
+        if duration > self._tick_size:
+            self._overruns_count += 1
+            self.logger().warning(
+                f"Clock tick at {timestamp} took {duration:.3f}s, longer than the tick size of {self._tick_size}s "
+                f"(slowest: {self._tick_slowest_iterator} with {self._tick_slowest_duration:.3f}s).",
+                extra={"clock_tick_timestamp": timestamp,
+                       "clock_tick_duration": duration,
+                       "clock_tick_size": self._tick_size,
+                       "clock_slowest_iterator": self._tick_slowest_iterator,
+                       "clock_slowest_iterator_duration": self._tick_slowest_duration},
+            )
+        if self._profile_threshold is not None and duration > self._profile_threshold:
+            self._profile_next_tick = True
+
+    def metrics(self) -> List[MetricSample]:
+        samples: List[MetricSample] = [
+            ("clock_tick_seconds", {}, self._tick_histogram),
+            ("clock_overruns_total", {}, self._overruns_count),
+            ("clock_skipped_ticks_total", {}, self._skipped_ticks_count),
+        ]
+        samples.extend(("clock_iterator_tick_seconds", {"iterator": stats.name}, stats.histogram)
+                       for stats in self._iterator_stats.values())
+        return samples
+
+    def reset(self):
+        self._tick_histogram.reset()
+        self._iterator_stats.clear()
+        self._overruns_count = 0
+        self._skipped_ticks_count = 0
+
+    @staticmethod
+    def _iterator_name(iterator: Any) -> str:
+        name = type(iterator).__name__
+        display_name = getattr(iterator, "display_name", None)
+        if isinstance(display_name, str) and display_name != name:
+            name = f"{name} ({display_name})"
+        return name
+
+    def _log_profile_stats(self, timestamp: float):
+        stream = io.StringIO()
+        pstats.Stats(self._active_profile, stream=stream).sort_stats("cumulative").print_stats(
+            self.PROFILE_STATS_LINES
+        )
+        self._last_profile_stats = stream.getvalue()
+        self.logger().info(
+            f"Profile of the clock tick at {timestamp} (following a tick slower than {self._profile_threshold}s):\n"
+            f"{self._last_profile_stats}",
+            extra={"clock_tick_timestamp": timestamp, "clock_profile_threshold": self._profile_threshold},
+        )
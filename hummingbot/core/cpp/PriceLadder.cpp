@@ -0,0 +1,125 @@
+#include "PriceLadder.h"
+#include <algorithm>
+#include <cmath>
+
+PriceLadder::PriceLadder() {
+    this->bidSide = true;
+    this->cachedBestPrice = NAN;
+}
+
+PriceLadder::PriceLadder(bool bidSide) {
+    this->bidSide = bidSide;
+    this->cachedBestPrice = NAN;
+}
+
+PriceLadder::PriceLadder(const PriceLadder &other) {
+    this->entries = other.entries;
+    this->bidSide = other.bidSide;
+    this->cachedBestPrice = other.cachedBestPrice;
+}
+
+PriceLadder &PriceLadder::operator=(const PriceLadder &other) {
+    this->entries = other.entries;
+    this->bidSide = other.bidSide;
+    this->cachedBestPrice = other.cachedBestPrice;
+    return *this;
+}
+
+void PriceLadder::updateBestPrice() {
+    this->cachedBestPrice = this->entries.empty() ? NAN : this->entries.back().getPrice();
+}
+
+bool PriceLadder::isBetter(double price, double otherPrice) const {
+    return this->bidSide ? price > otherPrice : price < otherPrice;
+}
+
+std::vector<OrderBookEntry>::iterator PriceLadder::findLevel(double price) {
+    // First entry that is not worse than the price. A new top of the book is appended without searching.
+    std::vector<OrderBookEntry>::iterator end = this->entries.end();
+    if (this->entries.empty() || this->isBetter(price, this->entries.back().getPrice())) {
+        return end;
+    }
+    const bool bidSide = this->bidSide;
+    return std::lower_bound(this->entries.begin(), end, price,
+                            [bidSide](const OrderBookEntry &entry, double levelPrice) {
+                                return bidSide ? entry.getPrice() < levelPrice : entry.getPrice() > levelPrice;
+                            });
+}
+
+void PriceLadder::clear() {
+    this->entries.clear();
+    this->updateBestPrice();
+}
+
+void PriceLadder::assign(const std::vector<OrderBookEntry> &newEntries) {
+    const bool bidSide = this->bidSide;
+    this->entries = newEntries;
+    std::stable_sort(this->entries.begin(), this->entries.end(),
+                     [bidSide](const OrderBookEntry &a, const OrderBookEntry &b) {
+                         return bidSide ? a.getPrice() < b.getPrice() : a.getPrice() > b.getPrice();
+                     });
+    // Like inserting the entries in a set, the first entry of each price level wins.
+    this->entries.erase(std::unique(this->entries.begin(), this->entries.end(),
+                                    [](const OrderBookEntry &a, const OrderBookEntry &b) {
+                                        return a.getPrice() == b.getPrice();
+                                    }),
+                        this->entries.end());
+    this->updateBestPrice();
+}
+
+void PriceLadder::update(const OrderBookEntry &entry) {
+    std::vector<OrderBookEntry>::iterator level = this->findLevel(entry.getPrice());
+    if (level != this->entries.end() && (*level).getPrice() == entry.getPrice()) {
+        if (entry.getAmount() > 0) {
+            *level = entry;
+        } else {
+            this->entries.erase(level);
+        }
+    } else if (entry.getAmount() > 0) {
+        this->entries.insert(level, entry);
+    }
+    this->updateBestPrice();
+}
+
+void PriceLadder::popBest() {
+    this->entries.pop_back();
+    this->updateBestPrice();
+}
+
+bool PriceLadder::empty() const {
+    return this->entries.empty();
+}
+
+size_t PriceLadder::size() const {
+    return this->entries.size();
+}
+
+const OrderBookEntry &PriceLadder::best() const {
+    return this->entries.back();
+}
+
+const OrderBookEntry &PriceLadder::atDepth(size_t depth) const {
+    return this->entries[this->entries.size() - 1 - depth];
+}
+
+void truncateOverlapLadders(PriceLadder &bidLadder, PriceLadder &askLadder, const int &dex) {
+    // Same rules as truncateOverlapEntries: centralised, newer entries win; dex, the larger quote amount wins.
+    while (!bidLadder.empty() && !askLadder.empty()) {
+        const OrderBookEntry &topBid = bidLadder.best();
+        const OrderBookEntry &topAsk = askLadder.best();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool keepBid;
+        if (dex != 0) {
+            keepBid = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            keepBid = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (keepBid) {
+            askLadder.popBest();
+        } else {
+            bidLadder.popBest();
+        }
+    }
+}
@@ -0,0 +1,43 @@
+#ifndef _PRICE_LADDER_H
+#define _PRICE_LADDER_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// One side of an order book stored in a sorted, contiguous vector. The entries are ordered from the worst to the
+// best price, so the updates of the levels close to the top of the book (the most frequent ones) only move the few
+// entries after them, and reading the top of the book does not chase tree nodes.
+class PriceLadder {
+    std::vector<OrderBookEntry> entries;
+    bool bidSide;
+    // Price of the best entry (NaN if the ladder is empty), updated with the entries so the top of the book is read
+    // without accessing them.
+    double cachedBestPrice;
+
+    std::vector<OrderBookEntry>::iterator findLevel(double price);
+    void updateBestPrice();
+
+    public:
+        PriceLadder();
+        PriceLadder(bool bidSide);
+        PriceLadder(const PriceLadder &other);
+        PriceLadder &operator=(const PriceLadder &other);
+
+        void clear();
+        void assign(const std::vector<OrderBookEntry> &newEntries);
+        void update(const OrderBookEntry &entry);
+        void popBest();
+        bool empty() const;
+        size_t size() const;
+        const OrderBookEntry &best() const;
+        inline double bestPrice() const {
+            return this->cachedBestPrice;
+        }
+        const OrderBookEntry &atDepth(size_t depth) const;
+        bool isBetter(double price, double otherPrice) const;
+};
+
+void truncateOverlapLadders(PriceLadder &bidLadder, PriceLadder &askLadder, const int &dex);
+
+#endif
@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/PriceLadder.h":
+    cdef cppclass PriceLadder:
+        PriceLadder()
+        PriceLadder(bool bidSide)
+        PriceLadder(const PriceLadder &other)
+        PriceLadder &operator=(const PriceLadder &other)
+        void clear()
+        void assign(const vector[OrderBookEntry] &newEntries)
+        void update(const OrderBookEntry &entry)
+        bool empty() const
+        size_t size() const
+        const OrderBookEntry &best() const
+        double bestPrice() const
+        const OrderBookEntry &atDepth(size_t depth) const
+
+    void truncateOverlapLadders(PriceLadder &bid_ladder, PriceLadder &ask_ladder, const bint &dex)
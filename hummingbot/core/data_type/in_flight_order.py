@@ -1,6 +1,7 @@
 import asyncio
 import copy
 import math
+import time
 import typing
 from decimal import Decimal
 from enum import Enum
@@ -11,6 +12,7 @@ from async_timeout import timeout
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
+from hummingbot.core.utils.order_tracing import ORDER_STAGES, OrderStage
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -124,6 +126,10 @@ class InFlightOrder:
             self.exchange_order_id_update_event.set()
         self.completely_filled_event = asyncio.Event()
 
+        # perf_counter() values of the stages of the order creation (not persisted, they are only meaningful to the
+        # process that created the order)
+        self.stage_timestamps: Dict[OrderStage, float] = {}
+
     @property
     def attributes(self) -> Tuple[Any]:
         return copy.deepcopy(
@@ -156,6 +162,32 @@ class InFlightOrder:
     def quote_asset(self):
         return self.trading_pair.split("-")[1]
 
+    def record_stage(self, stage: OrderStage, timestamp: Optional[float] = None) -> bool:
+        """
+        Records the time a stage of the order creation was reached. Only the first time is kept.
+        :param stage: the stage reached
+        :param timestamp: the perf_counter() value of the time the stage was reached, the current time if not given
+        :return: True if the stage was recorded, False if it had already been reached
+        """
+        if stage in self.stage_timestamps:
+            return False
+        self.stage_timestamps[stage] = time.perf_counter() if timestamp is None else timestamp
+        return True
+
+    def stage_latency(self, stage: OrderStage) -> Optional[float]:
+        """
+        :return: the time elapsed between the closest previous stage recorded and the stage, None if any of them was
+        not recorded
+        """
+        timestamp = self.stage_timestamps.get(stage)
+        if timestamp is None:
+            return None
+        for previous_stage in reversed(ORDER_STAGES[:ORDER_STAGES.index(stage)]):
+            previous_timestamp = self.stage_timestamps.get(previous_stage)
+            if previous_timestamp is not None:
+                return timestamp - previous_timestamp
+        return None
+
     @property
     def is_pending_create(self) -> bool:
         return self.current_state == OrderState.PENDING_CREATE
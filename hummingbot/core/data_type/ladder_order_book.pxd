@@ -0,0 +1,11 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.PriceLadder cimport PriceLadder
+
+
+cdef class LadderOrderBook(OrderBook):
+    cdef PriceLadder _bid_ladder
+    cdef PriceLadder _ask_ladder
+
+    cdef c_update_best_prices(self)
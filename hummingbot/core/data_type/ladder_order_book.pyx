@@ -0,0 +1,82 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/PriceLadder.cpp']
+from typing import Iterator
+
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.PriceLadder cimport PriceLadder, truncateOverlapLadders
+
+
+cdef class LadderOrderBook(OrderBook):
+    """
+    Order book storing each side in a sorted contiguous vector (a price ladder) instead of a tree of price levels.
+    It has the same API as `OrderBook`, and is faster for deep books updated mostly close to the top of the book,
+    which is the common case for the exchange diff streams.
+    Use it for a trading pair by setting the order book create function of the order book tracker data source.
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self._bid_ladder = PriceLadder(True)
+        self._ask_ladder = PriceLadder(False)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            self._bid_ladder.update(bid)
+        for ask in asks:
+            self._ask_ladder.update(ask)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: larger
+        # quote amounts win
+        truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bid_ladder.assign(bids)
+        self._ask_ladder.assign(asks)
+        self._best_bid = self._best_ask = float("NaN")
+        if self._dex:
+            truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self.c_update_best_prices()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+
+    cdef c_update_best_prices(self):
+        # Like OrderBook, keep the last best prices when a side of the book is emptied.
+        if not self._bid_ladder.empty():
+            self._best_bid = self._bid_ladder.bestPrice()
+        if not self._ask_ladder.empty():
+            self._best_ask = self._ask_ladder.bestPrice()
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._bid_ladder.size():
+            entry = self._bid_ladder.atDepth(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._ask_ladder.size():
+            entry = self._ask_ladder.atDepth(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        # The ladders cache their best price, NaN when empty.
+        cdef double price = self._ask_ladder.bestPrice() if is_buy else self._bid_ladder.bestPrice()
+        if isnan(price):
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return price
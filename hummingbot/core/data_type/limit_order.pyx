@@ -134,6 +134,23 @@ cdef class LimitOrder:
     def status(self) -> LimitOrderStatus:
         return LimitOrderStatus(self._cpp_limit_order.getStatus())
 
+    def copy_with_id(self, client_order_id: str) -> LimitOrder:
+        """
+        Creates a copy of the order with a different client order id (used when the id is assigned by the connector)
+        :param client_order_id: The client order id of the new order
+        :return: A new LimitOrder
+        """
+        return LimitOrder(client_order_id=client_order_id,
+                          trading_pair=self.trading_pair,
+                          is_buy=self.is_buy,
+                          base_currency=self.base_currency,
+                          quote_currency=self.quote_currency,
+                          price=self.price,
+                          quantity=self.quantity,
+                          filled_quantity=self.filled_quantity,
+                          creation_timestamp=self.creation_timestamp,
+                          status=self.status)
+
     cdef long long c_age_til(self, long long end_timestamp):
         """
         Calculates and returns age of the order since it was created til end_timestamp in seconds
@@ -3,6 +3,7 @@
 import bisect
 import logging
 import time
+from itertools import islice
 from typing import (
     Dict,
     Iterator,
@@ -281,6 +282,15 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, depth: int) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Reads the best levels of the order book without going through the rest of the book, e.g. to display it.
+
+        :param depth: the maximum number of levels to read on each side
+        :return: the bids from the best bid down and the asks from the best ask up
+        """
+        return list(islice(self.bid_entries(), depth)), list(islice(self.ask_entries(), depth))
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
@@ -10,11 +10,25 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
 from hummingbot.logger import HummingbotLogger
 
+ORDER_BOOK_DIFFS_METRIC = MetricsRegistry.get_instance().counter(
+    "order_book_diffs_total", "Order book diff messages applied.", ("data_source", "trading_pair")
+)
+ORDER_BOOK_DIFF_APPLY_METRIC = MetricsRegistry.get_instance().histogram(
+    "order_book_diff_apply_seconds", "Time taken to apply an order book diff message.", ("data_source", "trading_pair")
+)
+ORDER_BOOK_RESYNCS_METRIC = MetricsRegistry.get_instance().counter(
+    "order_book_resyncs_total", "Order book snapshots fetched to resynchronize an order book out of sync.",
+    ("data_source", "trading_pair")
+)
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
@@ -37,12 +51,20 @@ class OrderBookTracker():
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        # Update id of the snapshot fetched by the resync task and waiting in the tracking message queue
+        self._resync_snapshot_update_ids: Dict[str, int] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        loop_monitor = LoopMonitor.get_instance()
+        data_source_name = type(self._data_source).__name__
+        loop_monitor.register_queue(self._order_book_diff_stream, f"{data_source_name}.order_book_diff_stream")
+        loop_monitor.register_queue(self._order_book_snapshot_stream, f"{data_source_name}.order_book_snapshot_stream")
+        loop_monitor.register_queue(self._order_book_trade_stream, f"{data_source_name}.order_book_trade_stream")
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
@@ -137,6 +159,10 @@ class OrderBookTracker():
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_snapshot_update_ids.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -176,6 +202,10 @@ class OrderBookTracker():
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
+            LoopMonitor.get_instance().register_queue(
+                self._tracking_message_queues[trading_pair],
+                f"{type(self._data_source).__name__}.tracking_message_queue",
+            )
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
                                f"{index + 1}/{len(self._trading_pairs)} completed.")
@@ -257,6 +287,10 @@ class OrderBookTracker():
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        data_source_name = type(self._data_source).__name__
+        diffs_counter = ORDER_BOOK_DIFFS_METRIC.labels(data_source_name, trading_pair)
+        diff_apply_histogram = ORDER_BOOK_DIFF_APPLY_METRIC.labels(data_source_name, trading_pair)
+        last_update_id: int = order_book.snapshot_uid
 
         while True:
             try:
@@ -265,13 +299,29 @@ class OrderBookTracker():
                 # Process saved messages first if there are any
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
+                    # The messages saved before the first snapshot was fetched may be older than it
+                    if message.type is OrderBookMessageType.DIFF and message.update_id < order_book.snapshot_uid:
+                        continue
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if self._data_source.diff_message_has_sequence_gap(message, last_update_id):
+                        self._request_order_book_resync(
+                            trading_pair,
+                            message.update_id,
+                            f"updates {last_update_id + 1} to {message.first_update_id - 1} missing")
+                    apply_start = time.perf_counter()
+                    bids, asks = self._diff_message_rows(trading_pair, message)
+                    order_book.apply_diffs(bids, asks, message.update_id)
+                    diff_apply_histogram.add(time.perf_counter() - apply_start)
+                    diffs_counter.inc()
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
+                    last_update_id = max(last_update_id, message.update_id)
+                    if not self._data_source.order_book_checksum_is_valid(order_book, message):
+                        self._request_order_book_resync(
+                            trading_pair, message.update_id, f"invalid checksum at update {message.update_id}")
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -280,8 +330,27 @@ class OrderBookTracker():
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    # Only the diffs after the snapshot are replayed, the diffs before it may be the reason it was
+                    # fetched (e.g. a diff with an invalid checksum)
+                    past_diffs: List[OrderBookMessage] = [
+                        diff for diff in past_diffs_window if diff.update_id > message.update_id
+                    ]
+                    s_bids, s_asks = self._snapshot_message_rows(trading_pair, message)
+                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+                    for diff in past_diffs:
+                        d_bids, d_asks = self._diff_message_rows(trading_pair, diff)
+                        order_book.apply_diffs(d_bids, d_asks, diff.update_id)
+                    last_update_id = message.update_id
+                    resync_task: Optional[asyncio.Task] = self._resync_tasks.get(trading_pair)
+                    if resync_task is not None and resync_task.done():
+                        del self._resync_tasks[trading_pair]
+                        self._resync_snapshot_update_ids.pop(trading_pair, None)
+                    # The diffs replayed on top of the snapshot must follow it without gaps
+                    for diff in past_diffs:
+                        if self._data_source.diff_message_has_sequence_gap(diff, last_update_id):
+                            self._request_order_book_resync(
+                                trading_pair, diff.update_id, f"updates missing after snapshot {message.update_id}")
+                        last_update_id = max(last_update_id, diff.update_id)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -293,6 +362,67 @@ class OrderBookTracker():
                 )
                 await asyncio.sleep(5.0)
 
+    def _diff_message_rows(self, trading_pair: str,
+                           message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Parsing hook converting a diff message into the bid and ask rows to apply to the order book. The connectors
+        keeping the individual orders of the book (e.g. with an active order tracker) override it.
+
+        :param trading_pair: the trading pair of the order book
+        :param message: the diff message
+
+        :return: the bid rows and the ask rows
+        """
+        return message.bids, message.asks
+
+    def _snapshot_message_rows(self, trading_pair: str,
+                               message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Parsing hook converting a snapshot message into the bid and ask rows of the order book.
+
+        :param trading_pair: the trading pair of the order book
+        :param message: the snapshot message
+
+        :return: the bid rows and the ask rows
+        """
+        return message.bids, message.asks
+
+    def _request_order_book_resync(self, trading_pair: str, update_id: int, reason: str):
+        """
+        Fetches a new snapshot of an order book out of sync at an update, unless the snapshot being fetched or waiting
+        to be applied already covers that update.
+        """
+        resync_task: Optional[asyncio.Task] = self._resync_tasks.get(trading_pair)
+        if resync_task is not None:
+            snapshot_update_id: Optional[int] = self._resync_snapshot_update_ids.get(trading_pair)
+            # Without a snapshot update id the snapshot could not be fetched, the next full reset resynchronizes it
+            if not resync_task.done() or snapshot_update_id is None or update_id <= snapshot_update_id:
+                return
+        self.logger().info(f"The {trading_pair} order book is out of sync ({reason}). Fetching a new snapshot.")
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot_message(trading_pair)
+                ORDER_BOOK_RESYNCS_METRIC.labels(type(self._data_source).__name__, trading_pair).inc()
+                self._resync_snapshot_update_ids[trading_pair] = snapshot.update_id
+                await self._tracking_message_queues[trading_pair].put(snapshot)
+                return
+            except asyncio.CancelledError:
+                raise
+            except NotImplementedError:
+                self.logger().warning(f"Can not fetch the {trading_pair} order book snapshot, the order book will be "
+                                      f"resynchronized by the next full order book reset.")
+                return
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching the {trading_pair} order book snapshot.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error fetching order book snapshot. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
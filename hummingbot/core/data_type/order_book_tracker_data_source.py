@@ -12,7 +12,12 @@ from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
-    FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Seconds between the snapshots of all the order books fetched by listen_for_order_book_snapshots, None to only
+    # fetch the snapshot of an order book when the tracker detects it is out of sync
+    FULL_ORDER_BOOK_RESET_DELTA_SECONDS: Optional[float] = 60 * 60
+    # True when each diff message covers the update ids from its first_update_id to its update_id, with no gap between
+    # consecutive diffs of a trading pair, so the tracker can detect the diffs lost
+    SEQUENTIAL_DIFF_UPDATE_IDS: bool = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -22,6 +27,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
+        self._trading_pair_order_book_create_functions: Dict[str, Callable[[], OrderBook]] = {}
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
 
     @classmethod
@@ -38,6 +44,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    def set_trading_pair_order_book_create_function(self, trading_pair: str, func: Callable[[], OrderBook]):
+        """
+        Overrides the order book create function for a trading pair, e.g. to use a `LadderOrderBook` for a deep book
+        with a high rate of updates.
+        """
+        self._trading_pair_order_book_create_functions[trading_pair] = func
+
+    def order_book_create_function_for_trading_pair(self, trading_pair: str) -> Callable[[], OrderBook]:
+        return self._trading_pair_order_book_create_functions.get(trading_pair, self._order_book_create_function)
+
     @abstractmethod
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -64,10 +80,46 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         :return: a local copy of the current order book in the exchange
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
-        order_book: OrderBook = self.order_book_create_function()
+        order_book: OrderBook = self.order_book_create_function_for_trading_pair(trading_pair)()
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Fetches the current order book of the exchange for a trading pair, used by the tracker to resynchronize an order
+        book out of sync
+
+        :param trading_pair: the trading pair for which the order book has to be retrieved
+
+        :return: the snapshot message of the order book
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
+    def diff_message_has_sequence_gap(self, message: OrderBookMessage, last_update_id: int) -> bool:
+        """
+        Checks if diff messages have been lost between the last update applied to an order book and a new diff message
+
+        :param message: the new diff message
+        :param last_update_id: the update id of the last snapshot or diff applied to the order book
+
+        :return: True if the order book is out of sync
+        """
+        return (self.SEQUENTIAL_DIFF_UPDATE_IDS
+                and "first_update_id" in message.content
+                and message.first_update_id > last_update_id + 1)
+
+    def order_book_checksum_is_valid(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Verifies the order book after applying a diff message, for the exchanges sending a checksum of the order book
+        with the diffs. The exchanges without checksums do not override this method.
+
+        :param order_book: the order book the diff message has been applied to
+        :param message: the diff message
+
+        :return: False if the order book is out of sync
+        """
+        return True
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -113,10 +165,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         This method runs continuously and request the full order book content from the exchange every hour.
         The method uses the REST API from the exchange. With the information creates a snapshot messages that
         is added to the output queue
+        It does nothing when FULL_ORDER_BOOK_RESET_DELTA_SECONDS is None, the tracker then only fetches the snapshots of
+        the order books out of sync.
 
         :param ev_loop: the event loop the method will run in
         :param output: a queue to add the created snapshot messages
         """
+        if self.FULL_ORDER_BOOK_RESET_DELTA_SECONDS is None:
+            return
         while True:
             try:
                 for trading_pair in self._trading_pairs:
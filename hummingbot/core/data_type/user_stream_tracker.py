@@ -1,9 +1,13 @@
 import asyncio
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
+from weakref import WeakSet
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.loop_monitor import LoopMonitor
+from hummingbot.core.utils.metrics_registry import MetricSample, MetricsRegistry
 from hummingbot.logger import HummingbotLogger
 
 
@@ -19,7 +23,9 @@ class UserStreamTracker:
     def __init__(self, data_source: UserStreamTrackerDataSource):
         self._user_stream: asyncio.Queue = asyncio.Queue()
         self._data_source = data_source
+        LoopMonitor.get_instance().register_queue(self._user_stream, f"{type(data_source).__name__}.user_stream")
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
+        _user_stream_trackers.add(self)
 
     @property
     def data_source(self) -> UserStreamTrackerDataSource:
@@ -38,3 +44,19 @@ class UserStreamTracker:
     @property
     def user_stream(self) -> asyncio.Queue:
         return self._user_stream
+
+
+_user_stream_trackers: "WeakSet[UserStreamTracker]" = WeakSet()
+
+
+def user_stream_lag_metrics() -> List[MetricSample]:
+    """
+    The time elapsed since the last message received by each user stream that received messages
+    """
+    now = time.time()
+    return [("user_stream_lag_seconds", {"data_source": type(tracker.data_source).__name__},
+             max(now - tracker.last_recv_time, 0.0))
+            for tracker in list(_user_stream_trackers) if tracker.last_recv_time > 0]
+
+
+MetricsRegistry.get_instance().register_collector(user_stream_lag_metrics)
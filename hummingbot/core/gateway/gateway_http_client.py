@@ -209,6 +209,19 @@ class GatewayHttpClient:
             return True
         return False
 
+    @staticmethod
+    def is_nonce_error(e) -> bool:
+        """
+        Whether the error is a rejection of the transaction nonce (too low, or already used by a pending
+        transaction), relying on the messages of the chain providers as for is_timeout_error.
+        """
+        error_string = str(e)
+        if re.search('nonce too low|nonce has already been used|replacement transaction underpriced',
+                     error_string,
+                     re.IGNORECASE):
+            return True
+        return False
+
     async def ping_gateway(self) -> bool:
         try:
             response: Dict[str, Any] = await self.api_request("get", "", fail_silently=True)
@@ -40,7 +40,8 @@ cdef class PubSub:
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
     3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+       Only when a dead listener is found. Both functions dereference every listener weak reference already, so they
+       skip the dead listeners they find and remove them afterwards, instead of sweeping before every event.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -124,13 +125,12 @@ cdef class PubSub:
             self._events.erase(it)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            object listener_weakref
+            object listener
+            bint has_dead_listeners = False
 
         if it == self._events.end():
             return []
@@ -138,28 +138,43 @@ cdef class PubSub:
         retval = []
         listeners_ptr = address(deref(it).second)
         for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+            listener_weakref = <object>pyref.get()
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+            else:
+                retval.append(listener)
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
             EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            EventListenersCollection *listeners_ptr
+            vector[PyRef] listeners
+            object listener_weakref
+            object listener
             EventListener typed_listener
+            bint has_dead_listeners = False
         if it == self._events.end():
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
+        # It is extremely important that the listeners are iterated from a C++ copy - because listeners are allowed to
+        # call c_add_listener() and c_remove_listener(), which break the iterators of the underlying set. A vector copy
+        # is a single allocation, unlike a copy of the set.
+        listeners_ptr = address(deref(it).second)
+        listeners.reserve(deref(listeners_ptr).size())
+        for pyref in deref(listeners_ptr):
+            listeners.push_back(pyref)
+
         for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            listener_weakref = <object>pyref.get()
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +182,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
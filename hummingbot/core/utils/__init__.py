@@ -1,25 +1,99 @@
-import cachetools
+import asyncio
 import errno
 import functools
-import numpy as np
+import logging
 import socket
+import time
+from typing import Any, Dict, Hashable, NamedTuple
+
+import cachetools
+import cachetools.keys
+import numpy as np
 import pandas as pd
 
 
-def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
-    cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+class AsyncTTLCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    stale_hits: int
+    maxsize: int
+    currsize: int
+
+
+def async_ttl_cache(ttl: float = 3600, maxsize: int = 1, stale_while_revalidate: float = 0):
+    """
+    Caches the results of a coroutine function for `ttl` seconds, keeping the `maxsize` most recently used results.
+
+    - Concurrent calls with the same arguments share a single call of the function, instead of all calling it while
+      the result is not cached yet.
+    - With `stale_while_revalidate` > 0, a result expired for less than that many seconds is still returned while it is
+      refreshed in the background.
+    - Errors are raised to the callers and not cached (a failed refresh keeps the stale result).
+
+    The decorated function has `cache_info()`, returning the hits / misses counters, and `cache_clear()`.
+    """
+    cache = cachetools.LRUCache(maxsize=maxsize)  # key -> (result, timestamp)
+    in_flight_calls: Dict[Hashable, asyncio.Task] = {}
+    stats = {"hits": 0, "misses": 0, "stale_hits": 0}
 
     def decorator(fn):
+        def make_key(args, kwargs) -> Hashable:
+            key = cachetools.keys.hashkey(*args, **kwargs)
+            try:
+                hash(key)
+            except TypeError:
+                key = str((args, kwargs))
+            return key
+
+        async def call(key: Hashable, args, kwargs) -> Any:
+            try:
+                result = await fn(*args, **kwargs)
+                cache[key] = (result, time.monotonic())
+                return result
+            finally:
+                del in_flight_calls[key]
+
+        def start_call(key: Hashable, args, kwargs) -> asyncio.Task:
+            task = in_flight_calls.get(key)
+            if task is None:
+                task = asyncio.ensure_future(call(key, args, kwargs))
+                in_flight_calls[key] = task
+            return task
+
+        def log_refresh_error(task: asyncio.Task):
+            if not task.cancelled() and task.exception() is not None:
+                logging.getLogger(__name__).warning(
+                    f"Error refreshing the cached result of {fn.__qualname__}: {task.exception()}")
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
-            key = str((args, kwargs))
-            try:
-                return cache[key]
-            except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+            key = make_key(args, kwargs)
+            entry = cache.get(key)
+            if entry is not None:
+                result, timestamp = entry
+                age = time.monotonic() - timestamp
+                if age < ttl:
+                    stats["hits"] += 1
+                    return result
+                if age < ttl + stale_while_revalidate:
+                    stats["stale_hits"] += 1
+                    if key not in in_flight_calls:
+                        start_call(key, args, kwargs).add_done_callback(log_refresh_error)
+                    return result
+            stats["misses"] += 1
+            # The call is shared, cancelling one of the callers must not cancel it for the others.
+            return await asyncio.shield(start_call(key, args, kwargs))
+
+        def cache_info() -> AsyncTTLCacheInfo:
+            return AsyncTTLCacheInfo(currsize=len(cache), maxsize=maxsize, **stats)
+
+        def cache_clear():
+            cache.clear()
+            for name in stats:
+                stats[name] = 0
 
-        memoize.cache_clear = lambda: cache.clear()
+        memoize.cache_info = cache_info
+        memoize.cache_clear = cache_clear
         return memoize
 
     return decorator
@@ -1,18 +1,17 @@
 #!/usr/bin/env python
 
 import asyncio
-from async_timeout import timeout
 import logging
-from typing import (
-    Optional,
-    Coroutine,
-    NamedTuple,
-    Callable
-)
+import time
+from collections import deque
+from typing import Callable, Coroutine, Deque, Dict, Hashable, NamedTuple, Optional, Set
+
+from async_timeout import timeout
 
 import hummingbot
-from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
 
 
 class AsyncCallSchedulerItem(NamedTuple):
@@ -20,9 +19,18 @@ class AsyncCallSchedulerItem(NamedTuple):
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    key: Optional[Hashable] = None
+    scheduled_time: float = 0.0
 
 
 class AsyncCallScheduler:
+    """
+    Runs the scheduled calls in the background, waiting `call_interval` seconds after each call.
+
+    With `max_concurrency` = 1 (the default) the calls run one at a time, in the order they were scheduled.
+    With a higher `max_concurrency` up to that many calls run at the same time, and only the calls scheduled with the
+    same key (e.g. the same order id or account) keep running one at a time in the order they were scheduled.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -38,11 +46,20 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = 1):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
         self._coro_queue: asyncio.Queue = asyncio.Queue()
         self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # Calls waiting behind a running call with the same key, by key (concurrent mode only)
+        self._key_queues: Dict[Hashable, Deque[AsyncCallSchedulerItem]] = {}
+        self._call_tasks: Set[asyncio.Task] = set()
+        self._queue_depth: int = 0
+        self._running_calls: int = 0
+        self._wait_time_histogram: LatencyHistogram = LatencyHistogram()
 
     @property
     def coro_queue(self) -> asyncio.Queue:
@@ -56,62 +73,173 @@ class AsyncCallScheduler:
     def started(self) -> bool:
         return self._coro_scheduler_task is not None
 
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of scheduled calls not started yet.
+        """
+        return self._queue_depth
+
+    @property
+    def running_calls(self) -> int:
+        return self._running_calls
+
+    @property
+    def wait_time_histogram(self) -> LatencyHistogram:
+        """
+        Seconds the calls waited between being scheduled and being started.
+        """
+        return self._wait_time_histogram
+
     def start(self):
         if self._coro_scheduler_task is not None:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
+        if self._max_concurrency > 1:
+            self._coro_scheduler_task = safe_ensure_future(
+                self._concurrent_coro_scheduler(
+                    self._coro_queue,
+                    self._call_interval
+                )
+            )
+        else:
+            self._coro_scheduler_task = safe_ensure_future(
+                self._coro_scheduler(
+                    self._coro_queue,
+                    self._call_interval
+                )
             )
-        )
 
     def stop(self):
         if self._coro_scheduler_task is not None:
             self._coro_scheduler_task.cancel()
             self._coro_scheduler_task = None
+        for task in list(self._call_tasks):
+            task.cancel()
+        self._call_tasks.clear()
+        for key_queue in self._key_queues.values():
+            for item in key_queue:
+                self._discard(item)
+        self._key_queues.clear()
+
+    def _discard(self, item: AsyncCallSchedulerItem):
+        """
+        Cancels a scheduled call that did not start.
+        """
+        self._queue_depth -= 1
+        item.future.cancel()
+        if asyncio.iscoroutine(item.coroutine):
+            item.coroutine.close()
+        elif asyncio.isfuture(item.coroutine):
+            item.coroutine.cancel()
 
     async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
         while True:
-            app_warning_msg = "API call error."
+            item: AsyncCallSchedulerItem = await coro_queue.get()
+            await self._call(item)
+
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                await asyncio.sleep(interval)
             except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
                 raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
+            except Exception:
+                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+    async def _concurrent_coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._max_concurrency)
+        while True:
+            item: AsyncCallSchedulerItem = await coro_queue.get()
+            key_queue: Optional[Deque[AsyncCallSchedulerItem]] = self._key_queues.get(item.key)
+            if key_queue is not None:
+                # A call with the same key is running, this one runs after it.
+                key_queue.append(item)
+                continue
+            if item.key is not None:
+                self._key_queues[item.key] = deque()
+            task: asyncio.Task = safe_ensure_future(self._key_calls_runner(item, semaphore, interval))
+            self._call_tasks.add(task)
+            task.add_done_callback(self._call_tasks.discard)
+
+    async def _key_calls_runner(self,
+                                item: AsyncCallSchedulerItem,
+                                semaphore: asyncio.Semaphore,
+                                interval: float):
+        """
+        Runs the call, then the calls scheduled with the same key in the meantime, one at a time.
+        """
+        while item is not None:
             try:
-                await asyncio.sleep(interval)
+                await semaphore.acquire()
             except asyncio.CancelledError:
+                # Stopped while waiting for a slot, the call never started
+                self._discard(item)
                 raise
+            try:
+                await self._call(item)
+                try:
+                    await asyncio.sleep(interval)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+            finally:
+                semaphore.release()
+            key_queue: Optional[Deque[AsyncCallSchedulerItem]] = self._key_queues.get(item.key)
+            if key_queue:
+                item = key_queue.popleft()
+            else:
+                self._key_queues.pop(item.key, None)
+                item = None
+
+    async def _call(self, item: AsyncCallSchedulerItem):
+        fut: asyncio.Future = item.future
+        app_warning_msg: str = item.app_warning_msg
+        self._queue_depth -= 1
+        self._running_calls += 1
+        self._wait_time_histogram.add(time.perf_counter() - item.scheduled_time)
+        try:
+            async with timeout(item.timeout_seconds):
+                fut.set_result(await item.coroutine)
+        except asyncio.CancelledError:
+            try:
+                fut.cancel()
             except Exception:
-                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+                pass
+            raise
+        except asyncio.InvalidStateError:
+            # The future is already cancelled from outside. Ignore.
+            pass
+        except Exception as e:
+            # Add exception information.
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            try:
+                fut.set_exception(e)
+            except Exception:
+                pass
+        finally:
+            self._running_calls -= 1
 
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  key: Optional[Hashable] = None) -> any:
+        """
+        :param key: with max_concurrency > 1, the calls with the same key run one at a time in the order they were
+        scheduled (None for a call that does not need to be ordered with the others)
+        """
         fut: asyncio.Future = self._ev_loop.create_future()
         self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+                                                           app_warning_msg=app_warning_msg,
+                                                           key=key,
+                                                           scheduled_time=time.perf_counter()))
+        self._queue_depth += 1
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
@@ -119,10 +247,20 @@ class AsyncCallScheduler:
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         key: Optional[Hashable] = None) -> any:
+        if self._max_concurrency == 1 or key is None:
+            # Unordered calls are submitted to the executor right away, the scheduler only waits for their result
+            return await self.schedule_async_call(
+                self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args),
+                timeout_seconds,
+                app_warning_msg=app_warning_msg,
+                key=key)
+
+        async def executor_call():
+            # The function is only submitted to the executor when the scheduler runs the call, so that the calls
+            # with the same key do not run at the same time in the executor threads
+            return await self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+
+        return await self.schedule_async_call(executor_call(), timeout_seconds, app_warning_msg=app_warning_msg,
+                                              key=key)
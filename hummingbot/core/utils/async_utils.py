@@ -3,6 +3,8 @@ import logging
 import time
 import inspect
 
+from hummingbot.core.utils.loop_monitor import LoopMonitor, coroutine_name
+
 
 async def safe_wrapper(c):
     try:
@@ -14,7 +16,12 @@ async def safe_wrapper(c):
 
 
 def safe_ensure_future(coro, *args, **kwargs):
-    return asyncio.ensure_future(safe_wrapper(coro), *args, **kwargs)
+    task = asyncio.ensure_future(safe_wrapper(coro), *args, **kwargs)
+    # Named after the wrapped coroutine for the event loop instrumentation
+    name = coroutine_name(coro)
+    task.set_name(name)
+    LoopMonitor.get_instance().task_created(name)
+    return task
 
 
 async def safe_gather(*args, **kwargs):
@@ -0,0 +1,75 @@
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+# Bucket upper bounds in seconds, doubling from 100 microseconds up to ~13 seconds
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = tuple(0.0001 * 2 ** i for i in range(18))
+
+
+class LatencyHistogram:
+    """
+    Fixed buckets histogram of durations (in seconds). Adding a sample is O(log(buckets)) and the memory used does not
+    grow with the number of samples, so it can stay enabled for the whole life of the bot.
+    Percentiles are estimated as the upper bound of the bucket containing them (capped by the maximum sample).
+    """
+
+    def __init__(self, bucket_bounds: Optional[Sequence[float]] = None):
+        self._bucket_bounds: Tuple[float, ...] = tuple(bucket_bounds or DEFAULT_LATENCY_BUCKETS)
+        # The last bucket holds the samples above the last bound
+        self._bucket_counts: List[int] = [0] * (len(self._bucket_bounds) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def bucket_bounds(self) -> Tuple[float, ...]:
+        return self._bucket_bounds
+
+    @property
+    def bucket_counts(self) -> List[int]:
+        return self._bucket_counts.copy()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else 0.0
+
+    def add(self, value: float):
+        self._bucket_counts[bisect_left(self._bucket_bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        :param percent: the percentile to estimate, between 0 and 100
+        :return: the estimated value, 0 if there are no samples
+        """
+        if self._count == 0:
+            return 0.0
+        rank = percent / 100 * self._count
+        accumulated = 0
+        for index, bucket_count in enumerate(self._bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= rank and bucket_count > 0:
+                if index < len(self._bucket_bounds):
+                    return min(self._bucket_bounds[index], self._max)
+                break
+        return self._max
+
+    def reset(self):
+        self._bucket_counts = [0] * (len(self._bucket_bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
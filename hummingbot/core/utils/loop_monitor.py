@@ -0,0 +1,207 @@
+import asyncio
+import functools
+import logging
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+MetricSample = Tuple[str, Dict[str, str], float]
+
+
+class LoopMonitor:
+    """
+    Instruments the asyncio event loop shared by the whole bot:
+    - the loop lag, measured as the delay of a periodic sleep;
+    - the callbacks taking longer than `slow_callback_duration`, with the coroutine or function they run. They are
+      timed at the same point as the asyncio debug mode (`Handle._run`), without its other overheads;
+    - the live tasks and the tasks created with `safe_ensure_future`, by coroutine name;
+    - the size of the registered queues (e.g. the order book and user stream tracker queues).
+    """
+
+    _shared_instance: Optional["LoopMonitor"] = None
+
+    LAG_SAMPLE_INTERVAL = 0.5
+    SLOW_CALLBACK_DURATION = 0.1
+    MAX_SLOW_CALLBACK_SOURCES = 200
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    @classmethod
+    def get_instance(cls) -> "LoopMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = LoopMonitor()
+        return cls._shared_instance
+
+    def __init__(self,
+                 lag_sample_interval: float = LAG_SAMPLE_INTERVAL,
+                 slow_callback_duration: float = SLOW_CALLBACK_DURATION):
+        self._lag_sample_interval = lag_sample_interval
+        self._slow_callback_duration = slow_callback_duration
+        self._lag_histogram = LatencyHistogram()
+        self._last_lag: float = 0.0
+        self._slow_callbacks: Dict[str, LatencyHistogram] = {}
+        self._created_tasks: Counter = Counter()
+        self._queues: "WeakKeyDictionary[asyncio.Queue, str]" = WeakKeyDictionary()
+        self._lag_sampling_task: Optional[asyncio.Task] = None
+        self._original_handle_run: Optional[Callable] = None
+
+    @property
+    def started(self) -> bool:
+        return self._lag_sampling_task is not None
+
+    @property
+    def lag_histogram(self) -> LatencyHistogram:
+        return self._lag_histogram
+
+    @property
+    def last_lag(self) -> float:
+        return self._last_lag
+
+    @property
+    def slow_callbacks(self) -> Dict[str, LatencyHistogram]:
+        return self._slow_callbacks.copy()
+
+    @property
+    def created_tasks(self) -> Dict[str, int]:
+        return dict(self._created_tasks)
+
+    def start(self):
+        if self.started:
+            return
+        self._lag_sampling_task = asyncio.ensure_future(self._lag_sampling_loop())
+        self._install_callback_timer()
+
+    def stop(self):
+        if self._lag_sampling_task is not None:
+            self._lag_sampling_task.cancel()
+            self._lag_sampling_task = None
+        if self._original_handle_run is not None:
+            asyncio.events.Handle._run = self._original_handle_run
+            self._original_handle_run = None
+
+    def reset(self):
+        self._lag_histogram.reset()
+        self._slow_callbacks.clear()
+        self._created_tasks.clear()
+
+    def task_created(self, coroutine_name: str):
+        if self.started:
+            self._created_tasks[coroutine_name] += 1
+
+    def register_queue(self, queue: asyncio.Queue, name: str):
+        self._queues[queue] = name
+
+    def queue_backlogs(self) -> Dict[str, int]:
+        """
+        :return: the number of items waiting in the registered queues, summed by queue name
+        """
+        backlogs: Dict[str, int] = {}
+        for queue, name in list(self._queues.items()):
+            backlogs[name] = backlogs.get(name, 0) + queue.qsize()
+        return backlogs
+
+    def live_tasks(self) -> Dict[str, int]:
+        """
+        :return: the number of tasks not done, by coroutine name
+        """
+        counts: Counter = Counter(task_name(task) for task in asyncio.all_tasks(asyncio.get_event_loop()))
+        return dict(counts)
+
+    def metrics(self) -> List[MetricSample]:
+        samples: List[MetricSample] = [
+            ("event_loop_lag_seconds", {"stat": "last"}, self._last_lag),
+            ("event_loop_lag_seconds", {"stat": "mean"}, self._lag_histogram.mean),
+            ("event_loop_lag_seconds", {"stat": "p99"}, self._lag_histogram.percentile(99)),
+            ("event_loop_lag_seconds", {"stat": "max"}, self._lag_histogram.max),
+        ]
+        samples.extend(("event_loop_live_tasks", {"coroutine": name}, count)
+                       for name, count in self.live_tasks().items())
+        samples.extend(("event_loop_created_tasks_total", {"coroutine": name}, count)
+                       for name, count in self._created_tasks.items())
+        samples.extend(("event_loop_slow_callbacks_total", {"source": source}, histogram.count)
+                       for source, histogram in self._slow_callbacks.items())
+        samples.extend(("event_loop_slow_callbacks_seconds_max", {"source": source}, histogram.max)
+                       for source, histogram in self._slow_callbacks.items())
+        samples.extend(("queue_backlog", {"queue": name}, size) for name, size in self.queue_backlogs().items())
+        return samples
+
+    async def _lag_sampling_loop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._lag_sample_interval)
+            self._last_lag = max(loop.time() - start - self._lag_sample_interval, 0.0)
+            self._lag_histogram.add(self._last_lag)
+
+    def _install_callback_timer(self):
+        original_run = asyncio.events.Handle._run
+        self._original_handle_run = original_run
+        monitor = self
+
+        @functools.wraps(original_run)
+        def _timed_run(handle: asyncio.Handle):
+            start = time.perf_counter()
+            original_run(handle)
+            duration = time.perf_counter() - start
+            if duration >= monitor._slow_callback_duration:
+                monitor._record_slow_callback(handle, duration)
+
+        asyncio.events.Handle._run = _timed_run
+
+    def _record_slow_callback(self, handle: asyncio.Handle, duration: float):
+        source = callback_source(handle)
+        histogram = self._slow_callbacks.get(source)
+        if histogram is None:
+            if len(self._slow_callbacks) >= self.MAX_SLOW_CALLBACK_SOURCES:
+                source = "other"
+                histogram = self._slow_callbacks.setdefault(source, LatencyHistogram())
+            else:
+                histogram = self._slow_callbacks[source] = LatencyHistogram()
+        histogram.add(duration)
+        self.logger().debug(f"Slow event loop callback {source} took {duration:.3f}s.",
+                            extra={"loop_callback_source": source, "loop_callback_duration": duration})
+
+
+def coroutine_name(coro: Any) -> str:
+    return getattr(coro, "__qualname__", None) or type(coro).__name__
+
+
+def task_name(task: asyncio.Task) -> str:
+    """
+    The name of the coroutine run by the task. The tasks created by `safe_ensure_future` run a `safe_wrapper`
+    coroutine and are named after the wrapped coroutine.
+    """
+    name = coroutine_name(task.get_coro())
+    if name == "safe_wrapper":
+        name = task.get_name()
+    return name
+
+
+def callback_source(handle: asyncio.Handle) -> str:
+    callback = handle._callback
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        name = task_name(owner)
+        if code is not None and name == coroutine_name(coro):
+            return f"{name} ({code.co_filename}:{code.co_firstlineno})"
+        return name
+    code = getattr(callback, "__code__", None)
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    if code is not None:
+        return f"{name} ({code.co_filename}:{code.co_firstlineno})"
+    return name
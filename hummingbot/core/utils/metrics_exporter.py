@@ -0,0 +1,66 @@
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_EXPORTER_HOST = "127.0.0.1"
+
+
+class MetricsExporter:
+    """
+    Serves the metrics of a `MetricsRegistry` on `GET /metrics`, to be scraped by Prometheus (pull model).
+    The server only listens on the loopback interface, and rendering the metrics is done on demand, so the exporter
+    costs nothing to the bot between scrapes.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, port: int, registry: Optional[MetricsRegistry] = None, host: str = METRICS_EXPORTER_HOST):
+        self._host = host
+        self._port = port
+        self._registry = registry or MetricsRegistry.get_instance()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    async def start(self):
+        if self.started:
+            return
+        app = web.Application()
+        app.add_routes([web.get("/metrics", self._handle_metrics)])
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, host=self._host, port=self._port)
+            await site.start()
+        except Exception:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        self.logger().info(f"Serving the performance metrics on http://{self._host}:{self._port}/metrics.")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._registry.render().encode("utf-8"),
+                            headers={"Content-Type": METRICS_CONTENT_TYPE})
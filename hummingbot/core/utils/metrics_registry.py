@@ -0,0 +1,272 @@
+import logging
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+METRICS_PREFIX = "hummingbot_"
+
+MetricValue = Union[int, float, LatencyHistogram]
+MetricSample = Tuple[str, Dict[str, str], MetricValue]
+MetricsCollectorFunction = Callable[[], Iterable[MetricSample]]
+
+
+class CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class GaugeValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+class Metric:
+    """
+    A metric family, with one child value per combination of label values.
+    The values are plain Python objects updated without locks: all the updates happen in the event loop thread, and
+    the children can be resolved once (with `labels`) and kept by the instrumented code to avoid the lookups.
+    """
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self._name = name
+        self._documentation = documentation
+        self._label_names: Tuple[str, ...] = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def documentation(self) -> str:
+        return self._documentation
+
+    @property
+    def label_names(self) -> Tuple[str, ...]:
+        return self._label_names
+
+    def labels(self, *label_values: Any):
+        label_values = tuple(str(value) for value in label_values)
+        child = self._children.get(label_values)
+        if child is None:
+            if len(label_values) != len(self._label_names):
+                raise ValueError(f"Metric {self._name} expects the labels {self._label_names}, got {label_values}.")
+            child = self._new_child()
+            self._children[label_values] = child
+        return child
+
+    def remove(self, *label_values: Any):
+        self._children.pop(tuple(str(value) for value in label_values), None)
+
+    def samples(self) -> List[MetricSample]:
+        return [(self._name, dict(zip(self._label_names, label_values)), self._child_value(child))
+                for label_values, child in list(self._children.items())]
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _child_value(self, child) -> MetricValue:
+        return child.value
+
+
+class CounterMetric(Metric):
+    metric_type = "counter"
+
+    def _new_child(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+
+class GaugeMetric(Metric):
+    metric_type = "gauge"
+
+    def _new_child(self) -> GaugeValue:
+        return GaugeValue()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class HistogramMetric(Metric):
+    metric_type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 label_names: Sequence[str] = (),
+                 bucket_bounds: Optional[Sequence[float]] = None):
+        super().__init__(name, documentation, label_names)
+        self._bucket_bounds = bucket_bounds
+
+    def _new_child(self) -> LatencyHistogram:
+        return LatencyHistogram(self._bucket_bounds)
+
+    def _child_value(self, child: LatencyHistogram) -> LatencyHistogram:
+        return child
+
+    def observe(self, value: float):
+        self.labels().add(value)
+
+
+class MetricsRegistry:
+    """
+    Local registry of the bot metrics, rendered in the Prometheus text exposition format by the metrics exporter.
+    Besides the metrics updated by the instrumented code, collector functions registered with `register_collector`
+    are called at each scrape to report values that are cheaper to compute on demand (e.g. queue sizes).
+    """
+
+    _shared_instance: Optional["MetricsRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = MetricsRegistry()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[MetricsCollectorFunction] = []
+
+    @property
+    def metrics(self) -> Dict[str, Metric]:
+        return self._metrics.copy()
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> CounterMetric:
+        return self._get_or_create(CounterMetric, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> GaugeMetric:
+        return self._get_or_create(GaugeMetric, name, documentation, label_names)
+
+    def histogram(self,
+                  name: str,
+                  documentation: str,
+                  label_names: Sequence[str] = (),
+                  bucket_bounds: Optional[Sequence[float]] = None) -> HistogramMetric:
+        return self._get_or_create(HistogramMetric, name, documentation, label_names, bucket_bounds=bucket_bounds)
+
+    def register_collector(self, collector: MetricsCollectorFunction):
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def unregister_collector(self, collector: MetricsCollectorFunction):
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def collect(self) -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], MetricValue]]]]:
+        """
+        :return: the metric families as (name, type, documentation, [(labels, value)]), the samples from the
+        collectors are grouped by name and typed after their values
+        """
+        families = []
+        for metric in list(self._metrics.values()):
+            families.append((metric.name, metric.metric_type, metric.documentation,
+                             [(labels, value) for _, labels, value in metric.samples()]))
+        collected: Dict[str, List[Tuple[Dict[str, str], MetricValue]]] = {}
+        for collector in list(self._collectors):
+            try:
+                for name, labels, value in collector():
+                    collected.setdefault(name, []).append((labels, value))
+            except Exception:
+                self.logger().error("Unexpected error collecting metrics.", exc_info=True)
+        for name, samples in collected.items():
+            if isinstance(samples[0][1], LatencyHistogram):
+                metric_type = "histogram"
+            elif name.endswith("_total"):
+                metric_type = "counter"
+            else:
+                metric_type = "gauge"
+            families.append((name, metric_type, "", samples))
+        return families
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, metric_type, documentation, samples in self.collect():
+            full_name = f"{METRICS_PREFIX}{name}"
+            if documentation:
+                lines.append(f"# HELP {full_name} {_escape_help(documentation)}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for labels, value in samples:
+                if isinstance(value, LatencyHistogram):
+                    lines.extend(_histogram_lines(full_name, labels, value))
+                else:
+                    lines.append(f"{full_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, metric_class, name: str, documentation: str, label_names: Sequence[str], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = metric_class(name, documentation, label_names, **kwargs)
+            self._metrics[name] = metric
+        elif type(metric) is not metric_class or metric.label_names != tuple(label_names):
+            raise ValueError(f"The metric {name} is already registered as a {metric.metric_type} with the labels "
+                             f"{metric.label_names}.")
+        return metric
+
+
+def _histogram_lines(full_name: str, labels: Dict[str, str], histogram: LatencyHistogram) -> List[str]:
+    lines = []
+    accumulated = 0
+    bucket_counts = histogram.bucket_counts
+    for bound, count in zip(histogram.bucket_bounds, bucket_counts):
+        accumulated += count
+        lines.append(f"{full_name}_bucket{_format_labels(labels, le=_format_value(bound))} {accumulated}")
+    lines.append(f"{full_name}_bucket{_format_labels(labels, le='+Inf')} {histogram.count}")
+    lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+    lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+    return lines
+
+
+def _format_labels(labels: Dict[str, str], **extra_labels: str) -> str:
+    all_labels = {**labels, **extra_labels}
+    if len(all_labels) == 0:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(str(value))}"' for key, value in all_labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,61 @@
+import time
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator, Optional
+
+if typing.TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+
+class OrderStage(Enum):
+    """
+    The stages of the creation of an order, in the order they are expected to happen.
+    """
+    DECISION = "decision"  # start of the strategy tick that decided to create the order
+    SUBMITTED = "submitted"  # buy/sell call on the connector
+    THROTTLER_ACQUIRED = "throttler_acquired"  # rate limit capacity obtained for the order request
+    REQUEST_SENT = "request_sent"
+    RESPONSE_RECEIVED = "response_received"
+    EXCHANGE_ACK = "exchange_ack"  # first update reporting the order as created on the exchange
+    FIRST_FILL = "first_fill"
+
+
+ORDER_STAGES = tuple(OrderStage)
+
+# perf_counter() value at the start of the current strategy tick
+_strategy_tick_start: ContextVar[Optional[float]] = ContextVar("strategy_tick_start", default=None)
+# The order whose creation request is being sent by the current task
+_traced_order: ContextVar[Optional["InFlightOrder"]] = ContextVar("traced_order", default=None)
+
+
+def strategy_tick_started():
+    """
+    Called by the strategies when a tick starts. The orders submitted from the tick (and the tasks created by it)
+    record the time as their decision stage.
+    """
+    _strategy_tick_start.set(time.perf_counter())
+
+
+def strategy_tick_start() -> Optional[float]:
+    return _strategy_tick_start.get()
+
+
+@contextmanager
+def traced_order(order: Optional["InFlightOrder"]) -> Iterator[None]:
+    """
+    Makes the stages recorded with `record_traced_order_stage` by the code run in the context (e.g. the throttler and
+    the REST assistant) apply to the order.
+    """
+    token = _traced_order.set(order)
+    try:
+        yield
+    finally:
+        _traced_order.reset(token)
+
+
+def record_traced_order_stage(stage: OrderStage):
+    order = _traced_order.get()
+    if order is not None:
+        order.record_stage(stage)
@@ -1,11 +1,15 @@
+import json
 import logging
+import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
+from hummingbot.client.settings import TRADING_PAIRS_CACHE_PATH, AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
+
+TRADING_PAIRS_CACHE_TTL = 60 * 60 * 24
 
 
 class TradingPairFetcher:
@@ -28,6 +32,8 @@ class TradingPairFetcher:
     def __init__(self, client_config_map: ClientConfigAdapter):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        # connector name -> {"timestamp": last fetch time, "trading_pairs": [...]}
+        self._trading_pairs_cache: Dict[str, Dict[str, Any]] = {}
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -38,24 +44,32 @@ class TradingPairFetcher:
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         if connector_setting.uses_gateway_generic_connector():
             connector_params = connector_setting.name.split("_")
-            safe_ensure_future(self.call_fetch_pairs(
+            return safe_ensure_future(self.call_fetch_pairs(
                 connector.all_trading_pairs(connector_params[1], connector_params[2]), connector_name))
         else:
-            safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            return safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        """
+        Serves the trading pairs stored in the cache right away, and only fetches from the connectors the trading
+        pairs that are missing from the cache or older than TRADING_PAIRS_CACHE_TTL.
+        """
+        self._load_trading_pairs_cache()
         connector_settings = self._all_connector_settings()
+        fetch_tasks = []
         for conn_setting in connector_settings.values():
+            if self._is_cached(conn_setting.name):
+                continue
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(
                         connector_setting=connector_settings[conn_setting.parent_name],
                         connector_name=conn_setting.name
-                    )
+                    ))
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(connector_setting=conn_setting))
             except ModuleNotFoundError:
                 continue
             except Exception:
@@ -64,15 +78,55 @@ class TradingPairFetcher:
 
         self.ready = True
 
+        if len(fetch_tasks) > 0:
+            await safe_gather(*fetch_tasks, return_exceptions=True)
+            self._save_trading_pairs_cache()
+
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._trading_pairs_cache[exchange_name] = {"timestamp": time.time(), "trading_pairs": list(pairs)}
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cached pairs if any or just assign empty list,
+            # this is st. the bot won't stop working
+            self.trading_pairs.setdefault(exchange_name, [])
+
+    def _is_cached(self, connector_name: str) -> bool:
+        cache_entry = self._trading_pairs_cache.get(connector_name)
+        return cache_entry is not None and time.time() - cache_entry["timestamp"] < TRADING_PAIRS_CACHE_TTL
+
+    def _load_trading_pairs_cache(self):
+        try:
+            with open(TRADING_PAIRS_CACHE_PATH) as fd:
+                cache = json.load(fd)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        # Malformed entries are dropped, their trading pairs are fetched again from the connector
+        self._trading_pairs_cache = {
+            connector_name: cache_entry
+            for connector_name, cache_entry in cache.items()
+            if self._is_valid_cache_entry(cache_entry)
+        }
+        for connector_name, cache_entry in self._trading_pairs_cache.items():
+            self.trading_pairs[connector_name] = cache_entry["trading_pairs"]
+
+    @staticmethod
+    def _is_valid_cache_entry(cache_entry: Any) -> bool:
+        return (isinstance(cache_entry, dict)
+                and isinstance(cache_entry.get("timestamp"), (int, float))
+                and isinstance(cache_entry.get("trading_pairs"), list))
+
+    def _save_trading_pairs_cache(self):
+        try:
+            with open(TRADING_PAIRS_CACHE_PATH, "w") as fd:
+                json.dump(self._trading_pairs_cache, fd)
+        except OSError:
+            self.logger().warning("Could not save the trading pairs cache.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
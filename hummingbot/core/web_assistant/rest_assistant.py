@@ -1,15 +1,22 @@
 import json
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+from hummingbot.core.utils.order_tracing import OrderStage, record_traced_order_stage
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+REST_REQUEST_METRIC = MetricsRegistry.get_instance().histogram(
+    "rest_request_seconds", "Round trip time of the REST requests, by rate limit id.", ("method", "limit_id")
+)
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -81,7 +88,13 @@ class RESTAssistant:
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
+        record_traced_order_stage(OrderStage.REQUEST_SENT)
+        start = time.perf_counter()
         resp = await wait_for(self._connection.call(request), timeout)
+        record_traced_order_stage(OrderStage.RESPONSE_RECEIVED)
+        REST_REQUEST_METRIC.labels(request.method.name, request.throttler_limit_id or "other").add(
+            time.perf_counter() - start
+        )
         resp = await self._post_process_response(resp)
         return resp
 
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, NAN, sqrt
 
 
 pmm_logger = None
@@ -18,22 +19,98 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_stats()
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+    cdef void c_add_value(self, double val):
+        # Running sum and sum of squared deviations are updated with Welford's algorithm, extended to the sliding
+        # window by replacing the evicted value instead of only appending, so the stats are O(1) per sample.
+        cdef:
+            int64_t size = self.c_size()
+            double new_value
+            double old_value
+            double old_mean
+            double new_mean
+
+        old_mean = self._sum / size if size > 0 else 0.0
+        if self._is_full:
+            old_value = self._buffer[self._delimiter]
+            self._buffer[self._delimiter] = val
+            new_value = val
+            self._sum += new_value - old_value
+            new_mean = self._sum / size
+            self._sum_sq_dev += (new_value - old_value) * (new_value - new_mean + old_value - old_mean)
+        else:
+            self._buffer[self._delimiter] = val
+            new_value = val
+            self._sum += new_value
+            new_mean = self._sum / (size + 1)
+            self._sum_sq_dev += (new_value - old_mean) * (new_value - new_mean)
         self.c_increment_delimiter()
 
+        # Resynchronize with an exact two-pass computation once per buffer cycle (amortized O(1)) so rounding errors
+        # do not accumulate, and right away whenever non-finite values went through the buffer.
+        if self._delimiter == 0 or not isfinite(self._sum) or not isfinite(self._sum_sq_dev):
+            self.c_recalculate_stats()
+
+    cdef void c_add_values(self, const np.float64_t[:] values):
+        cdef:
+            int64_t count = values.shape[0]
+            int64_t head_count
+
+        if count == 0:
+            return
+        if count >= self._length:
+            # Only the latest values fit in the buffer
+            self._buffer[:] = values[count - self._length:]
+            self._delimiter = 0
+            self._is_full = True
+        else:
+            head_count = min(count, self._length - self._delimiter)
+            self._buffer[self._delimiter:self._delimiter + head_count] = values[:head_count]
+            self._buffer[:count - head_count] = values[head_count:]
+            self._is_full = self._is_full or self._delimiter + count >= self._length
+            self._delimiter = (self._delimiter + count) % self._length
+        self.c_recalculate_stats()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_reset_stats(self):
+        self._sum = 0.0
+        self._sum_sq_dev = 0.0
+
+    cdef void c_recalculate_stats(self):
+        cdef:
+            int64_t size = self.c_size()
+            int64_t i
+            double mean
+            double deviation
+
+        self.c_reset_stats()
+        if size == 0:
+            return
+        for i in range(size):
+            self._sum += self._buffer[i]
+        mean = self._sum / size
+        for i in range(size):
+            deviation = self._buffer[i] - mean
+            self._sum_sq_dev += deviation * deviation
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        if self._is_full:
+            return self._buffer[self._delimiter]
+        return self._buffer[0]
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
@@ -42,46 +119,101 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        return self._sum
+
+    cdef double c_window_mean(self):
+        cdef int64_t size = self.c_size()
+        if size == 0:
+            return NAN
+        return self._sum / size
+
+    cdef double c_window_variance(self):
+        cdef int64_t size = self.c_size()
+        if size == 0:
+            return NAN
+        # Rounding may leave a tiny negative residue when all samples are equal
+        return max(self._sum_sq_dev, 0.0) / size
+
     cdef double c_mean_value(self):
-        result = np.nan
+        result = NAN
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_window_mean()
         return result
 
     cdef double c_variance(self):
-        result = np.nan
+        result = NAN
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_window_variance()
         return result
 
     cdef double c_std_dev(self):
-        result = np.nan
+        result = NAN
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_window_variance())
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
+
+        if not self._is_full:
+            return buffer[:self._delimiter].copy()
+        if self._delimiter == 0:
+            return buffer.copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
+
+    cdef tuple c_get_views(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
+            tuple views
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            views = (buffer[:self._delimiter],)
+        elif self._delimiter == 0:
+            views = (buffer[:],)
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            views = (buffer[self._delimiter:], buffer[:self._delimiter])
+        for view in views:
+            view.flags.writeable = False
+        return views
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_stats()
+
+    def __len__(self):
+        return self.c_size()
 
     def add_value(self, val):
         self.c_add_value(val)
 
+    def add_values(self, values):
+        """
+        Bulk ingestion of samples, e.g. to warm start from historical data. Equivalent to calling add_value for every
+        element of values, in order.
+        """
+        self.c_add_values(np.ascontiguousarray(values, dtype=np.float64))
+
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_views(self):
+        """
+        Read-only views of the buffer contents, oldest first, without copying them. The contents are split in two
+        views when they wrap around the end of the underlying array, otherwise a single view is returned.
+        The views share memory with the buffer, so their contents change as new values are added.
+        """
+        return self.c_get_views()
+
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +221,22 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def window_mean(self) -> float:
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self) -> float:
+        return self.c_window_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +261,6 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_stats()
 
-        for val in data[-value:]:
-            self.add_value(val)
+        self.add_values(data[-value:])
@@ -1,5 +1,4 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +6,40 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._reset_weighted_sums()
+
+    def _reset_weighted_sums(self):
+        # Equivalent to pandas ewm(span=sampling_length, adjust=True) over the sampling window, kept as running
+        # weighted sums: the newest sample has weight 1 and every older one is decayed by (1 - alpha)
+        self._decay = 1 - 2 / (self.sampling_length + 1)
+        self._oldest_weight = self._decay ** self.sampling_length
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+
+    def add_sample(self, value: float):
+        evicted_value = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else None
+        self._sampling_buffer.add_value(value)
+        self._weighted_sum = self._decay * self._weighted_sum + self._sampling_buffer.get_last_value()
+        if evicted_value is None:
+            self._weights_sum = self._decay * self._weights_sum + 1
+        else:
+            self._weighted_sum -= self._oldest_weight * evicted_value
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._reset_weighted_sums()
+        for sample in self._sampling_buffer.get_as_numpy_array():
+            self._weighted_sum = self._decay * self._weighted_sum + sample
+            self._weights_sum = self._decay * self._weights_sum + 1
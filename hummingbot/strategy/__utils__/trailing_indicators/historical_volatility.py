@@ -1,18 +1,38 @@
+import math
+
+from ..ring_buffer import RingBuffer
 from .base_trailing_indicator import BaseTrailingIndicator
-import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between consecutive samples of the sampling window, kept with running statistics so the
+        # variance doesn't need to be recalculated over the whole window on every new sample
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+        self._last_log_price = None
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        price = self._sampling_buffer.get_last_value()
+        log_price = math.log(price) if price > 0 else math.nan
+        if self._last_log_price is not None:
+            self._log_returns.add_value(log_price - self._last_log_price)
+        self._last_log_price = log_price
+        if len(self._log_returns) == 0:
+            return 0.0
+        variance = self._log_returns.window_variance
+        # Invalid samples count as zero volatility, same as the processing calculation always did
+        return variance if math.isfinite(variance) else 0.0
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if len(self._processing_buffer) > 0:
+            return math.sqrt(self._processing_buffer.window_mean)
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns.length = max(value - 1, 1)
@@ -1,19 +1,39 @@
+import math
+
+from ..ring_buffer import RingBuffer
 from .base_trailing_indicator import BaseTrailingIndicator
-import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Squared differences between consecutive samples of the sampling window. Its running sum replaces the
+        # recalculation over the whole window on every new sample.
+        self._squared_diffs = RingBuffer(max(sampling_length - 1, 1))
+        self._last_price = None
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        price = self._sampling_buffer.get_last_value()
+        if self._last_price is not None:
+            self._squared_diffs.add_value((price - self._last_price) ** 2)
+        self._last_price = price
+        if self._sampling_buffer.length < 2:
+            return 0.0
+        vol = math.sqrt(max(self._squared_diffs.sum, 0.0) / len(self._sampling_buffer))
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._squared_diffs.length = max(value - 1, 1)
@@ -13,17 +13,35 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _trade_sample_timestamps
+        dict _trades_consolidated
+        dict _price_level_trade_counts
+        double _fit_weights_sum
+        double _fit_wx_sum
+        double _fit_wy_sum
+        double _fit_wxx_sum
+        double _fit_wxy_sum
+        int64_t _fit_updates
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
+        int _curve_fit_interval
+        int _estimations_since_curve_fit
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount)
+    cdef c_remove_oldest_trade_sample(self)
+    cdef c_update_price_level(self, double price_level, double amount, int trades_count)
+    cdef c_update_fit_sums(self, double price_level, double amount, double sign)
+    cdef c_recalculate_fit_sums(self)
     cdef c_estimate_intensity(self)
+    cdef c_refine_intensity(self)
 
 cdef class TradesForwarder(EventListener):
     cdef:
@@ -2,7 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
+from bisect import bisect_left, insort
 from typing import Tuple
 
 import numpy as np
@@ -17,6 +17,11 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+from libc.math cimport exp, log
+
+# Trading intensity used instead of 0 when taking the logarithm of a price level intensity
+cdef double s_min_intensity = 1e-10
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -27,10 +32,33 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 curve_fit_interval: int = 1):
+        """
+        :param order_book: the order book whose trades are sampled
+        :param price_delegate: provides the mid price the trades are compared against
+        :param sampling_length: the number of quote timestamps with trades used for the estimation
+        :param curve_fit_interval: if greater than 0, every curve_fit_interval estimations the closed form estimation
+        is refined with a non-linear least squares fit, and kept until the next refinement. If 0, only the closed form
+        estimation is used, updated on every calculation.
+        """
         self._alpha = 0
         self._kappa = 0
+        # Trades (price level, amount) grouped by the timestamp of the quote preceding them
         self._trade_samples = {}
+        self._trade_sample_timestamps = []
+        # Amount and number of trades per price level for all the trade samples, updated incrementally
+        self._trades_consolidated = {}
+        self._price_level_trade_counts = {}
+        self._fit_weights_sum = 0
+        self._fit_wx_sum = 0
+        self._fit_wy_sum = 0
+        self._fit_wxx_sum = 0
+        self._fit_wxy_sum = 0
+        self._fit_updates = 0
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +66,11 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = []
+        self._quote_prices = []
+        self._curve_fit_interval = curve_fit_interval
+        self._estimations_since_curve_fit = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +80,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,54 +96,58 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def curve_fit_interval(self) -> int:
+        return self._curve_fit_interval
+
+    @curve_fit_interval.setter
+    def curve_fit_interval(self, value: int):
+        self._curve_fit_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [float(quote["price"]) for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int64_t quote_idx
+            int64_t latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+            # Latest quote that happened before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx < 0:
+                continue
+            latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+            self.c_add_trade_to_sample(self._quote_timestamps[quote_idx] + 1,
+                                       abs(trade.price - self._quote_prices[quote_idx]),
+                                       trade.amount)
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_sample_timestamps) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -123,44 +159,117 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount):
+        trade_sample = self._trade_samples.get(sample_timestamp)
+        if trade_sample is None:
+            trade_sample = []
+            self._trade_samples[sample_timestamp] = trade_sample
+            insort(self._trade_sample_timestamps, sample_timestamp)
+        trade_sample.append((price_level, amount))
+        self.c_update_price_level(price_level, amount, 1)
+
+    cdef c_remove_oldest_trade_sample(self):
+        sample_timestamp = self._trade_sample_timestamps.pop(0)
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            self.c_update_price_level(price_level, -amount, -1)
+
+    cdef c_update_price_level(self, double price_level, double amount, int trades_count):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+            int previous_trades_count = self._price_level_trade_counts.get(price_level, 0)
+            double level_amount = amount
+
+        if previous_trades_count > 0:
+            level_amount += self._trades_consolidated[price_level]
+            self.c_update_fit_sums(price_level, self._trades_consolidated[price_level], -1)
+
+        if previous_trades_count + trades_count > 0:
+            self._trades_consolidated[price_level] = level_amount
+            self._price_level_trade_counts[price_level] = previous_trades_count + trades_count
+            self.c_update_fit_sums(price_level, level_amount, 1)
+        else:
+            del self._trades_consolidated[price_level]
+            del self._price_level_trade_counts[price_level]
+
+    cdef c_update_fit_sums(self, double price_level, double amount, double sign):
+        # The intensity a*exp(-k*t) is fitted as the line log(a) - k*t on log(lambda), weighting each price level with
+        # lambda^2 so the residuals approximate those of the fit in linear space
+        cdef:
+            double intensity = amount if amount > 0 else s_min_intensity
+            double weight = sign * intensity * intensity
+            double log_intensity = log(intensity)
+
+        self._fit_weights_sum += weight
+        self._fit_wx_sum += weight * price_level
+        self._fit_wy_sum += weight * log_intensity
+        self._fit_wxx_sum += weight * price_level * price_level
+        self._fit_wxy_sum += weight * price_level * log_intensity
+        self._fit_updates += 1
+
+    cdef c_recalculate_fit_sums(self):
+        self._fit_weights_sum = 0
+        self._fit_wx_sum = 0
+        self._fit_wy_sum = 0
+        self._fit_wxx_sum = 0
+        self._fit_wxy_sum = 0
+        for price_level, amount in self._trades_consolidated.items():
+            self.c_update_fit_sums(price_level, amount, 1)
+        self._fit_updates = 0
 
+    cdef c_estimate_intensity(self):
+        cdef:
+            double determinant
+            double slope
+            double intercept
+            double alpha = self._alpha
+            double kappa = self._kappa
+
+        if self._curve_fit_interval > 0 and self._estimations_since_curve_fit % self._curve_fit_interval != 0:
+            self._estimations_since_curve_fit += 1
+            return
+
+        # Resynchronize the running sums once they have been updated more times than there are price levels, so
+        # rounding errors don't accumulate while keeping the cost amortized O(1) per trade
+        if self._fit_updates > len(self._trades_consolidated):
+            self.c_recalculate_fit_sums()
+
+        determinant = self._fit_weights_sum * self._fit_wxx_sum - self._fit_wx_sum * self._fit_wx_sum
+        if len(self._trades_consolidated) > 1 and determinant > 0:
+            slope = (self._fit_weights_sum * self._fit_wxy_sum - self._fit_wx_sum * self._fit_wy_sum) / determinant
+            intercept = (self._fit_wy_sum - slope * self._fit_wx_sum) / self._fit_weights_sum
+            if slope > 0:
+                # Kappa is bounded to be non-negative, the best fit is then a constant intensity
+                slope = 0
+                intercept = self._fit_wy_sum / self._fit_weights_sum
+            alpha = exp(intercept)
+            kappa = -slope
+
+        if self._curve_fit_interval == 0:
+            self._alpha = alpha
+            self._kappa = kappa
+        else:
+            # Reuse previously calculated parameters as initial values, the closed form estimation for the first fit
+            if self._alpha == 0 and self._kappa == 0:
+                self._alpha = alpha
+                self._kappa = kappa
+            self.c_refine_intensity()
+            self._estimations_since_curve_fit = 1
+
+    cdef c_refine_intensity(self):
+        price_levels = np.fromiter(self._trades_consolidated.keys(), dtype=np.float64)
+        lambdas = np.fromiter(self._trades_consolidated.values(), dtype=np.float64)
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = s_min_intensity
 
-        # Fit the probability density function; reuse previously calculated parameters as initial values
+        # Fit the probability density function
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
-                               lambdas_adj,
+                               lambdas,
                                p0=(self._alpha, self._kappa),
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
+            self._kappa = params[0][1]
+            self._alpha = params[0][0]
         except (RuntimeError, ValueError) as e:
             pass
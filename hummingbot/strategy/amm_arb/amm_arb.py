@@ -24,7 +24,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.amm_arb.data_types import ArbProposalSide
 from hummingbot.strategy.amm_arb.utils import ArbProposal, create_arb_proposals
@@ -226,16 +226,16 @@ class AmmArbStrategy(StrategyPyBase):
         await self.execute_arb_proposals(profitable_arb_proposals)
 
     async def apply_gateway_transaction_cancel_interval(self):
-        # XXX (martin_kou): Concurrent cancellations are not supported before the nonce architecture is fixed.
-        # See: https://app.shortcut.com/coinalpha/story/24553/nonce-architecture-in-current-amm-trade-and-evm-approve-apis-is-incorrect-and-causes-trouble-with-concurrent-requests
         gateway_connectors: List[GatewayEVMAMM] = []
         if self.is_gateway_market(self._market_info_1):
             gateway_connectors.append(cast(GatewayEVMAMM, self._market_info_1.market))
         if self.is_gateway_market(self._market_info_2):
             gateway_connectors.append(cast(GatewayEVMAMM, self._market_info_2.market))
 
-        for gateway in gateway_connectors:
-            await gateway.cancel_outdated_orders(self._gateway_transaction_cancel_interval)
+        await safe_gather(*[
+            gateway.cancel_outdated_orders(self._gateway_transaction_cancel_interval)
+            for gateway in gateway_connectors
+        ])
 
     def apply_slippage_buffers(self, arb_proposals: List[ArbProposal]):
         """
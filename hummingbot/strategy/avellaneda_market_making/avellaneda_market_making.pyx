@@ -312,11 +312,11 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         return self.c_get_mid_price()
 
     cdef object c_get_mid_price(self):
-        return self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        return self.c_snapshot_mid_price(self._price_delegate.market, self._price_delegate.trading_pair)
 
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        return self._sb_order_tracker.market_pair_to_active_orders
+        return self.c_snapshot_active_orders()
 
     @property
     def active_orders(self) -> List[LimitOrder]:
@@ -429,7 +429,10 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                curve_fit_interval=self._config_map.trading_intensity_curve_fit_interval,
             )
+        elif self._trading_intensity is not None:
+            self._trading_intensity.curve_fit_interval = self._config_map.trading_intensity_curve_fit_interval
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
         if self._ticks_to_be_ready < 0:
@@ -463,7 +466,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
@@ -601,7 +604,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         try:
             if not self._all_markets_ready:
-                self._all_markets_ready = all([mkt.ready for mkt in self._sb_markets])
+                self._all_markets_ready = self.c_snapshot_markets_ready()
                 if not self._all_markets_ready:
                     # Markets not ready yet. Don't do anything.
                     if should_report_warnings:
@@ -641,6 +644,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                     self.logger().info(f"Calculating volatility, estimating order book liquidity ... no trades tick")
         finally:
             self._last_timestamp = timestamp
+            self.c_release_snapshot()
 
     def process_tick(self, timestamp: float):
         proposal = None
@@ -687,7 +691,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             ExchangeBase market = self._market_info.market
             str trading_pair = self._market_info.trading_pair
 
-        return market.c_get_price(trading_pair, True) - market.c_get_price(trading_pair, False)
+        return self.c_snapshot_price(market, trading_pair, True) - self.c_snapshot_price(market, trading_pair, False)
 
     def get_spread(self):
         return self.c_get_spread()
@@ -943,8 +947,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         """
         cdef:
             ExchangeBase market = self._market_info.market
-            object base_balance = market.c_get_available_balance(self.base_asset)
-            object quote_balance = market.c_get_available_balance(self.quote_asset)
+            object base_balance = self.c_snapshot_available_balance(market, self.base_asset)
+            object quote_balance = self.c_snapshot_available_balance(market, self.quote_asset)
 
         for order in orders:
             if order.is_buy:
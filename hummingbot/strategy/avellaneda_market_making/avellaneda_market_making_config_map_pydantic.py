@@ -306,6 +306,20 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_curve_fit_interval: int = Field(
+        default=10,
+        description=(
+            "The number of order book liquidity estimations between non-linear curve fits, the estimations in"
+            " between reuse the last fit. 1 fits on every estimation, 0 only uses the faster closed form fit."
+        ),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Every how many ticks should order book liquidity be refined with a non-linear curve fit?"
+                " (Enter 0 to only use the faster closed form fit)"
+            ),
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -317,7 +317,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             self._market_pair_tracker.c_tick(timestamp)
 
             if not self._all_markets_ready:
-                self._all_markets_ready = all([market.ready for market in self._sb_markets])
+                self._all_markets_ready = self.c_snapshot_markets_ready()
                 if not self._all_markets_ready:
                     # Markets not ready yet. Don't do anything.
                     if should_report_warnings:
@@ -358,6 +358,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 self._last_conv_rates_logged = self._current_timestamp
         finally:
             self._last_timestamp = timestamp
+            self.c_release_snapshot()
 
     def has_active_taker_order(self, object market_pair):
         cdef dict market_orders = self._sb_order_tracker.c_get_market_orders()
@@ -759,10 +760,10 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         cdef:
             ExchangeBase maker_market = market_pair.maker.market
             str trading_pair = market_pair.maker.trading_pair
-            object base_balance = maker_market.c_get_balance(market_pair.maker.base_asset)
-            object quote_balance = maker_market.c_get_balance(market_pair.maker.quote_asset)
-            object current_price = (maker_market.c_get_price(trading_pair, True) +
-                                    maker_market.c_get_price(trading_pair, False)) * Decimal(0.5)
+            object base_balance = self.c_snapshot_balance(maker_market, market_pair.maker.base_asset)
+            object quote_balance = self.c_snapshot_balance(maker_market, market_pair.maker.quote_asset)
+            object current_price = (self.c_snapshot_price(maker_market, trading_pair, True) +
+                                    self.c_snapshot_price(maker_market, trading_pair, False)) * Decimal(0.5)
             object maker_portfolio_value = base_balance + quote_balance / current_price
             object adjusted_order_size = maker_portfolio_value * self.order_size_portfolio_ratio_limit
 
@@ -790,9 +791,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
         if is_bid:
 
-            maker_balance_in_quote = maker_market.c_get_available_balance(market_pair.maker.quote_asset)
+            maker_balance_in_quote = self.c_snapshot_available_balance(maker_market, market_pair.maker.quote_asset)
 
-            taker_balance = taker_market.c_get_available_balance(market_pair.taker.base_asset) * \
+            taker_balance = self.c_snapshot_available_balance(taker_market, market_pair.taker.base_asset) * \
                 self.order_size_taker_balance_factor
 
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
@@ -810,9 +811,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
         else:
 
-            maker_balance = maker_market.c_get_available_balance(market_pair.maker.base_asset)
+            maker_balance = self.c_snapshot_available_balance(maker_market, market_pair.maker.base_asset)
 
-            taker_balance_in_quote = taker_market.c_get_available_balance(market_pair.taker.quote_asset) * \
+            taker_balance_in_quote = self.c_snapshot_available_balance(taker_market, market_pair.taker.quote_asset) * \
                 self.order_size_taker_balance_factor
 
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
@@ -976,9 +977,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             ExchangeBase maker_market = market_pair.maker.market
 
         if self.top_depth_tolerance == 0:
-            top_bid_price = maker_market.c_get_price(trading_pair, False)
+            top_bid_price = self.c_snapshot_price(maker_market, trading_pair, False)
 
-            top_ask_price = maker_market.c_get_price(trading_pair, True)
+            top_ask_price = self.c_snapshot_price(maker_market, trading_pair, True)
 
         else:
             # Use bid entries in maker order book
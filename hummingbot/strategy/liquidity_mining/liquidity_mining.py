@@ -91,8 +91,21 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         List active orders (they have been sent to the market and have not been canceled yet)
         """
-        limit_orders = self.order_tracker.active_limit_orders
-        return [o[1] for o in limit_orders]
+        return self.snapshot_value("active_limit_orders",
+                                   lambda: [o[1] for o in self.order_tracker.active_limit_orders])
+
+    def market_active_orders(self, trading_pair: str) -> List[LimitOrder]:
+        """
+        Active orders of a market, looked up in the order tracker index instead of filtering all the active orders
+        """
+        return self.snapshot_value(("active_limit_orders", trading_pair),
+                                   lambda: self.order_tracker.get_active_limit_orders(self._exchange, trading_pair))
+
+    def get_mid_price(self, trading_pair: str) -> Decimal:
+        """
+        Mid price of a market, queried once per tick
+        """
+        return self.snapshot_value(("mid_price", trading_pair), self._market_infos[trading_pair].get_mid_price)
 
     @property
     def sell_budgets(self):
@@ -137,7 +150,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         columns = ["Market", "Side", "Price", "Spread", "Amount", size_q_col, "Age"]
         data = []
         for order in self.active_orders:
-            mid_price = self._market_infos[order.trading_pair].get_mid_price()
+            mid_price = self.get_mid_price(order.trading_pair)
             spread = 0 if mid_price == 0 else abs(order.price - mid_price) / mid_price
             size_q = order.quantity * mid_price
             age = order_age(order, self.current_timestamp)
@@ -163,7 +176,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         data = []
         columns = ["Market", f"Budget({self._token})", "Base bal", "Quote bal", "Base/Quote"]
         for market, market_info in self._market_infos.items():
-            mid_price = market_info.get_mid_price()
+            mid_price = self.get_mid_price(market)
             base_bal = self._sell_budgets[market]
             quote_bal = self._buy_budgets[market]
             total_bal_in_quote = (base_bal * mid_price) + quote_bal
@@ -190,7 +203,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         data = []
         columns = ["Market", "Mid price", "Best bid", "Best ask", "Volatility"]
         for market, market_info in self._market_infos.items():
-            mid_price = market_info.get_mid_price()
+            mid_price = self.get_mid_price(market)
             best_bid = self._exchange.get_price(market, False)
             best_ask = self._exchange.get_price(market, True)
             best_bid_pct = abs(best_bid - mid_price) / mid_price
@@ -281,7 +294,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
             if self._max_spread > s_decimal_zero:
                 spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
+            mid_price = self.get_mid_price(market)
             buy_price = mid_price * (Decimal("1") - spread)
             buy_price = self._exchange.quantize_order_price(market, buy_price)
             buy_size = self.base_order_size(market, buy_price)
@@ -300,9 +313,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
         for market, market_info in self._market_infos.items():
             base, quote = market.split("-")
             if self.is_token_a_quote_token():
-                port_value += all_bals[base] * market_info.get_mid_price()
+                port_value += all_bals[base] * self.get_mid_price(market)
             else:
-                port_value += all_bals[quote] / market_info.get_mid_price()
+                port_value += all_bals[quote] / self.get_mid_price(market)
         return port_value
 
     def create_budget_allocation(self):
@@ -318,12 +331,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
             base, quote = market.split("-")
             if self.is_token_a_quote_token():
                 self._sell_budgets[market] = balances[base]
-                buy_budget = market_portion - (balances[base] * market_info.get_mid_price())
+                buy_budget = market_portion - (balances[base] * self.get_mid_price(market))
                 if buy_budget > s_decimal_zero:
                     self._buy_budgets[market] = buy_budget
             else:
                 self._buy_budgets[market] = balances[quote]
-                sell_budget = market_portion - (balances[quote] / market_info.get_mid_price())
+                sell_budget = market_portion - (balances[quote] / self.get_mid_price(market))
                 if sell_budget > s_decimal_zero:
                     self._sell_budgets[market] = sell_budget
 
@@ -332,7 +345,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         if self._token == base:
             return self._order_amount
         if price == s_decimal_zero:
-            price = self._market_infos[trading_pair].get_mid_price()
+            price = self.get_mid_price(trading_pair)
         return self._order_amount / price
 
     def apply_budget_constraint(self, proposals: List[Proposal]):
@@ -371,54 +384,50 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
         """
+        orders_to_cancel = []
         for proposal in proposals:
             to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
+            cur_orders = self.market_active_orders(proposal.market)
             if cur_orders and any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
                 to_cancel = True
             elif self._refresh_times[proposal.market] <= self.current_timestamp and \
                     cur_orders and not self.is_within_tolerance(cur_orders, proposal):
                 to_cancel = True
             if to_cancel:
-                for order in cur_orders:
-                    self.cancel_order(self._market_infos[proposal.market], order.client_order_id)
-                    # To place new order on the next tick
-                    self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
+                orders_to_cancel.extend(cur_orders)
+                # To place new order on the next tick
+                self._refresh_times[proposal.market] = self.current_timestamp + 0.1
+        self.batch_order_cancel(self._exchange, orders_to_cancel)
 
     def execute_orders_proposal(self, proposals: List[Proposal]):
         """
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
+        The orders of all the proposals are submitted to the exchange in a single batch.
         """
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
+        orders_to_create = []
         for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
+            cur_orders = self.market_active_orders(proposal.market)
             if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
                 continue
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            market_info = self._market_infos[proposal.market]
+            mid_price = self.get_mid_price(proposal.market)
             spread = s_decimal_zero
             if proposal.buy.size > 0:
                 spread = abs(proposal.buy.price - mid_price) / mid_price
                 self.logger().info(f"({proposal.market}) Creating a bid order {proposal.buy} value: "
                                    f"{proposal.buy.size * proposal.buy.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.buy_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.buy.size,
-                    order_type=maker_order_type,
-                    price=proposal.buy.price
-                )
+                orders_to_create.append(LimitOrder("", proposal.market, True, market_info.base_asset,
+                                                   market_info.quote_asset, proposal.buy.price, proposal.buy.size))
             if proposal.sell.size > 0:
                 spread = abs(proposal.sell.price - mid_price) / mid_price
                 self.logger().info(f"({proposal.market}) Creating an ask order at {proposal.sell} value: "
                                    f"{proposal.sell.size * proposal.sell.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.sell_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.sell.size,
-                    order_type=maker_order_type,
-                    price=proposal.sell.price
-                )
+                orders_to_create.append(LimitOrder("", proposal.market, False, market_info.base_asset,
+                                                   market_info.quote_asset, proposal.sell.price, proposal.sell.size))
             if proposal.buy.size > 0 or proposal.sell.size > 0:
                 if not self._volatility[proposal.market].is_nan() and spread > self._spread:
                     adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
@@ -427,6 +436,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                                            f"market volatility")
 
                 self._refresh_times[proposal.market] = self.current_timestamp + self._order_refresh_time
+        self.batch_order_create(self._exchange, orders_to_create, order_type=maker_order_type)
 
     def is_token_a_quote_token(self):
         """
@@ -474,7 +484,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         total_bals = {t: s_decimal_zero for t in tokens}
         total_bals.update(self._exchange.get_all_balances())
         for token in tokens:
-            adjusted_bals[token] = self._exchange.get_available_balance(token)
+            adjusted_bals[token] = self.snapshot_available_balance(self._exchange, token)
         for order in self.active_orders:
             base, quote = order.trading_pair.split("-")
             if order.is_buy:
@@ -490,7 +500,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         for proposal in proposals:
             buy_budget = self._buy_budgets[proposal.market]
             sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            mid_price = self.get_mid_price(proposal.market)
             total_order_size = proposal.sell.size + proposal.buy.size
             bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
                 float(sell_budget),
@@ -529,7 +539,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         Query asset markets for mid price
         """
         for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
+            mid_price = self.get_mid_price(market)
             self._mid_prices[market].append(mid_price)
             # To avoid memory leak, we store only the last part of the list needed for volatility calculation
             max_len = self._volatility_interval * self._avg_volatility_period
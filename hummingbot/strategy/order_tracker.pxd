@@ -8,6 +8,7 @@ cdef class OrderTracker(TimeIterator):
     cdef:
         dict _tracked_limit_orders
         dict _tracked_market_orders
+        dict _tracked_limit_orders_index
         dict _order_id_to_market_pair
         dict _shadow_tracked_limit_orders
         dict _shadow_order_id_to_market_pair
@@ -23,6 +24,7 @@ cdef class OrderTracker(TimeIterator):
     cdef object c_get_market_pair_from_order_id(self, str order_id)
     cdef object c_get_shadow_market_pair_from_order_id(self, str order_id)
     cdef LimitOrder c_get_limit_order(self, object market_pair, str order_id)
+    cdef list c_get_active_limit_orders(self, object market, str trading_pair, bint is_buy)
     cdef object c_get_market_order(self, object market_pair, str order_id)
     cdef LimitOrder c_get_shadow_limit_order(self, str order_id)
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
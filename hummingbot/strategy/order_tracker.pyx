@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple
 )
 
@@ -30,6 +31,8 @@ cdef class OrderTracker(TimeIterator):
         super().__init__()
         self._tracked_limit_orders = {}
         self._tracked_market_orders = {}
+        # (market, trading pair, is buy) -> {order id -> limit order}, the tracked limit orders of each market side
+        self._tracked_limit_orders_index = {}
         self._order_id_to_market_pair = {}
         self._shadow_tracked_limit_orders = {}
         self._shadow_order_id_to_market_pair = {}
@@ -197,6 +200,35 @@ cdef class OrderTracker(TimeIterator):
     def get_limit_order(self, market_pair, order_id: str) -> LimitOrder:
         return self.c_get_limit_order(market_pair, order_id)
 
+    cdef list c_get_active_limit_orders(self, object market, str trading_pair, bint is_buy):
+        cdef:
+            dict orders_map = self._tracked_limit_orders_index.get((market, trading_pair, is_buy))
+
+        if orders_map is None:
+            return []
+        return [limit_order for limit_order in orders_map.values()
+                if not self.c_has_in_flight_cancel(limit_order.client_order_id)]
+
+    def get_active_limit_orders(self,
+                                market: ConnectorBase,
+                                trading_pair: str,
+                                is_buy: Optional[bool] = None) -> List[LimitOrder]:
+        """
+        Active limit orders (tracked and without a cancel in flight) of a market and trading pair, from the index
+        maintained when the orders start and stop being tracked. Only the orders of the market side are visited.
+        :param is_buy: True for the bids only, False for the asks only, None for both sides
+        """
+        if is_buy is None:
+            return (self.c_get_active_limit_orders(market, trading_pair, True) +
+                    self.c_get_active_limit_orders(market, trading_pair, False))
+        return self.c_get_active_limit_orders(market, trading_pair, is_buy)
+
+    def get_active_bids(self, market: ConnectorBase, trading_pair: str) -> List[LimitOrder]:
+        return self.c_get_active_limit_orders(market, trading_pair, True)
+
+    def get_active_asks(self, market: ConnectorBase, trading_pair: str) -> List[LimitOrder]:
+        return self.c_get_active_limit_orders(market, trading_pair, False)
+
     cdef object c_get_market_order(self, object market_pair, str order_id):
         return self._tracked_market_orders.get(market_pair, {}).get(order_id)
 
@@ -228,7 +260,11 @@ cdef class OrderTracker(TimeIterator):
                                                 price,
                                                 quantity,
                                                 creation_timestamp=int(self._current_timestamp * 1e6))
+            tuple index_key = (market_pair.market, market_pair.trading_pair, is_buy)
         self._tracked_limit_orders[market_pair][order_id] = limit_order
+        if index_key not in self._tracked_limit_orders_index:
+            self._tracked_limit_orders_index[index_key] = {}
+        self._tracked_limit_orders_index[index_key][order_id] = limit_order
         self._shadow_tracked_limit_orders[market_pair][order_id] = limit_order
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
@@ -238,10 +274,20 @@ cdef class OrderTracker(TimeIterator):
         return self.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
 
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
+        cdef:
+            LimitOrder limit_order
+            tuple index_key
+
         if market_pair in self._tracked_limit_orders and order_id in self._tracked_limit_orders[market_pair]:
-            del self._tracked_limit_orders[market_pair][order_id]
+            limit_order = self._tracked_limit_orders[market_pair].pop(order_id)
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
+            index_key = (market_pair.market, market_pair.trading_pair, limit_order.is_buy)
+            orders_map = self._tracked_limit_orders_index.get(index_key)
+            if orders_map is not None and orders_map.get(order_id) is limit_order:
+                del orders_map[order_id]
+                if len(orders_map) < 1:
+                    del self._tracked_limit_orders_index[index_key]
             self._shadow_gc_requests.append((
                 self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
                 market_pair,
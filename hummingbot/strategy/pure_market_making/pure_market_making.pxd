@@ -59,7 +59,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         object _moving_price_band
 
+        tuple _level_ladder_key
+        list _buy_level_multipliers
+        list _sell_level_multipliers
+        list _level_sizes
+
     cdef object c_get_mid_price(self)
+    cdef c_update_level_ladder(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
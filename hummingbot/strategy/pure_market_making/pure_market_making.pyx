@@ -144,6 +144,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._level_ladder_key = None
+        self._buy_level_multipliers = []
+        self._sell_level_multipliers = []
+        self._level_sizes = []
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -419,6 +423,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         return self._moving_price_band
 
     def get_price(self) -> Decimal:
+        # Resolved once per tick through the market state snapshot
+        return self.c_snapshot_value("reference_price", self._get_reference_price)
+
+    def _get_reference_price(self) -> Decimal:
         price_provider = self._asset_price_delegate or self._market_info
         if self._price_type is PriceType.LastOwnTrade:
             price = self._last_own_trade_price
@@ -451,7 +459,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        return self._sb_order_tracker.market_pair_to_active_orders
+        return self.c_snapshot_active_orders()
 
     @property
     def active_orders(self) -> List[LimitOrder]:
@@ -585,7 +593,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
@@ -700,6 +708,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def cancel_order(self, order_id: str):
         return self.c_cancel_order(self._market_info, order_id)
 
+    def create_base_proposal(self) -> Proposal:
+        return self.c_create_base_proposal()
+
     # ---------------------------------------------------------------
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -732,7 +743,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             cdef object proposal
         try:
             if not self._all_markets_ready:
-                self._all_markets_ready = all([market.ready for market in self._sb_markets])
+                self._all_markets_ready = self.c_snapshot_markets_ready()
                 if self._asset_price_delegate is not None and self._all_markets_ready:
                     self._all_markets_ready = self._asset_price_delegate.ready
                 if not self._all_markets_ready:
@@ -771,6 +782,26 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 self.c_execute_orders_proposal(proposal)
         finally:
             self._last_timestamp = timestamp
+            self.c_release_snapshot()
+
+    cdef c_update_level_ladder(self):
+        """
+        Rebuilds the per level spread multipliers and order sizes when the level configuration changes, so that a
+        tick only has to scale the reference price and quantize.
+        """
+        cdef:
+            tuple key = (self._bid_spread, self._ask_spread, self._order_level_spread, self._order_amount,
+                         self._order_level_amount, self._buy_levels, self._sell_levels)
+
+        if key == self._level_ladder_key:
+            return
+        self._buy_level_multipliers = [Decimal("1") - self._bid_spread - (level * self._order_level_spread)
+                                       for level in range(0, self._buy_levels)]
+        self._sell_level_multipliers = [Decimal("1") + self._ask_spread + (level * self._order_level_spread)
+                                        for level in range(0, self._sell_levels)]
+        self._level_sizes = [self._order_amount + (self._order_level_amount * level)
+                             for level in range(0, max(self._buy_levels, self._sell_levels))]
+        self._level_ladder_key = key
 
     cdef object c_create_base_proposal(self):
         cdef:
@@ -811,21 +842,21 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            self.c_update_level_ladder()
+            trading_pair = self.trading_pair
+            # Level sizes are the same on both sides, quantize each of them only once
+            sizes = [market.c_quantize_order_amount(trading_pair, size) for size in self._level_sizes]
             if not buy_reference_price.is_nan():
-                for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                for level, multiplier in enumerate(self._buy_level_multipliers):
+                    size = sizes[level]
                     if size > 0:
+                        price = market.c_quantize_order_price(trading_pair, buy_reference_price * multiplier)
                         buys.append(PriceSize(price, size))
             if not sell_reference_price.is_nan():
-                for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                for level, multiplier in enumerate(self._sell_level_multipliers):
+                    size = sizes[level]
                     if size > 0:
+                        price = market.c_quantize_order_price(trading_pair, sell_reference_price * multiplier)
                         sells.append(PriceSize(price, size))
 
         return Proposal(buys, sells)
@@ -837,8 +868,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         """
         cdef:
             ExchangeBase market = self._market_info.market
-            object base_balance = market.c_get_available_balance(self.base_asset)
-            object quote_balance = market.c_get_available_balance(self.quote_asset)
+            object base_balance = self.c_snapshot_available_balance(market, self.base_asset)
+            object quote_balance = self.c_snapshot_available_balance(market, self.quote_asset)
 
         for order in orders:
             if order.is_buy:
@@ -1191,8 +1222,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_order_cancel(self._market_info.market, active_orders)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1222,10 +1252,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_batch_order_cancel(
+                self._market_info.market,
+                [order for order in self.active_non_hanging_orders
+                 if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1256,7 +1287,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
             double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
+            list orders_to_create = []
+            list created_orders
             bint orders_created = False
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
@@ -1270,20 +1302,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
+            orders_to_create.extend(
+                LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, buy.price, buy.size)
+                for buy in proposal.buys)
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1293,19 +1314,31 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+            orders_to_create.extend(
+                LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, sell.price, sell.size)
+                for sell in proposal.sells)
+
+        # All the orders of the refresh are submitted with a single batch, connectors with batch endpoints place
+        # them with fewer requests
+        created_orders = self.c_batch_order_create(self._market_info.market,
+                                                   orders_to_create,
+                                                   order_type=self._limit_order_type,
+                                                   expiration_seconds=expiration_seconds)
+        orders_created = len(created_orders) > 0
+
+        if number_of_pairs > 0:
+            tracked_orders = {o.client_order_id: o for o in self.active_orders}
+            bid_orders = created_orders[:len(proposal.buys)]
+            ask_orders = created_orders[len(proposal.buys):]
+            for idx in range(number_of_pairs):
+                order = tracked_orders.get(bid_orders[idx].client_order_id)
+                if order:
+                    self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                        CreatedPairOfOrders(order, None))
+            for idx in range(number_of_pairs):
+                order = tracked_orders.get(ask_orders[idx].client_order_id)
+                if order:
+                    self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
             self.set_timers()
 
@@ -2,6 +2,7 @@
 
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.connector.connector_base cimport ConnectorBase
 
 from .order_tracker cimport OrderTracker
 
@@ -27,7 +28,19 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        dict _sb_snapshot
+        bint _sb_snapshot_enabled
 
+    cdef dict c_get_snapshot(self)
+    cdef c_invalidate_snapshot(self)
+    cdef c_release_snapshot(self)
+    cdef object c_snapshot_value(self, object key, object getter)
+    cdef object c_snapshot_price(self, object market, str trading_pair, bint is_buy)
+    cdef object c_snapshot_mid_price(self, object market, str trading_pair)
+    cdef object c_snapshot_balance(self, object market, str asset)
+    cdef object c_snapshot_available_balance(self, object market, str asset)
+    cdef dict c_snapshot_active_orders(self)
+    cdef bint c_snapshot_markets_ready(self)
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
     cdef c_did_create_buy_order(self, object order_created_event)
@@ -59,6 +72,9 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount, object order_type = *,
                                          object price = *, double expiration_seconds = *, position_action = *, )
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef list c_batch_order_create(self, ConnectorBase market, list orders_to_create, object order_type = *,
+                                   double expiration_seconds = *, position_action = *)
+    cdef c_batch_order_cancel(self, ConnectorBase market, list orders_to_cancel)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
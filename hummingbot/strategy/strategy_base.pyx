@@ -2,6 +2,9 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from typing import (
+    Any,
+    Callable,
+    Dict,
     List)
 
 from hummingbot.core.clock cimport Clock
@@ -14,6 +17,8 @@ from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, PositionAction
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.utils.order_tracing import strategy_tick_started
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
 
@@ -33,18 +38,21 @@ cdef class BaseStrategyEventListener(EventListener):
 
 cdef class BuyOrderCompletedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_complete_buy_order(arg)
         self._owner.c_did_complete_buy_order_tracker(arg)
 
 
 cdef class SellOrderCompletedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_complete_sell_order(arg)
         self._owner.c_did_complete_sell_order_tracker(arg)
 
 
 cdef class FundingPaymentCompletedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_complete_funding_payment(arg)
 
 
@@ -58,34 +66,40 @@ cdef class PositionModeChangeFailureListener(BaseStrategyEventListener):
 
 cdef class OrderFilledListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_fill_order(arg)
 
 
 cdef class OrderFailedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_fail_order(arg)
         self._owner.c_did_fail_order_tracker(arg)
 
 
 cdef class OrderCancelledListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_cancel_order(arg)
         self._owner.c_did_cancel_order_tracker(arg)
 
 
 cdef class OrderExpiredListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_expire_order(arg)
         self._owner.c_did_expire_order_tracker(arg)
 
 
 cdef class BuyOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_create_buy_order(arg)
 
 
 cdef class SellOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_invalidate_snapshot()
         self._owner.c_did_create_sell_order(arg)
 
 cdef class RangePositionLiquidityAddedListener(BaseStrategyEventListener):
@@ -163,6 +177,9 @@ cdef class StrategyBase(TimeIterator):
 
         self._sb_order_tracker = OrderTracker()
 
+        self._sb_snapshot = {}
+        self._sb_snapshot_enabled = False
+
     def init_params(self, *args, **kwargs):
         """
         Assigns strategy parameters, this function must be called directly after init.
@@ -303,6 +320,9 @@ cdef class StrategyBase(TimeIterator):
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
+        strategy_tick_started()
+        self.c_invalidate_snapshot()
+        self._sb_snapshot_enabled = True
         self._sb_order_tracker.c_tick(timestamp)
 
     cdef c_stop(self, Clock clock):
@@ -310,6 +330,127 @@ cdef class StrategyBase(TimeIterator):
         self._sb_order_tracker.c_stop(clock)
         self.c_remove_markets(list(self._sb_markets))
 
+    # <editor-fold desc="+ Market state snapshot">
+    # While a tick is being processed, values read through the snapshot are queried once and then served from the
+    # cache until an order or balance event is received from one of the markets. Outside of a tick every read goes
+    # to the market.
+    # ----------------------------------------------------------------------------------------------------------
+    cdef dict c_get_snapshot(self):
+        if self._sb_snapshot_enabled:
+            return self._sb_snapshot
+        return {}
+
+    cdef c_invalidate_snapshot(self):
+        self._sb_snapshot.clear()
+
+    cdef c_release_snapshot(self):
+        """
+        Stops caching market state, strategies call it once they are done processing the tick.
+        """
+        self._sb_snapshot_enabled = False
+        self._sb_snapshot.clear()
+
+    def invalidate_snapshot(self):
+        self.c_invalidate_snapshot()
+
+    cdef object c_snapshot_value(self, object key, object getter):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            object value = snapshot.get(key)
+
+        if value is None:
+            value = snapshot[key] = getter()
+        return value
+
+    def snapshot_value(self, key: Any, getter: Callable[[], Any]) -> Any:
+        """
+        Returns the value cached under key in the market state snapshot, calling getter to compute it when missing.
+        """
+        return self.c_snapshot_value(key, getter)
+
+    cdef object c_snapshot_price(self, object market, str trading_pair, bint is_buy):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            tuple key = ("price", market, trading_pair, is_buy)
+            object price = snapshot.get(key)
+
+        if price is None:
+            price = snapshot[key] = market.get_price(trading_pair, is_buy)
+        return price
+
+    def snapshot_price(self, market: ConnectorBase, trading_pair: str, is_buy: bool) -> Decimal:
+        return self.c_snapshot_price(market, trading_pair, is_buy)
+
+    cdef object c_snapshot_mid_price(self, object market, str trading_pair):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            tuple key = ("mid_price", market, trading_pair)
+            object mid_price = snapshot.get(key)
+
+        if mid_price is None:
+            mid_price = snapshot[key] = ((self.c_snapshot_price(market, trading_pair, True) +
+                                          self.c_snapshot_price(market, trading_pair, False)) / Decimal("2"))
+        return mid_price
+
+    def snapshot_mid_price(self, market: ConnectorBase, trading_pair: str) -> Decimal:
+        return self.c_snapshot_mid_price(market, trading_pair)
+
+    cdef object c_snapshot_balance(self, object market, str asset):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            tuple key = ("balance", market, asset)
+            object balance = snapshot.get(key)
+
+        if balance is None:
+            balance = snapshot[key] = market.get_balance(asset)
+        return balance
+
+    def snapshot_balance(self, market: ConnectorBase, asset: str) -> Decimal:
+        return self.c_snapshot_balance(market, asset)
+
+    cdef object c_snapshot_available_balance(self, object market, str asset):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            tuple key = ("available_balance", market, asset)
+            object balance = snapshot.get(key)
+
+        if balance is None:
+            balance = snapshot[key] = market.get_available_balance(asset)
+        return balance
+
+    def snapshot_available_balance(self, market: ConnectorBase, asset: str) -> Decimal:
+        return self.c_snapshot_available_balance(market, asset)
+
+    cdef dict c_snapshot_active_orders(self):
+        """
+        :return: market pair to active (not being cancelled) limit orders index. The index is shared by every reader
+        within the tick, it must not be modified.
+        """
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            dict active_orders = snapshot.get("active_orders")
+
+        if active_orders is None:
+            active_orders = snapshot["active_orders"] = self._sb_order_tracker.market_pair_to_active_orders
+        return active_orders
+
+    def snapshot_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        return self.c_snapshot_active_orders()
+
+    cdef bint c_snapshot_markets_ready(self):
+        cdef:
+            dict snapshot = self.c_get_snapshot()
+            object ready = snapshot.get("markets_ready")
+
+        if ready is None:
+            ready = snapshot["markets_ready"] = all([market.ready for market in self._sb_markets])
+        return ready
+
+    def snapshot_markets_ready(self) -> bool:
+        return self.c_snapshot_markets_ready()
+    # ----------------------------------------------------------------------------------------------------------
+    # </editor-fold>
+
     cdef c_add_markets(self, list markets):
         cdef:
             ConnectorBase typed_market
@@ -334,6 +475,7 @@ cdef class StrategyBase(TimeIterator):
             typed_market.c_add_listener(self.RANGE_POSITION_FEE_COLLECTED_EVENT_TAG, self._sb_range_position_fee_collected_listener)
             typed_market.c_add_listener(self.RANGE_POSITION_CLOSED_EVENT_TAG, self._sb_range_position_closed_listener)
             self._sb_markets.add(typed_market)
+        self.c_invalidate_snapshot()
 
     def add_markets(self, markets: List[ConnectorBase]):
         self.c_add_markets(markets)
@@ -364,6 +506,7 @@ cdef class StrategyBase(TimeIterator):
             typed_market.c_remove_listener(self.RANGE_POSITION_FEE_COLLECTED_EVENT_TAG, self._sb_range_position_fee_collected_listener)
             typed_market.c_remove_listener(self.RANGE_POSITION_CLOSED_EVENT_TAG, self._sb_range_position_closed_listener)
             self._sb_markets.remove(typed_market)
+        self.c_invalidate_snapshot()
 
     def remove_markets(self, markets: List[ConnectorBase]):
         self.c_remove_markets(markets)
@@ -589,6 +732,7 @@ cdef class StrategyBase(TimeIterator):
             ConnectorBase market = market_trading_pair_tuple.market
 
         if self._sb_order_tracker.c_check_and_track_cancel(order_id):
+            self.c_invalidate_snapshot()
             self.log_with_clock(
                 logging.INFO,
                 f"({market_trading_pair_tuple.trading_pair}) Canceling the limit order {order_id}."
@@ -597,6 +741,81 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_order_create(self, market: ConnectorBase, orders_to_create: List[LimitOrder],
+                           order_type=OrderType.LIMIT,
+                           expiration_seconds=NaN,
+                           position_action=PositionAction.OPEN) -> List[LimitOrder]:
+        return self.c_batch_order_create(market, orders_to_create, order_type, expiration_seconds, position_action)
+
+    cdef list c_batch_order_create(self, ConnectorBase market, list orders_to_create,
+                                   object order_type=OrderType.LIMIT,
+                                   double expiration_seconds=NaN,
+                                   position_action=PositionAction.OPEN):
+        """
+        Submits several limit orders to the market with a single connector call, letting connectors with batch
+        endpoints place them in fewer requests.
+        :param market: The connector to place the orders in
+        :param orders_to_create: The orders to create, their client order ids are ignored
+        :return: The created orders, with the client order ids assigned by the connector
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not order_type.is_limit_type():
+            raise ValueError(f"Batch order creation only supports limit orders ({order_type} requested).")
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+
+        for order in orders_to_create:
+            if not (isinstance(order.quantity, Decimal) and isinstance(order.price, Decimal)):
+                raise TypeError("price and amount must be Decimal objects.")
+
+        if len(orders_to_create) == 0:
+            return []
+
+        cdef:
+            list created_orders = market.batch_order_create(
+                orders_to_create,
+                order_type=order_type,
+                expiration_ts=self._current_timestamp + expiration_seconds,
+                position_action=position_action)
+
+        for order in created_orders:
+            self.c_start_tracking_limit_order(
+                MarketTradingPairTuple(market, order.trading_pair, order.base_currency, order.quote_currency),
+                order.client_order_id,
+                order.is_buy,
+                order.price,
+                order.quantity)
+
+        return created_orders
+
+    def batch_order_cancel(self, market: ConnectorBase, orders_to_cancel: List[LimitOrder]):
+        self.c_batch_order_cancel(market, orders_to_cancel)
+
+    cdef c_batch_order_cancel(self, ConnectorBase market, list orders_to_cancel):
+        """
+        Cancels several orders of the market with a single connector call. Orders with a cancel already in progress
+        are skipped.
+        :param market: The connector the orders were placed in
+        :param orders_to_cancel: The orders to cancel
+        """
+        cdef:
+            list orders = []
+
+        for order in orders_to_cancel:
+            if self._sb_order_tracker.c_check_and_track_cancel(order.client_order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({order.trading_pair}) Canceling the limit order {order.client_order_id}."
+                )
+                orders.append(order)
+
+        if len(orders) > 0:
+            self.c_invalidate_snapshot()
+            market.batch_order_cancel(orders)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -607,6 +826,7 @@ cdef class StrategyBase(TimeIterator):
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity):
         self._sb_order_tracker.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
+        self.c_invalidate_snapshot()
 
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
@@ -615,18 +835,21 @@ cdef class StrategyBase(TimeIterator):
 
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
         self._sb_order_tracker.c_stop_tracking_limit_order(market_pair, order_id)
+        self.c_invalidate_snapshot()
 
     def stop_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str):
         self.c_stop_tracking_limit_order(market_pair, order_id)
 
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity):
         self._sb_order_tracker.c_start_tracking_market_order(market_pair, order_id, is_buy, quantity)
+        self.c_invalidate_snapshot()
 
     def start_tracking_market_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, quantity: Decimal):
         self.c_start_tracking_market_order(market_pair, order_id, is_buy, quantity)
 
     cdef c_stop_tracking_market_order(self, object market_pair, str order_id):
         self._sb_order_tracker.c_stop_tracking_market_order(market_pair, order_id)
+        self.c_invalidate_snapshot()
 
     def stop_tracking_market_order(self, market_pair: MarketTradingPairTuple, order_id: str):
         self.c_stop_tracking_market_order(market_pair, order_id)
@@ -41,7 +41,10 @@ cdef class StrategyPyBase(StrategyBase):
 
     cdef c_tick(self, double timestamp):
         StrategyBase.c_tick(self, timestamp)
-        self.tick(timestamp)
+        try:
+            self.tick(timestamp)
+        finally:
+            self.c_release_snapshot()
 
     def tick(self, timestamp: float):
         raise NotImplementedError
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import random
+import time
+from typing import List, Tuple, Type
+
+import numpy as np
+
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+BOOK_LEVELS = 5000
+DIFF_BATCHES = 20000
+TOP_OF_BOOK_READS = 200000
+TOP_OF_BOOK_ROUNDS = 20
+TICK_SIZE = 0.01
+MID_PRICE = 1000.0
+
+
+def make_snapshot(rng: random.Random) -> Tuple[np.ndarray, np.ndarray]:
+    bids = np.array([[MID_PRICE - (i + 1) * TICK_SIZE, rng.uniform(0.1, 10), 1] for i in range(BOOK_LEVELS)],
+                    dtype=np.float64)
+    asks = np.array([[MID_PRICE + (i + 1) * TICK_SIZE, rng.uniform(0.1, 10), 1] for i in range(BOOK_LEVELS)],
+                    dtype=np.float64)
+    return bids, asks
+
+
+def make_diffs(rng: random.Random) -> List[Tuple[np.ndarray, np.ndarray]]:
+    # Most of the updates of a diff stream hit the levels close to the top of the book.
+    diffs = []
+    for update_id in range(2, DIFF_BATCHES + 2):
+        rows = []
+        for is_bid in (True, False):
+            side_rows = []
+            for _ in range(rng.randint(1, 4)):
+                depth = min(int(rng.expovariate(1 / 20.0)), BOOK_LEVELS - 1) + 1
+                price = MID_PRICE - depth * TICK_SIZE if is_bid else MID_PRICE + depth * TICK_SIZE
+                amount = 0 if rng.random() < 0.3 else rng.uniform(0.1, 10)
+                side_rows.append([price, amount, update_id])
+            rows.append(np.array(side_rows, dtype=np.float64))
+        diffs.append((rows[0], rows[1]))
+    return diffs
+
+
+def time_top_of_book_reads(order_book: OrderBook) -> float:
+    get_price = order_book.get_price
+    start = time.perf_counter()
+    for _ in range(TOP_OF_BOOK_READS // 2):
+        get_price(True)
+        get_price(False)
+    return time.perf_counter() - start
+
+
+def benchmark(order_book_class: Type[OrderBook],
+              snapshot: Tuple[np.ndarray, np.ndarray],
+              diffs: List[Tuple[np.ndarray, np.ndarray]]):
+    order_book = order_book_class()
+    order_book.apply_numpy_snapshot(*snapshot)
+
+    start = time.perf_counter()
+    for bids, asks in diffs:
+        order_book.apply_numpy_diffs(bids, asks)
+    diff_elapsed = time.perf_counter() - start
+
+    # Top of book reads take a few tens of nanoseconds, the fastest round filters out the noise of the machine.
+    price_elapsed = min(time_top_of_book_reads(order_book) for _ in range(TOP_OF_BOOK_ROUNDS))
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        for _, _ in zip(range(20), order_book.bid_entries()):
+            pass
+    top_n_elapsed = time.perf_counter() - start
+
+    print(f"{order_book_class.__name__:>16}: "
+          f"{DIFF_BATCHES / diff_elapsed:>10,.0f} diffs/s, "
+          f"{TOP_OF_BOOK_READS / price_elapsed:>12,.0f} top of book reads/s, "
+          f"{1000 / top_n_elapsed:>10,.0f} top 20 reads/s")
+
+
+def main():
+    rng = random.Random(42)
+    snapshot = make_snapshot(rng)
+    diffs = make_diffs(rng)
+    print(f"{BOOK_LEVELS} levels per side, {DIFF_BATCHES} diff messages")
+    for order_book_class in (OrderBook, LadderOrderBook):
+        benchmark(order_book_class, snapshot, diffs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+import time
+
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+from test.hummingbot.strategy.pure_market_making.test_pmm_proposal_ladder import (
+    PMMProposalLadderTest,
+    legacy_base_proposal,
+)
+
+ITERATIONS = 2000
+
+
+def benchmark(strategy: PureMarketMakingStrategy):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        legacy_base_proposal(strategy)
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        strategy.create_base_proposal()
+    elapsed = time.perf_counter() - start
+
+    print(f"legacy: {legacy_elapsed / ITERATIONS * 1e6:.1f} us/proposal, "
+          f"ladder: {elapsed / ITERATIONS * 1e6:.1f} us/proposal, "
+          f"speedup: {legacy_elapsed / elapsed:.2f}x")
+
+
+def main():
+    test = PMMProposalLadderTest()
+    test.setUp()
+    test.assert_same_proposal(legacy_base_proposal(test.strategy), test.strategy.create_base_proposal())
+    print(f"{test.strategy.buy_levels} levels per side")
+    benchmark(test.strategy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+import gc
+import time
+from enum import Enum
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.pubsub import PubSub
+
+LISTENER_CALLS = 2000000
+
+
+class BenchmarkEventType(Enum):
+    EVENT = 1
+
+
+def benchmark(listeners_count: int, dead_listeners_count: int):
+    events = LISTENER_CALLS // listeners_count
+    pubsub = PubSub()
+    listeners = [EventLogger() for _ in range(listeners_count)]
+    dead_listeners = [EventLogger() for _ in range(dead_listeners_count)]
+    for listener in listeners + dead_listeners:
+        pubsub.add_listener(BenchmarkEventType.EVENT, listener)
+    del listener, dead_listeners
+    gc.collect()
+
+    start = time.perf_counter()
+    for i in range(events):
+        pubsub.trigger_event(BenchmarkEventType.EVENT, i)
+    elapsed = time.perf_counter() - start
+
+    assert all(listener.event_log[-1] == events - 1 for listener in listeners)
+    print(f"{listeners_count:>5} listeners, {dead_listeners_count:>3} dead: "
+          f"{events / elapsed:>12,.0f} events/s, "
+          f"{events * listeners_count / elapsed:>12,.0f} listener calls/s")
+
+
+def main():
+    for listeners_count in (1, 10, 100, 1000):
+        benchmark(listeners_count, 0)
+    benchmark(100, 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 import asyncio
 import unittest
-from collections import Awaitable
+from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
 class OrderBookCommandTest(unittest.TestCase):
@@ -59,3 +61,47 @@ class OrderBookCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.command.order_book_command.format_df_for_printout", wraps=format_df_for_printout)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_live_order_book_rebuilt_only_when_top_levels_change(self, _, format_df_mock):
+        exchange_name = "paper"
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.app.markets[exchange_name] = exchange
+        trading_pair = "BTC-USDT"
+        exchange.set_balanced_order_book(
+            trading_pair,
+            mid_price=10,
+            min_price=5.5,
+            max_price=14.5,
+            price_step_size=1,
+            volume_step_size=1,
+        )
+        order_book = exchange.get_order_book(trading_pair)
+        self.app.app = MagicMock()
+        drawn = []
+        self.app.app.log.side_effect = lambda text, save_log: drawn.append(text)
+
+        async def update_book():
+            await asyncio.sleep(0.7)
+            # Update deeper than the displayed levels
+            order_book.apply_diffs([OrderBookRow(5.5, 10, 2)], [], 2)
+            await asyncio.sleep(0.5)
+            order_book.apply_diffs([OrderBookRow(9.5, 3, 3)], [], 3)
+            await asyncio.sleep(0.7)
+            self.app.app.live_updates = False
+
+        self.async_run_with_timeout(asyncio.gather(
+            self.app.show_order_book(lines=2, exchange=exchange_name, live=True),
+            update_book()
+        ), timeout=5)
+
+        # Redrawn every interval, each drawing is undone before the next one
+        self.assertGreaterEqual(len(drawn), 4)
+        self.assertEqual(len(drawn), self.app.app.output_field.buffer.save_to_undo_stack.call_count)
+        self.assertEqual(len(drawn), self.app.app.output_field.buffer.undo.call_count)
+        # The table is only rebuilt when the displayed levels change
+        self.assertEqual(2, format_df_mock.call_count)
+        self.assertEqual(2, len(set(drawn)))
+        self.assertIn("|         9.5 |            1 |", drawn[0])
+        self.assertIn("|         9.5 |            3 |", drawn[-1])
@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.utils.loop_monitor import LoopMonitor
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +76,16 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_perf_status(self):
+        queue = asyncio.Queue()
+        queue.put_nowait(1)
+        LoopMonitor.get_instance().register_queue(queue, "TestDataSource.order_book_diff_stream")
+        self.app.clock = Clock(ClockMode.REALTIME)
+
+        perf_status = self.app.perf_status()
+
+        self.assertIn("Event loop lag:", perf_status)
+        self.assertIn("Live tasks (", perf_status)
+        self.assertIn("TestDataSource.order_book_diff_stream", perf_status)
+        self.assertIn("Clock ticks:", perf_status)
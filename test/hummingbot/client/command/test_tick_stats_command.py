@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class MockIterator(PyTimeIterator):
+    def tick(self, timestamp: float):
+        pass
+
+
+class TickStatsCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.captures = []
+        notify_patch = patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify",
+                             side_effect=lambda s: self.captures.append(s))
+        notify_patch.start()
+        self.addCleanup(notify_patch.stop)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_tick_stats_without_running_strategy(self):
+        self.app.tick_stats()
+
+        self.assertEqual(["\n This command can only be used while a strategy is running"], self.captures)
+
+    def test_tick_stats(self):
+        self.app.clock = Clock(ClockMode.REALTIME)
+        profiler = self.app.clock.profiler
+        profiler.tick_started(skipped_ticks=0)
+        profiler.record_iterator_tick(MockIterator(), 0.002)
+        profiler.tick_finished(timestamp=1, duration=1.5)
+        profiler.tick_started(skipped_ticks=1)
+
+        self.app.tick_stats()
+
+        self.assertEqual(1, len(self.captures))
+        report = self.captures[0]
+        self.assertIn("Ticks: 1    Overruns: 1    Skipped ticks: 1", report)
+        self.assertIn("Total tick", report)
+        self.assertIn("MockIterator", report)
+        self.assertIn("1500", report)
+
+    def test_tick_stats_reset_and_profile_threshold(self):
+        self.app.clock = Clock(ClockMode.REALTIME)
+        profiler = self.app.clock.profiler
+        profiler.tick_finished(timestamp=1, duration=1.5)
+
+        self.app.tick_stats(reset=True, profile_threshold=0.5)
+
+        self.assertEqual(0, profiler.tick_histogram.count)
+        self.assertEqual(0.5, profiler.profile_threshold)
+        self.assertEqual(2, len(self.captures))
+
+        self.app.tick_stats(profile_threshold=0)
+
+        self.assertIsNone(profiler.profile_threshold)
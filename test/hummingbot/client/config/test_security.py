@@ -1,8 +1,11 @@
 import asyncio
+import binascii
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -14,6 +17,17 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
+from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
+
+
+class PerValueSaltSecretsManager(ETHKeyFileSecretManger):
+    """
+    Encrypts each value with its own salt, like the configs saved by the previous versions.
+    """
+
+    def encrypt_secret_value(self, attr: str, value: str):
+        keyfile_json = config_crypt._create_v3_keyfile_json(value.encode(), self._password.encode())
+        return binascii.hexlify(json.dumps(keyfile_json).encode()).decode()
 
 
 class SecurityTest(unittest.TestCase):
@@ -123,3 +137,81 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_decrypt_all_decrypts_every_connector_config(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.login(secrets_manager)
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+        binance_config = self.store_binance_config()
+        kucoin_config = ClientConfigAdapter(
+            KuCoinConfigMap(kucoin_api_key="kucoinKey", kucoin_secret_key="kucoinSecret", kucoin_passphrase="phrase")
+        )
+        save_to_yml(get_connector_config_yml_path("kucoin"), kucoin_config)
+
+        Security.decrypt_all()
+
+        self.assertEqual(binance_config, Security.decrypted_value("binance"))
+        self.assertEqual(kucoin_config, Security.decrypted_value("kucoin"))
+
+    def test_values_encrypted_in_a_session_are_decrypted_with_a_single_key_derivation(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        encrypted_values = [secrets_manager.encrypt_secret_value(f"attr{i}", f"value{i}") for i in range(5)]
+
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_mock:
+            new_secrets_manager = ETHKeyFileSecretManger("som-password")
+            decrypted_values = [new_secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+
+        self.assertEqual([f"value{i}" for i in range(5)], decrypted_values)
+        self.assertEqual(1, derive_mock.call_count)
+        ivs = {json.loads(binascii.unhexlify(value))["crypto"]["cipherparams"]["iv"] for value in encrypted_values}
+        self.assertEqual(5, len(ivs))
+
+    def test_decrypt_keyfile_with_its_own_salt(self):
+        keyfile_json = config_crypt._create_v3_keyfile_json(b"someSecret", b"som-password")
+        encrypted_value = binascii.hexlify(json.dumps(keyfile_json).encode()).decode()
+
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        self.assertEqual("someSecret", secrets_manager.decrypt_secret_value("attr", encrypted_value))
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("attr", encrypted_value)
+
+    @staticmethod
+    def encryption_salt(encrypted_value: str) -> str:
+        return json.loads(binascii.unhexlify(encrypted_value))["crypto"]["kdfparams"]["salt"]
+
+    def test_configs_with_per_value_salts_are_reencrypted_with_the_shared_salt(self):
+        Security.secrets_manager = PerValueSaltSecretsManager("som-password")
+        store_password_verification(Security.secrets_manager)
+        binance_config = self.store_binance_config()
+        file_path = get_connector_config_yml_path(self.connector)
+        yml_data = config_helpers.read_yml_file(file_path)
+        self.assertNotEqual(self.encryption_salt(yml_data["binance_api_key"]),
+                            self.encryption_salt(yml_data["binance_api_secret"]))
+        self.reset_security()
+
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        self.assertTrue(validate_password(secrets_manager))
+        Security.secrets_manager = secrets_manager
+        Security.decrypt_all()
+
+        self.assertEqual(binance_config, Security.decrypted_value(self.connector))
+        with open(config_crypt.PASSWORD_VERIFICATION_PATH) as f:
+            verification_salt = self.encryption_salt(f.read())
+        yml_data = config_helpers.read_yml_file(file_path)
+        self.assertEqual(verification_salt, self.encryption_salt(yml_data["binance_api_key"]))
+        self.assertEqual(verification_salt, self.encryption_salt(yml_data["binance_api_secret"]))
+
+        self.reset_security()
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_mock:
+            secrets_manager = ETHKeyFileSecretManger("som-password")
+            self.assertTrue(validate_password(secrets_manager))
+            Security.secrets_manager = secrets_manager
+            with patch("hummingbot.client.config.security.save_to_yml") as save_mock:
+                Security.decrypt_all()
+
+        self.assertEqual(binance_config, Security.decrypted_value(self.connector))
+        self.assertEqual(1, derive_mock.call_count)
+        save_mock.assert_not_called()
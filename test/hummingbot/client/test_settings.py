@@ -1,8 +1,15 @@
+import importlib
+import json
+import os
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot import root_path
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -36,3 +43,85 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+
+class ConnectorSettingsManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / "connector_settings_manifest.json"
+        manifest_path_patch = patch("hummingbot.client.settings.CONNECTOR_SETTINGS_MANIFEST_PATH", self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        gateway_patch = patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[])
+        gateway_patch.start()
+        self.addCleanup(gateway_patch.stop)
+        self.original_settings = AllConnectorSettings.all_connector_settings
+        self.original_pending_keys = AllConnectorSettings._pending_config_keys
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.original_settings
+        AllConnectorSettings._pending_config_keys = self.original_pending_keys
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_first_creation_writes_manifest(self):
+        settings = AllConnectorSettings.create_connector_settings()
+
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+
+        self.assertIn("binance", manifest["connectors"])
+        self.assertIn("binance_us", manifest["connectors"]["binance"]["other_domains"])
+        self.assertEqual(settings["binance"].example_pair, manifest["connectors"]["binance"]["example_pair"])
+        self.assertIsNotNone(settings["binance"].config_keys)
+        self.assertEqual({}, AllConnectorSettings._pending_config_keys)
+
+    def test_creation_from_manifest_does_not_import_utils_modules(self):
+        expected_settings = AllConnectorSettings.create_connector_settings()
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            settings = AllConnectorSettings.create_connector_settings()
+            import_module_mock.assert_not_called()
+
+        self.assertEqual(set(expected_settings), set(settings))
+        for name, connector_settings in settings.items():
+            self.assertEqual(
+                expected_settings[name]._replace(config_keys=None, trade_fee_schema=None),
+                connector_settings._replace(config_keys=None, trade_fee_schema=None),
+            )
+            self.assertEqual(
+                expected_settings[name].trade_fee_schema.to_json(), connector_settings.trade_fee_schema.to_json()
+            )
+
+        self.assertIsNone(settings["binance_us"].config_keys)
+        config_keys = AllConnectorSettings.get_connector_config_keys("binance_us")
+
+        self.assertEqual(expected_settings["binance_us"].config_keys, config_keys)
+        self.assertNotIn("binance_us", AllConnectorSettings._pending_config_keys)
+        self.assertIn("binance", AllConnectorSettings._pending_config_keys)
+
+    def test_connector_files_change_refreshes_manifest_entry(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+        manifest["connectors"]["binance"]["mtime"] -= 1
+        manifest["connectors"]["binance"]["example_pair"] = "OUTDATED-PAIR"
+        with open(self.manifest_path, "w") as fd:
+            json.dump(manifest, fd)
+
+        with patch("hummingbot.client.settings.importlib.import_module",
+                   side_effect=importlib.import_module) as import_module_mock:
+            settings = AllConnectorSettings.create_connector_settings()
+
+        import_module_mock.assert_called_once_with("hummingbot.connector.exchange.binance.binance_utils")
+        self.assertNotEqual("OUTDATED-PAIR", settings["binance"].example_pair)
+        self.assertIsNotNone(settings["binance"].config_keys)
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+        binance_dir = os.path.join(root_path(), "hummingbot", "connector", "exchange", "binance")
+        self.assertEqual(
+            max(os.path.getmtime(os.path.join(binance_dir, f))
+                for f in os.listdir(binance_dir) if f.endswith((".py", ".pyx", ".pxd"))),
+            manifest["connectors"]["binance"]["mtime"],
+        )
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+from typing import Awaitable, Optional
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway_EVM_AMM import GatewayEVMAMM
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.mock_api.mock_web_server import get_open_port
+
+
+class LocalGateway:
+    """
+    Local Gateway server for the connector tests, the subclasses add the routes of the endpoints they answer.
+    """
+
+    def __init__(self, port: int, response_delay: float = 0.02):
+        self.port = port
+        self.response_delay = response_delay
+        self._runner: Optional[web.AppRunner] = None
+
+    def add_routes(self, app: web.Application):
+        raise NotImplementedError
+
+    async def start(self):
+        app = web.Application()
+        self.add_routes(app)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+class LocalGatewayTestCase(unittest.TestCase):
+    """
+    Runs a local Gateway server for each test, and points the Gateway client to it.
+    """
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def create_gateway(self, port: int) -> LocalGateway:
+        raise NotImplementedError
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.gateway = self.create_gateway(get_open_port())
+        self.async_run_with_timeout(self.gateway.start())
+        self.client_session = self.async_run_with_timeout(self.create_client_session())
+        self.http_client_patch = patch(
+            "hummingbot.core.gateway.gateway_http_client.GatewayHttpClient._http_client",
+            return_value=self.client_session
+        )
+        self.http_client_patch.start()
+        self.gateway_http_client = GatewayHttpClient.get_instance(client_config_map=self.client_config_map)
+        self.original_base_url = self.gateway_http_client.base_url
+        self.gateway_http_client.base_url = f"http://127.0.0.1:{self.gateway.port}"
+
+    def tearDown(self) -> None:
+        self.gateway_http_client.base_url = self.original_base_url
+        self.http_client_patch.stop()
+        self.async_run_with_timeout(self.client_session.close())
+        self.async_run_with_timeout(self.gateway.stop())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    async def create_client_session() -> ClientSession:
+        return ClientSession()
+
+    def create_connector(self, connector_name: str = "uniswap") -> GatewayEVMAMM:
+        return GatewayEVMAMM(
+            client_config_map=self.client_config_map,
+            connector_name=connector_name,
+            chain="ethereum",
+            network="ropsten",
+            wallet_address="0xabc",
+            trading_pairs=["DAI-WETH"],
+            trading_required=False
+        )
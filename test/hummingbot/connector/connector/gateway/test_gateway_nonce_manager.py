@@ -0,0 +1,319 @@
+import asyncio
+import gc
+import unittest
+from decimal import Decimal
+from typing import Awaitable, Dict, List, Optional, Set
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.connector.gateway_EVM_AMM import GatewayEVMAMM
+from hummingbot.connector.gateway_nonce_manager import GatewayNonceManager
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayError
+from test.hummingbot.connector.connector.gateway.gateway_test_support import LocalGateway, LocalGatewayTestCase
+
+
+class FakeGateway(LocalGateway):
+    """
+    Local Gateway fake sending the transactions to a simulated network, which rejects the nonces already used.
+    """
+
+    def __init__(self, port: int, response_delay: float = 0.02):
+        super().__init__(port, response_delay)
+        self.used_nonces: Set[int] = set()
+        self.transaction_nonces: List[int] = []
+        self.next_nonce_requests = 0
+        self.failing_trades = 0
+        self.failing_nonces: Set[int] = set()
+        self.cancel_nonces: List[int] = []
+        self.transaction_statuses: Dict[str, int] = {}
+
+    @property
+    def network_next_nonce(self) -> int:
+        return max(self.used_nonces) + 1 if len(self.used_nonces) > 0 else 0
+
+    def add_routes(self, app: web.Application):
+        app.router.add_post("/evm/nextNonce", self._next_nonce)
+        app.router.add_post("/amm/trade", self._trade)
+        app.router.add_post("/evm/cancel", self._cancel)
+        app.router.add_post("/network/poll", self._poll)
+
+    async def _next_nonce(self, request: web.Request) -> web.Response:
+        self.next_nonce_requests += 1
+        return web.json_response({"nonce": self.network_next_nonce})
+
+    async def _trade(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        nonce: int = params["nonce"]
+        await asyncio.sleep(self.response_delay)
+        if self.failing_trades > 0 or nonce in self.failing_nonces:
+            self.failing_trades = max(0, self.failing_trades - 1)
+            return web.json_response({"errorCode": GatewayError.UnknownError.value,
+                                      "error": "Insufficient funds for nonce and gas"},
+                                     status=500)
+        if nonce in self.used_nonces:
+            return web.json_response({"errorCode": GatewayError.InvalidNonceError.value,
+                                      "error": f"Invalid nonce {nonce}: nonce has already been used"},
+                                     status=500)
+        self.used_nonces.add(nonce)
+        self.transaction_nonces.append(nonce)
+        return web.json_response({
+            "txHash": f"0x{nonce:064x}",
+            "nonce": nonce,
+            "gasPrice": 30,
+            "gasLimit": 200000,
+            "gasCost": "0.006",
+            "gasPriceToken": "ETH",
+        })
+
+    async def _cancel(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        nonce: int = params["nonce"]
+        self.used_nonces.add(nonce)
+        self.cancel_nonces.append(nonce)
+        return web.json_response({"txHash": f"0x{nonce:064x}"})
+
+    async def _poll(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        tx_hash: str = params["txHash"]
+        return web.json_response({"txHash": tx_hash,
+                                  "txStatus": self.transaction_statuses.get(tx_hash, 0),
+                                  "txReceipt": None})
+
+    def drop_transaction(self, nonce: int) -> str:
+        tx_hash: str = f"0x{nonce:064x}"
+        self.used_nonces.discard(nonce)
+        self.transaction_statuses[tx_hash] = -1
+        return tx_hash
+
+
+class GatewayNonceManagerTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.network_next_nonce = 10
+        self.fetch_count = 0
+        self.nonce_manager = GatewayNonceManager(self.fetch_next_nonce)
+
+    async def fetch_next_nonce(self) -> int:
+        self.fetch_count += 1
+        return self.network_next_nonce
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_allocates_monotonically_fetching_once(self):
+        nonces = self.async_run_with_timeout(asyncio.gather(*[self.nonce_manager.allocate() for _ in range(5)]))
+
+        self.assertEqual([10, 11, 12, 13, 14], sorted(nonces))
+        self.assertEqual(1, self.fetch_count)
+        self.assertEqual(15, self.nonce_manager.next_nonce)
+
+    def test_released_nonces_are_reused_first(self):
+        nonces = [self.async_run_with_timeout(self.nonce_manager.allocate()) for _ in range(3)]
+        self.nonce_manager.commit(nonces[0])
+        self.nonce_manager.release(nonces[1])
+        self.nonce_manager.commit(nonces[2])
+
+        self.assertEqual(11, self.async_run_with_timeout(self.nonce_manager.allocate()))
+        self.assertEqual(13, self.async_run_with_timeout(self.nonce_manager.allocate()))
+
+    def test_resync_fills_gaps(self):
+        nonces = [self.async_run_with_timeout(self.nonce_manager.allocate()) for _ in range(4)]
+        self.nonce_manager.commit(nonces[0])
+        self.nonce_manager.commit(nonces[1])
+        self.nonce_manager.commit(nonces[3])
+        # The transaction of nonces[1] is mined, nonces[2] is still being sent
+        self.nonce_manager.confirm(nonces[1])
+
+        self.network_next_nonce = 10
+        self.async_run_with_timeout(self.nonce_manager.resync())
+
+        # nonces[1] was confirmed by mistake (e.g. replaced by another transaction), it is a gap of the wallet
+        self.assertEqual([11], self.nonce_manager.released_nonces)
+        self.assertEqual({10, 12, 13}, self.nonce_manager.pending_nonces)
+        self.assertEqual(11, self.async_run_with_timeout(self.nonce_manager.allocate()))
+        self.assertEqual(14, self.async_run_with_timeout(self.nonce_manager.allocate()))
+
+    def test_gap_nonces_and_reclaim(self):
+        nonces = [self.async_run_with_timeout(self.nonce_manager.allocate()) for _ in range(3)]
+        self.nonce_manager.release(nonces[0])
+        self.assertEqual([], self.nonce_manager.gap_nonces)
+
+        self.nonce_manager.commit(nonces[1])
+
+        self.assertEqual([10], self.nonce_manager.gap_nonces)
+        self.assertTrue(self.nonce_manager.reclaim(10))
+        self.assertFalse(self.nonce_manager.reclaim(10))
+        self.assertEqual([], self.nonce_manager.gap_nonces)
+        self.assertEqual({10, 11, 12}, self.nonce_manager.pending_nonces)
+
+    def test_one_manager_per_wallet(self):
+        manager = GatewayNonceManager.for_wallet("ethereum", "mainnet", "0xABC", self.fetch_next_nonce)
+
+        self.assertIs(manager, GatewayNonceManager.for_wallet("ethereum", "mainnet", "0xabc", self.fetch_next_nonce))
+        self.assertIsNot(manager, GatewayNonceManager.for_wallet("ethereum", "kovan", "0xabc", self.fetch_next_nonce))
+
+        # The managers are not kept once no connector uses them
+        del manager
+        gc.collect()
+        self.assertNotIn(("ethereum", "mainnet", "0xabc"), GatewayNonceManager._wallet_managers)
+
+    def test_wallet_state_is_dropped_when_the_last_connector_stops(self):
+        self.nonce_manager.attach()
+        self.nonce_manager.attach()
+        nonce = self.async_run_with_timeout(self.nonce_manager.allocate())
+        self.nonce_manager.commit(nonce)
+
+        self.nonce_manager.detach()
+        self.assertEqual({10}, self.nonce_manager.pending_nonces)
+
+        self.nonce_manager.detach()
+        self.assertEqual(set(), self.nonce_manager.pending_nonces)
+        self.network_next_nonce = 11
+        self.assertEqual(11, self.async_run_with_timeout(self.nonce_manager.allocate()))
+        self.assertEqual(2, self.fetch_count)
+
+    def test_committed_nonce_of_dropped_transaction_is_released(self):
+        nonces = [self.async_run_with_timeout(self.nonce_manager.allocate()) for _ in range(2)]
+        self.nonce_manager.commit(nonces[0])
+        self.nonce_manager.commit(nonces[1])
+
+        self.nonce_manager.release(nonces[0])
+
+        self.assertEqual([10], self.nonce_manager.gap_nonces)
+        self.assertEqual({11}, self.nonce_manager.pending_nonces)
+
+    def test_resync_skips_nonces_used_by_other_transactions(self):
+        self.async_run_with_timeout(self.nonce_manager.allocate())
+        self.network_next_nonce = 20
+
+        self.async_run_with_timeout(self.nonce_manager.resync())
+        self.nonce_manager.release(10)
+
+        self.assertEqual([], self.nonce_manager.released_nonces)
+        self.assertEqual(20, self.async_run_with_timeout(self.nonce_manager.allocate()))
+
+
+class GatewayEVMAMMNonceTest(LocalGatewayTestCase):
+
+    def create_gateway(self, port: int) -> FakeGateway:
+        return FakeGateway(port)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connectors: List[GatewayEVMAMM] = []
+        self.connector = self.create_connector("uniswap")
+
+    def tearDown(self) -> None:
+        for connector in self.connectors:
+            self.async_run_with_timeout(connector.stop_network())
+        super().tearDown()
+
+    def create_connector(self, connector_name: str = "uniswap") -> GatewayEVMAMM:
+        connector = super().create_connector(connector_name)
+        self.async_run_with_timeout(connector.start_network())
+        self.connectors.append(connector)
+        return connector
+
+    def create_orders(self, count: int, connectors: Optional[List[GatewayEVMAMM]] = None) -> List[str]:
+        connectors = connectors or [self.connector]
+        orders = [(connector, connector.create_market_order_id(TradeType.BUY, "DAI-WETH") + f"-{i}")
+                  for connector in connectors
+                  for i in range(count)]
+        self.async_run_with_timeout(asyncio.gather(*[
+            connector._create_order(TradeType.BUY, order_id, "DAI-WETH", Decimal("100"), Decimal("0.5"))
+            for connector, order_id in orders
+        ]))
+        return [order_id for _, order_id in orders]
+
+    def order_nonces(self, order_ids: List[str], connector: Optional[GatewayEVMAMM] = None) -> List[int]:
+        connector = connector or self.connector
+        return [connector._order_tracker.fetch_order(client_order_id=order_id).nonce for order_id in order_ids]
+
+    def test_transactions_sent_back_to_back(self):
+        order_ids = self.create_orders(5)
+
+        self.assertEqual([0, 1, 2, 3, 4], sorted(self.order_nonces(order_ids)))
+        self.assertEqual([0, 1, 2, 3, 4], sorted(self.gateway.transaction_nonces))
+        self.assertEqual(1, self.gateway.next_nonce_requests)
+
+    @patch("hummingbot.connector.gateway_nonce_manager.GatewayNonceManager.logger")
+    @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.logger")
+    def test_nonce_conflict_resyncs_and_resends(self, *_):
+        self.create_orders(2)
+        # Another client of the wallet sends transactions with the next nonces
+        self.gateway.used_nonces.update({2, 3})
+
+        order_ids = self.create_orders(2)
+
+        self.assertEqual([4, 5], sorted(self.order_nonces(order_ids)))
+        self.assertEqual([0, 1, 4, 5], sorted(self.gateway.transaction_nonces))
+
+    @patch("hummingbot.connector.gateway_EVM_AMM.GatewayEVMAMM.logger")
+    @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.logger")
+    def test_nonce_of_failed_transaction_is_reused(self, *_):
+        self.gateway.failing_trades = 1
+        failed_order_id = self.create_orders(1)[0]
+        self.assertTrue(self.connector._order_tracker.fetch_order(client_order_id=failed_order_id).is_failure)
+
+        order_ids = self.create_orders(1)
+
+        self.assertEqual([0], self.order_nonces(order_ids))
+        self.assertEqual(1, self.gateway.next_nonce_requests)
+
+    def test_connectors_of_the_same_wallet_share_the_nonces(self):
+        other_connector = self.create_connector("sushiswap")
+
+        order_ids = self.create_orders(2, connectors=[self.connector, other_connector])
+
+        nonces = self.order_nonces(order_ids[:2]) + self.order_nonces(order_ids[2:], connector=other_connector)
+        self.assertEqual([0, 1, 2, 3], sorted(nonces))
+        self.assertEqual([0, 1, 2, 3], sorted(self.gateway.transaction_nonces))
+        self.assertEqual(1, self.gateway.next_nonce_requests)
+
+    @patch("hummingbot.connector.gateway_EVM_AMM.GatewayEVMAMM.logger")
+    @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.logger")
+    def test_nonce_gap_left_by_failed_transaction_is_filled(self, *_):
+        self.gateway.failing_nonces = {0}
+
+        order_ids = self.create_orders(3)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertTrue(self.connector._order_tracker.fetch_order(client_order_id=order_ids[0]).is_failure)
+        self.assertEqual([1, 2], sorted(self.gateway.transaction_nonces))
+        self.assertEqual([0], self.gateway.cancel_nonces)
+        self.assertEqual([], self.connector._nonce_manager.gap_nonces)
+        self.assertEqual(3, self.async_run_with_timeout(self.connector._nonce_manager.allocate()))
+        self.connector._nonce_manager.release(3)
+
+    @patch("hummingbot.connector.gateway_EVM_AMM.GatewayEVMAMM.logger")
+    def test_nonce_of_dropped_transaction_is_reused(self, _):
+        order_ids = self.create_orders(2)
+        dropped_order = self.connector._order_tracker.fetch_order(client_order_id=order_ids[0])
+        self.gateway.drop_transaction(dropped_order.nonce)
+
+        self.async_run_with_timeout(self.connector.update_order_status([dropped_order]))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual([dropped_order.nonce], self.gateway.cancel_nonces)
+        self.assertEqual([], self.connector._nonce_manager.gap_nonces)
+
+    def test_connectors_of_another_run_start_from_the_network_nonce(self):
+        self.create_orders(2)
+        self.async_run_with_timeout(self.connector.stop_network())
+        # Another client of the wallet sent transactions while the connector was stopped
+        self.gateway.used_nonces.update({2, 3})
+
+        connector = self.create_connector("uniswap")
+        order_ids = self.create_orders(1, connectors=[connector])
+
+        self.assertEqual([4], self.order_nonces(order_ids, connector=connector))
+        self.assertEqual(2, self.gateway.next_nonce_requests)
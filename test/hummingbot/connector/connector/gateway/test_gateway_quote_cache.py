@@ -0,0 +1,218 @@
+import asyncio
+import gc
+import unittest
+from collections import Counter
+from decimal import Decimal
+from typing import Awaitable, List
+
+from aiohttp import web
+
+from hummingbot.connector.gateway_EVM_AMM import GatewayEVMAMM
+from hummingbot.connector.gateway_quote_cache import GatewayQuoteCache
+from test.hummingbot.connector.connector.gateway.gateway_test_support import LocalGateway, LocalGatewayTestCase
+
+
+class StubGateway(LocalGateway):
+    """
+    Local Gateway stub answering the price and network status requests, and counting the requests received.
+    """
+
+    def __init__(self, port: int, response_delay: float = 0.05):
+        super().__init__(port, response_delay)
+        self.request_counts: Counter = Counter()
+        self.block_number = 100
+
+    def add_routes(self, app: web.Application):
+        app.router.add_post("/amm/price", self._price)
+        app.router.add_get("/network/status", self._network_status)
+
+    async def _price(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        self.request_counts[(params["base"], params["quote"], params["side"], params["amount"])] += 1
+        await asyncio.sleep(self.response_delay)
+        return web.json_response({
+            "price": "0.5" if params["side"] == "BUY" else "0.4",
+            "gasLimit": 200000,
+            "gasPrice": 30,
+            "gasCost": "0.006",
+            "gasPriceToken": "ETH",
+        })
+
+    async def _network_status(self, request: web.Request) -> web.Response:
+        self.request_counts["network/status"] += 1
+        return web.json_response({"currentBlockNumber": self.block_number})
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_concurrent_requests_share_one_call(self):
+        cache = GatewayQuoteCache(ttl=10)
+        calls: List[str] = []
+
+        async def fetch():
+            calls.append("fetch")
+            await asyncio.sleep(0.01)
+            return Decimal("1")
+
+        results = self.async_run_with_timeout(asyncio.gather(*[cache.get("key", fetch) for _ in range(5)]))
+
+        self.assertEqual([Decimal("1")] * 5, results)
+        self.assertEqual(1, len(calls))
+
+        # The next requests are served from the cache
+        self.assertEqual(Decimal("1"), self.async_run_with_timeout(cache.get("key", fetch)))
+        self.assertEqual(1, len(calls))
+
+    def test_no_ttl_only_shares_concurrent_calls(self):
+        cache = GatewayQuoteCache(ttl=0)
+        calls: List[str] = []
+
+        async def fetch():
+            calls.append("fetch")
+            await asyncio.sleep(0.01)
+            return Decimal("1")
+
+        self.async_run_with_timeout(asyncio.gather(cache.get("key", fetch), cache.get("key", fetch)))
+        self.async_run_with_timeout(cache.get("key", fetch))
+
+        self.assertEqual(2, len(calls))
+
+    def test_errors_are_raised_to_all_waiters_and_not_cached(self):
+        cache = GatewayQuoteCache(ttl=10)
+        calls: List[str] = []
+
+        async def fetch():
+            calls.append("fetch")
+            await asyncio.sleep(0.01)
+            raise IOError("Gateway error")
+
+        results = self.async_run_with_timeout(
+            asyncio.gather(cache.get("key", fetch), cache.get("key", fetch), return_exceptions=True))
+
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(1, len(calls))
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(cache.get("key", fetch))
+        self.assertEqual(2, len(calls))
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        cache = GatewayQuoteCache(ttl=10)
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return Decimal("1")
+
+        async def run():
+            first = asyncio.ensure_future(cache.get("key", fetch))
+            second = asyncio.ensure_future(cache.get("key", fetch))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        self.assertEqual(Decimal("1"), self.async_run_with_timeout(run()))
+
+    def test_error_of_a_request_without_waiters_is_retrieved(self):
+        cache = GatewayQuoteCache(ttl=10)
+        unhandled_errors = []
+        self.ev_loop.set_exception_handler(lambda loop, context: unhandled_errors.append(context))
+        self.addCleanup(self.ev_loop.set_exception_handler, None)
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise IOError("Gateway error")
+
+        async def run():
+            waiter = asyncio.ensure_future(cache.get("key", fetch))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0.05)
+
+        self.async_run_with_timeout(run())
+        gc.collect()
+
+        self.assertEqual([], unhandled_errors)
+
+    def test_quotes_expire_with_new_blocks(self):
+        cache = GatewayQuoteCache(ttl=10)
+        quotes = iter([Decimal("1"), Decimal("2")])
+
+        async def fetch():
+            return next(quotes)
+
+        cache.update_block_number(1)
+        self.assertEqual(Decimal("1"), self.async_run_with_timeout(cache.get("key", fetch)))
+        cache.update_block_number(1)
+        self.assertEqual(Decimal("1"), self.async_run_with_timeout(cache.get("key", fetch)))
+        cache.update_block_number(2)
+        self.assertEqual(Decimal("2"), self.async_run_with_timeout(cache.get("key", fetch)))
+
+    def test_amount_bucket(self):
+        cache = GatewayQuoteCache(ttl=10, amount_significant_digits=3)
+
+        self.assertEqual(cache.amount_bucket(Decimal("1000.4")), cache.amount_bucket(Decimal("1000")))
+        self.assertEqual(Decimal("0.00123"), cache.amount_bucket(Decimal("0.0012341")))
+        self.assertNotEqual(cache.amount_bucket(Decimal("1010")), cache.amount_bucket(Decimal("1000")))
+        self.assertEqual(Decimal("0"), cache.amount_bucket(Decimal("0")))
+        self.assertEqual(Decimal("1000.4"), GatewayQuoteCache(ttl=10).amount_bucket(Decimal("1000.40")))
+
+
+class GatewayEVMAMMQuoteCacheTest(LocalGatewayTestCase):
+
+    def create_gateway(self, port: int) -> StubGateway:
+        return StubGateway(port)
+
+    def create_connector(self, connector_name: str = "uniswap") -> GatewayEVMAMM:
+        connector = super().create_connector(connector_name)
+        connector._allowances = {"DAI": Decimal("1e10"), "WETH": Decimal("1e10")}
+        connector._account_balances = {"ETH": Decimal("1")}
+        return connector
+
+    def test_concurrent_identical_quotes_share_one_gateway_request(self):
+        connector = self.create_connector()
+
+        async def request_quotes():
+            return await asyncio.gather(*[
+                connector.get_quote_price("DAI-WETH", is_buy, Decimal("1000"))
+                for is_buy in (True, False)
+                for _ in range(10)
+            ])
+
+        prices = self.async_run_with_timeout(request_quotes())
+
+        self.assertEqual([Decimal("0.5")] * 10 + [Decimal("0.4")] * 10, prices)
+        self.assertEqual(2, sum(self.gateway.request_counts.values()))
+        self.assertEqual(1, self.gateway.request_counts[("DAI", "WETH", "BUY", f"{Decimal('1000'):.18f}")])
+        self.assertEqual(1, self.gateway.request_counts[("DAI", "WETH", "SELL", f"{Decimal('1000'):.18f}")])
+
+        # Quotes within the TTL do not reach the gateway
+        self.async_run_with_timeout(request_quotes())
+        self.assertEqual(2, sum(self.gateway.request_counts.values()))
+
+        # Another amount is another quote
+        self.async_run_with_timeout(connector.get_quote_price("DAI-WETH", True, Decimal("2000")))
+        self.assertEqual(3, sum(self.gateway.request_counts.values()))
+
+    def test_quotes_expire_with_new_blocks(self):
+        self.client_config_map.gateway.gateway_quote_cache_per_block = True
+        connector = self.create_connector()
+
+        self.async_run_with_timeout(connector._update_block_number())
+        self.async_run_with_timeout(connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+        self.async_run_with_timeout(connector._update_block_number())
+        self.async_run_with_timeout(connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+        self.assertEqual(1, self.gateway.request_counts[("DAI", "WETH", "BUY", f"{Decimal('1000'):.18f}")])
+
+        self.gateway.block_number += 1
+        self.async_run_with_timeout(connector._update_block_number())
+        self.async_run_with_timeout(connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+        self.assertEqual(2, self.gateway.request_counts[("DAI", "WETH", "BUY", f"{Decimal('1000'):.18f}")])
+        self.assertEqual(3, self.gateway.request_counts["network/status"])
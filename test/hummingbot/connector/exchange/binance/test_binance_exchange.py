@@ -15,10 +15,12 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
+from hummingbot.core.utils.order_tracing import OrderStage, strategy_tick_started
 
 
 class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -973,6 +975,149 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_reconciles_open_orders_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._last_poll_timestamp = (self.exchange.current_timestamp -
+                                              self.exchange.UPDATE_ORDER_STATUS_MIN_INTERVAL - 1)
+        for order_number in range(1, 6):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{order_number}",
+                exchange_order_id=f"10023{order_number}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        partially_filled_order = self.exchange.in_flight_orders["OID2"]
+        canceled_order = self.exchange.in_flight_orders["OID3"]
+        other_open_orders = [self.exchange.in_flight_orders["OID4"], self.exchange.in_flight_orders["OID5"]]
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        open_orders = [
+            self._order_status_request_open_mock_response(order=open_order),
+            self._order_status_request_open_mock_response(order=partially_filled_order),
+        ] + [self._order_status_request_open_mock_response(order=order) for order in other_open_orders]
+        open_orders[1]["status"] = "PARTIALLY_FILLED"
+        mock_api.get(regex_url, body=json.dumps(open_orders))
+        order_url = self.configure_canceled_order_status_response(order=canceled_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        bulk_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(bulk_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         bulk_request.kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(canceled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+
+        self.assertTrue(open_order.is_open)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, partially_filled_order.current_state)
+        self.assertTrue(canceled_order.is_cancelled)
+        self.assertTrue(all(order.is_open for order in other_open_orders))
+        # Four order status requests were replaced by a single open orders request
+        self.assertEqual(4 * 1 - 3, self.exchange._throttler.saved_weights[CONSTANTS.REQUEST_WEIGHT])
+        self.assertEqual(4, self.exchange._throttler.saved_weights[CONSTANTS.ORDERS])
+
+    @aioresponses()
+    def test_update_order_status_queries_orders_individually_when_bulk_request_saves_no_weight(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._last_poll_timestamp = (self.exchange.current_timestamp -
+                                              self.exchange.UPDATE_ORDER_STATUS_MIN_INTERVAL - 1)
+        # The open orders request weight (3) is the weight of three order status requests
+        for order_number in range(1, 4):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{order_number}",
+                exchange_order_id=f"10023{order_number}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([]))
+        order_url = None
+        for order in self.exchange.in_flight_orders.values():
+            order_url = self.configure_open_order_status_response(order=order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, open_orders_url)))
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, order_url)))
+        self.assertNotIn(CONSTANTS.REQUEST_WEIGHT, self.exchange._throttler.saved_weights)
+
+    @aioresponses()
+    def test_batch_order_create_submits_all_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      repeat=True)
+        orders_to_create = [
+            LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("9990"), Decimal("100")),
+            LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("10010"), Decimal("50")),
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create=orders_to_create)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        self.assertEqual([True, False], [order.is_buy for order in created_orders])
+        for order in created_orders:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertEqual(order.price, in_flight_order.price)
+            self.assertEqual(order.quantity, in_flight_order.amount)
+        self.assertEqual(created_orders[0].client_order_id, self.buy_order_created_logger.event_log[0].order_id)
+        self.assertEqual(created_orders[1].client_order_id, self.sell_order_created_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_create_registers_the_submission_of_each_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      repeat=True)
+        orders_to_create = [
+            LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("9990"), Decimal("100")),
+            LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("10010"), Decimal("50")),
+        ]
+
+        strategy_tick_started()
+        created_orders = self.exchange.batch_order_create(orders_to_create=orders_to_create)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        for order in created_orders:
+            in_flight_order = self.exchange._order_tracker.fetch_order(client_order_id=order.client_order_id)
+            self.assertIn(OrderStage.DECISION, in_flight_order.stage_timestamps)
+            self.assertIn(OrderStage.SUBMITTED, in_flight_order.stage_timestamps)
+            self.assertLessEqual(in_flight_order.stage_timestamps[OrderStage.DECISION],
+                                 in_flight_order.stage_timestamps[OrderStage.SUBMITTED])
+
+    @patch("hummingbot.connector.exchange.binance.binance_exchange.BinanceExchange._create_order", new_callable=AsyncMock)
+    def test_batch_order_create_passes_order_parameters_to_order_creation(self, create_order_mock):
+        orders_to_create = [
+            LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("9990"), Decimal("100")),
+            LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("10010"), Decimal("50")),
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create=orders_to_create,
+                                                          position_action=PositionAction.OPEN)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, create_order_mock.call_count)
+        for order, call in zip(created_orders, create_order_mock.call_args_list):
+            self.assertEqual(order.client_order_id, call.kwargs["order_id"])
+            self.assertEqual(PositionAction.OPEN, call.kwargs["position_action"])
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
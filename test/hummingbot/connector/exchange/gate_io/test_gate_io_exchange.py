@@ -20,6 +20,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -547,6 +548,76 @@ class TestGateIoExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create_uses_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {"text": "OID1", "id": "EOID1", "succeeded": True, "status": "open"},
+            {"text": "OID2", "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+
+        orders_to_create = [
+            LimitOrder("OID1", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("5.1"), Decimal("1")),
+            LimitOrder("OID2", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("5.2"), Decimal("2")),
+        ]
+        self.async_run_with_timeout(
+            self.exchange._execute_batch_order_create(orders_to_create=orders_to_create, order_type=OrderType.LIMIT))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual([self.ex_trading_pair] * 2, [order_data["currency_pair"] for order_data in request_data])
+        self.assertEqual([Decimal("5.1"), Decimal("5.2")], [Decimal(order_data["price"]) for order_data in request_data])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_uses_batch_endpoint(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ["OID1", "OID2"]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders["OID1"], self.exchange.in_flight_orders["OID2"]]
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {"currency_pair": self.ex_trading_pair, "id": "EOID1", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "EOID2", "succeeded": False,
+             "label": "ORDER_NOT_FOUND", "message": "Order not found"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+            orders_to_cancel=[order.to_limit_order() for order in orders]))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self.assertEqual([{"currency_pair": self.ex_trading_pair, "id": "EOID1"},
+                          {"currency_pair": self.ex_trading_pair, "id": "EOID2"}],
+                         json.loads(cancel_request[1][0].kwargs["data"]))
+        self.assertEqual([("OID1", True), ("OID2", False)],
+                         [(result.order_id, result.success) for result in results])
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertTrue(self._is_logged("ERROR", "Failed to cancel order OID2 (Order not found)"))
+
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     @aioresponses()
     def test_create_order_fails(self, _, mock_api):
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -674,6 +675,66 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create_uses_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"clientOid": "OID1", "id": "EOID1", "status": "success", "failMsg": None},
+                    {"clientOid": "OID2", "id": None, "status": "fail", "failMsg": "Balance insufficient"},
+                ]
+            }}
+        mock_api.post(regex_url, body=json.dumps(creation_response))
+
+        orders_to_create = [
+            LimitOrder("OID1", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("10000"),
+                       Decimal("100")),
+            LimitOrder("OID2", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("10100"),
+                       Decimal("100")),
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(
+            orders_to_create=orders_to_create, order_type=OrderType.LIMIT_MAKER))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data["orderList"]])
+        self.assertTrue(all(order_data["postOnly"] for order_data in request_data["orderList"]))
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
+    def test_batch_order_create_groups_orders_by_trading_pair(self):
+        other_trading_pair = "BTC-USDT"
+        orders = [
+            InFlightOrder(
+                client_order_id=f"OID{index}",
+                trading_pair=self.trading_pair if index % 2 == 0 else other_trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1"),
+                price=Decimal("1"),
+                creation_timestamp=1640780000)
+            for index in range(12)
+        ]
+
+        batches = self.exchange._split_batch_order_create(orders)
+
+        self.assertEqual([5, 1, 5, 1], [len(batch) for batch in batches])
+        for batch in batches:
+            self.assertEqual(1, len(set(order.trading_pair for order in batch)))
+
     @aioresponses()
     def test_create_order_fails_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -14,7 +14,9 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import OrderType
 
@@ -854,6 +856,80 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
 
         self.assertEqual(result, expected_client_order_id)
 
+    @aioresponses()
+    def test_batch_order_create_uses_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH)
+        response = {
+            "code": "1",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "", "tag": "", "sCode": "51008", "sMsg": "Insufficient balance"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        orders_to_create = [
+            LimitOrder("OID1", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("10000"),
+                       Decimal("100")),
+            LimitOrder("OID2", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("10100"),
+                       Decimal("100")),
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(
+            orders_to_create=orders_to_create, order_type=OrderType.LIMIT))
+
+        create_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(create_request)
+        request_data = json.loads(create_request.kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual([self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)] * 2,
+                         [order_data["instId"] for order_data in request_data])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_uses_batch_endpoint(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ["OID1", "OID2"]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders["OID1"], self.exchange.in_flight_orders["OID2"]]
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "1",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "EOID1", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "EOID2", "sCode": "51400", "sMsg": "Cancellation failed"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+            orders_to_cancel=[order.to_limit_order() for order in orders]))
+
+        cancel_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(cancel_request)
+        self.assertEqual([{"clOrdId": "OID1", "instId": self.trading_pair},
+                          {"clOrdId": "OID2", "instId": self.trading_pair}],
+                         json.loads(cancel_request.kwargs["data"]))
+        self.assertEqual([("OID1", True), ("OID2", False)],
+                         [(result.order_id, result.success) for result in results])
+        self.assertTrue(self.is_logged("ERROR", "Failed to cancel order OID2 (Cancellation failed)"))
+
     def _order_cancelation_request_successful_mock_response(self, order: InFlightOrder) -> Any:
         return {
             "code": "0",
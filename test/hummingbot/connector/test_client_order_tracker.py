@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.client_order_tracker import ORDER_CREATION_METRIC, ClientOrderTracker
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -21,6 +21,12 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.utils.order_tracing import (
+    OrderStage,
+    record_traced_order_stage,
+    strategy_tick_started,
+    traced_order,
+)
 
 
 class MockExchange(ExchangeBase):
@@ -250,6 +256,78 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertTrue(fetched_order == order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker._orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertEqual(0, len(self.tracker._orders_pending_exchange_order_id))
+
+        other_order: InFlightOrder = InFlightOrder(
+            client_order_id="someOtherClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(other_order)
+        self.tracker.update_exchange_order_id(other_order, "someOtherExchangeOrderId")
+
+        self.assertEqual("someOtherExchangeOrderId", other_order.exchange_order_id)
+        self.assertIs(other_order, self.tracker._orders_by_exchange_order_id["someOtherExchangeOrderId"])
+        self.assertIs(other_order, self.tracker.fetch_order(exchange_order_id="someOtherExchangeOrderId"))
+
+    def test_fetch_order_by_exchange_order_id_for_cached_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_fetch_order_by_exchange_order_id_evicted_with_cached_order(self):
+        tracker = ClientOrderTracker(self.connector)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", tracker._orders_by_exchange_order_id)
+
     def test_fetch_order_does_not_match_orders_with_undefined_exchange_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -357,6 +435,110 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.assertEqual(event_logged.trading_pair, order.trading_pair)
         self.assertEqual(event_logged.type, order.order_type)
 
+    def test_process_order_update_records_order_creation_time(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        creation_metric = ORDER_CREATION_METRIC.labels(self.connector.name, TradeType.SELL.name)
+        initial_count = creation_metric.count
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_creation_update))
+
+        self.assertEqual(initial_count + 1, creation_metric.count)
+
+    def test_order_stage_latencies(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        strategy_tick_started()
+        self.tracker.register_order_submission(order.client_order_id)
+        self.tracker.start_tracking_order(order)
+        with traced_order(order):
+            record_traced_order_stage(OrderStage.THROTTLER_ACQUIRED)
+            record_traced_order_stage(OrderStage.REQUEST_SENT)
+            record_traced_order_stage(OrderStage.RESPONSE_RECEIVED)
+        record_traced_order_stage(OrderStage.FIRST_FILL)
+
+        self.assertEqual(
+            [OrderStage.DECISION, OrderStage.SUBMITTED, OrderStage.THROTTLER_ACQUIRED, OrderStage.REQUEST_SENT,
+             OrderStage.RESPONSE_RECEIVED],
+            list(order.stage_timestamps))
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_creation_update))
+
+        latencies = self.tracker.order_stage_latencies
+        self.assertEqual({OrderStage.SUBMITTED, OrderStage.THROTTLER_ACQUIRED, OrderStage.REQUEST_SENT,
+                          OrderStage.RESPONSE_RECEIVED, OrderStage.EXCHANGE_ACK}, set(latencies))
+        self.assertEqual(1, latencies[OrderStage.EXCHANGE_ACK].count)
+
+        trade_update: TradeUpdate = TradeUpdate(
+            trade_id="1",
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=order.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("500.0"),
+            fill_quote_amount=Decimal("500.0"),
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("0.5"))]),
+            fill_timestamp=2,
+        )
+        self.tracker.process_trade_update(trade_update)
+        self.tracker.process_trade_update(trade_update._replace(trade_id="2"))
+
+        latencies = self.tracker.order_stage_latencies
+        self.assertEqual(1, latencies[OrderStage.FIRST_FILL].count)
+        self.assertEqual(order.stage_latency(OrderStage.FIRST_FILL), latencies[OrderStage.FIRST_FILL].sum)
+
+    def test_failed_order_is_not_acknowledged(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_failure_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.FAILED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_failure_update))
+
+        self.assertEqual([OrderStage.SUBMITTED], list(order.stage_timestamps))
+        self.assertEqual({}, self.tracker.order_stage_latencies)
+
     def test_process_order_update_trigger_order_creation_event_without_client_order_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -225,3 +225,21 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
         self.assertTrue(context.within_capacity())
+
+    def test_request_weights(self):
+        self.assertEqual({TEST_WEIGHTED_POOL_ID: 5, TEST_WEIGHTED_TASK_1_ID: 1},
+                         self.throttler.request_weights(limit_id=TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual({}, self.throttler.request_weights(limit_id="unknown_limit_id"))
+
+    def test_report_saved_requests_accumulates_net_savings(self):
+        saved = self.throttler.report_saved_requests(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                                                     count=3,
+                                                     replaced_by_limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                     replaced_by_count=2)
+
+        self.assertEqual({TEST_WEIGHTED_POOL_ID: 13, TEST_WEIGHTED_TASK_1_ID: 3, TEST_WEIGHTED_TASK_2_ID: -2}, saved)
+
+        self.throttler.report_saved_requests(limit_id=TEST_WEIGHTED_TASK_2_ID, count=1)
+
+        self.assertEqual({TEST_WEIGHTED_POOL_ID: 14, TEST_WEIGHTED_TASK_1_ID: 3, TEST_WEIGHTED_TASK_2_ID: -1},
+                         self.throttler.saved_weights)
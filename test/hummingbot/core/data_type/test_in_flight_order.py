@@ -9,6 +9,7 @@ from hummingbot.core.data_type.common import OrderType, PositionAction, TradeTyp
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.utils.order_tracing import OrderStage
 
 
 class InFlightOrderPyUnitTests(unittest.TestCase):
@@ -216,6 +217,28 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertEqual(expected_average_price, order_1.average_executed_price)
 
     @patch("hummingbot.core.data_type.in_flight_order.GET_EX_ORDER_ID_TIMEOUT", 0.1)
+    def test_record_stage_and_stage_latency(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.assertTrue(order.record_stage(OrderStage.SUBMITTED, 10.0))
+        self.assertTrue(order.record_stage(OrderStage.REQUEST_SENT, 10.5))
+        self.assertFalse(order.record_stage(OrderStage.REQUEST_SENT, 11.0))
+        self.assertTrue(order.record_stage(OrderStage.EXCHANGE_ACK, 12.0))
+
+        self.assertEqual(10.5, order.stage_timestamps[OrderStage.REQUEST_SENT])
+        self.assertIsNone(order.stage_latency(OrderStage.SUBMITTED))
+        self.assertEqual(0.5, order.stage_latency(OrderStage.REQUEST_SENT))
+        self.assertEqual(1.5, order.stage_latency(OrderStage.EXCHANGE_ACK))
+        self.assertIsNone(order.stage_latency(OrderStage.FIRST_FILL))
+
     def test_get_exchange_order_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id=self.client_order_id,
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class LadderOrderBookTest(unittest.TestCase):
+
+    @staticmethod
+    def get_price(order_book: OrderBook, is_buy: bool):
+        try:
+            return order_book.get_price(is_buy)
+        except EnvironmentError:
+            return None
+
+    def assert_same_books(self, expected: OrderBook, actual: OrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for is_buy in (True, False):
+            self.assertEqual(self.get_price(expected, is_buy), self.get_price(actual, is_buy))
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+
+    def test_snapshot_and_diffs(self):
+        order_book = LadderOrderBook()
+        order_book.apply_snapshot(
+            bids=[OrderBookRow(9, 1, 1), OrderBookRow(10, 2, 1), OrderBookRow(8, 3, 1)],
+            asks=[OrderBookRow(12, 1, 1), OrderBookRow(11, 2, 1)],
+            update_id=1)
+
+        self.assertEqual([10, 9, 8], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        order_book.apply_diffs(
+            bids=[OrderBookRow(10, 0, 2), OrderBookRow(9, 5, 2), OrderBookRow(9.5, 1, 2)],
+            asks=[OrderBookRow(10.5, 4, 2), OrderBookRow(13, 0, 2)],
+            update_id=2)
+
+        self.assertEqual([OrderBookRow(9.5, 1, 2), OrderBookRow(9, 5, 2), OrderBookRow(8, 3, 1)],
+                         list(order_book.bid_entries()))
+        self.assertEqual([10.5, 11, 12], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(10.5, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(7, order_book.get_volume_for_price(True, 20).result_volume)
+
+    def test_empty_book_has_no_price(self):
+        order_book = LadderOrderBook()
+
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(False)
+
+    def test_truncate_overlap_entries_dex(self):
+        order_book = LadderOrderBook(dex=True)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [50, 0.01, 4]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bids, asks = order_book.snapshot
+        self.assertEqual([3., 1., 3.], bids.iloc[0].tolist())
+        self.assertEqual([4., 1., 1.], asks.iloc[0].tolist())
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 5]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual([3.5, 1., 5.], bids.iloc[0].tolist())
+        self.assertEqual([4., 1., 1.], asks.iloc[0].tolist())
+
+    def test_truncate_overlap_entries_cex(self):
+        order_book = LadderOrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        order_book.apply_numpy_diffs(np.array([[50, 0.01, 6]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual([50., 0.01, 6.], bids.iloc[0].tolist())
+        self.assertEqual(0, len(asks))
+
+    def test_same_results_as_order_book(self):
+        rng = random.Random(42)
+        for dex in (False, True):
+            expected = OrderBook(dex=dex)
+            actual = LadderOrderBook(dex=dex)
+            bids = [OrderBookRow(100 - i * 0.5, rng.randint(1, 10), 1) for i in range(50)]
+            asks = [OrderBookRow(100.5 + i * 0.5, rng.randint(1, 10), 1) for i in range(50)]
+            bids.append(OrderBookRow(bids[3].price, 99, 1))
+            for order_book in (expected, actual):
+                order_book.apply_snapshot(bids, asks, 1)
+            self.assert_same_books(expected, actual)
+
+            for update_id in range(2, 500):
+                diff_bids = [OrderBookRow(rng.randint(150, 210) * 0.5, rng.choice((0, 0, 1, 5)), update_id)
+                             for _ in range(rng.randint(0, 5))]
+                diff_asks = [OrderBookRow(rng.randint(190, 250) * 0.5, rng.choice((0, 0, 1, 5)), update_id)
+                             for _ in range(rng.randint(0, 5))]
+                for order_book in (expected, actual):
+                    order_book.apply_diffs(diff_bids, diff_asks, update_id)
+                self.assert_same_books(expected, actual)
+                for is_buy in (True, False):
+                    self.assertEqual(expected.get_price_for_volume(is_buy, 20).result_price,
+                                     actual.get_price_for_volume(is_buy, 20).result_price)
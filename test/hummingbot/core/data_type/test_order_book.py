@@ -58,3 +58,18 @@ def main():
 
 if __name__ == "__main__":
     main()
+
+    def test_top_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 4, 1], [5, 5, 2], [6, 6, 3], [7, 7, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.top_levels(2)
+
+        self.assertEqual([(3., 3.), (2., 2.)], [(row.price, row.amount) for row in bids])
+        self.assertEqual([(4., 4.), (5., 5.)], [(row.price, row.amount) for row in asks])
+        bids, asks = order_book.top_levels(10)
+        self.assertEqual(list(order_book.bid_entries()), bids)
+        self.assertEqual(list(order_book.ask_entries()), asks)
+        self.assertEqual(([], []), OrderBook().top_levels(5))
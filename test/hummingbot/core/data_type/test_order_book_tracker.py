@@ -0,0 +1,212 @@
+import asyncio
+import random
+import unittest
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class RecordedDiffStream:
+    """
+    A deterministic stream of diff messages (Binance style, each diff covering the update ids from first_update_id to
+    update_id), with the exchange order book after each diff to answer the snapshot requests.
+    """
+
+    def __init__(self, trading_pair: str, diffs_count: int, seed: int = 42):
+        rng = random.Random(seed)
+        self.trading_pair = trading_pair
+        self.diffs: List[OrderBookMessage] = []
+        self.books: List[Tuple[Dict[float, float], Dict[float, float], int]] = []
+        bids: Dict[float, float] = {float(price): 1.0 for price in range(90, 100)}
+        asks: Dict[float, float] = {float(price): 1.0 for price in range(101, 111)}
+        update_id = 1000
+        self.books.append((dict(bids), dict(asks), update_id))
+        for _ in range(diffs_count):
+            first_update_id = update_id + 1
+            update_id += rng.randint(1, 3)
+            diff_bids = [[float(rng.randint(90, 99)), float(rng.choice([0, 1, 2, 3]))] for _ in range(2)]
+            diff_asks = [[float(rng.randint(101, 110)), float(rng.choice([0, 1, 2, 3]))] for _ in range(2)]
+            for side, levels in ((bids, diff_bids), (asks, diff_asks)):
+                for price, amount in levels:
+                    if amount == 0:
+                        side.pop(price, None)
+                    else:
+                        side[price] = amount
+            self.diffs.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair,
+                "first_update_id": first_update_id,
+                "update_id": update_id,
+                "bids": diff_bids,
+                "asks": diff_asks,
+                "checksum": self.checksum(bids, asks),
+            }, timestamp=float(update_id)))
+            self.books.append((dict(bids), dict(asks), update_id))
+
+    @staticmethod
+    def checksum(bids: Dict[float, float], asks: Dict[float, float]) -> float:
+        return sum(price * amount for price, amount in bids.items()) + sum(price * amount for price, amount in asks.items())
+
+    def snapshot(self, published_diffs: int) -> OrderBookMessage:
+        bids, asks, update_id = self.books[published_diffs]
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [[price, amount] for price, amount in bids.items()],
+            "asks": [[price, amount] for price, amount in asks.items()],
+        }, timestamp=float(update_id))
+
+
+class ReplayDataSource(OrderBookTrackerDataSource):
+    FULL_ORDER_BOOK_RESET_DELTA_SECONDS = None
+    SEQUENTIAL_DIFF_UPDATE_IDS = True
+
+    def __init__(self, stream: RecordedDiffStream, verify_checksums: bool = False):
+        super().__init__([stream.trading_pair])
+        self.stream = stream
+        self.verify_checksums = verify_checksums
+        self.published_diffs = 0
+        self.snapshot_requests = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests += 1
+        return self.stream.snapshot(self.published_diffs)
+
+    def order_book_checksum_is_valid(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        if not self.verify_checksums:
+            return True
+        bids = {row.price: row.amount for row in order_book.bid_entries()}
+        asks = {row.price: row.amount for row in order_book.ask_entries()}
+        return abs(RecordedDiffStream.checksum(bids, asks) - message.content["checksum"]) < 1e-9
+
+
+class OrderBookTrackerResyncTest(unittest.TestCase):
+    level = 0
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.stream = RecordedDiffStream(self.trading_pair, diffs_count=100)
+        self.log_records = []
+        self.tracker: Optional[OrderBookTracker] = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+            self.tracker.logger().removeHandler(self)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def create_tracker(self, data_source: ReplayDataSource) -> OrderBookTracker:
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+        self.tracker._order_books[self.trading_pair] = self.async_run_with_timeout(
+            data_source.get_new_order_book(self.trading_pair))
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracker._tracking_tasks[self.trading_pair] = asyncio.ensure_future(
+            self.tracker._track_single_book(self.trading_pair))
+        return self.tracker
+
+    def replay(self, data_source: ReplayDataSource, diffs: List[OrderBookMessage]):
+        async def feed():
+            queue: asyncio.Queue = self.tracker._tracking_message_queues[self.trading_pair]
+            stream_positions = {diff.update_id: index for index, diff in enumerate(self.stream.diffs)}
+            for diff in diffs:
+                # The exchange has published all the diffs up to this one, including the diffs lost
+                data_source.published_diffs = stream_positions[diff.update_id] + 1
+                await queue.put(diff)
+                for _ in range(3):
+                    await asyncio.sleep(0)
+            data_source.published_diffs = len(self.stream.diffs)
+            while not queue.empty() or any(not task.done() for task in self.tracker._resync_tasks.values()):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+
+        self.async_run_with_timeout(feed())
+
+    def tracked_book(self) -> Tuple[Dict[float, float], Dict[float, float]]:
+        order_book = self.tracker.order_books[self.trading_pair]
+        return ({row.price: row.amount for row in order_book.bid_entries()},
+                {row.price: row.amount for row in order_book.ask_entries()})
+
+    def exchange_book(self) -> Tuple[Dict[float, float], Dict[float, float]]:
+        bids, asks, _ = self.stream.books[-1]
+        return bids, asks
+
+    def test_contiguous_stream_needs_no_snapshot(self):
+        data_source = ReplayDataSource(self.stream)
+        self.create_tracker(data_source)
+
+        self.replay(data_source, self.stream.diffs)
+
+        self.assertEqual(self.exchange_book(), self.tracked_book())
+        self.assertEqual(1, data_source.snapshot_requests)  # the initial snapshot only
+
+    def test_gap_triggers_a_single_pair_resync(self):
+        data_source = ReplayDataSource(self.stream)
+        self.create_tracker(data_source)
+        diffs = self.stream.diffs[:40] + self.stream.diffs[41:]  # diff lost
+
+        self.replay(data_source, diffs)
+
+        self.assertEqual(self.exchange_book(), self.tracked_book())
+        self.assertEqual(2, data_source.snapshot_requests)
+        self.assertTrue(any("out of sync" in record.getMessage() for record in self.log_records))
+
+    def test_gap_without_sequential_update_ids_is_not_detected(self):
+        data_source = ReplayDataSource(self.stream)
+        data_source.SEQUENTIAL_DIFF_UPDATE_IDS = False
+        self.create_tracker(data_source)
+        diffs = self.stream.diffs[:40] + self.stream.diffs[41:]
+
+        self.replay(data_source, diffs)
+
+        self.assertEqual(1, data_source.snapshot_requests)
+
+    def test_several_gaps(self):
+        data_source = ReplayDataSource(self.stream)
+        self.create_tracker(data_source)
+        diffs = [diff for index, diff in enumerate(self.stream.diffs) if index not in (10, 11, 60, 98)]
+
+        self.replay(data_source, diffs)
+
+        self.assertEqual(self.exchange_book(), self.tracked_book())
+        self.assertLessEqual(data_source.snapshot_requests, 4)
+
+    def test_invalid_checksum_triggers_resync(self):
+        data_source = ReplayDataSource(self.stream, verify_checksums=True)
+        self.create_tracker(data_source)
+        diffs: List[OrderBookMessage] = list(self.stream.diffs)
+        corrupted_content: Dict[str, Any] = dict(diffs[30].content)
+        corrupted_content["bids"] = [[price, amount + 10] for price, amount in corrupted_content["bids"]]
+        diffs[30] = OrderBookMessage(OrderBookMessageType.DIFF, corrupted_content, timestamp=diffs[30].timestamp)
+
+        self.replay(data_source, diffs)
+
+        self.assertEqual(self.exchange_book(), self.tracked_book())
+        self.assertEqual(2, data_source.snapshot_requests)
+
+    def test_periodic_snapshots_disabled(self):
+        data_source = ReplayDataSource(self.stream)
+        output: asyncio.Queue = asyncio.Queue()
+
+        self.async_run_with_timeout(data_source.listen_for_order_book_snapshots(self.ev_loop, output))
+
+        self.assertTrue(output.empty())
+        self.assertEqual(0, data_source.snapshot_requests)
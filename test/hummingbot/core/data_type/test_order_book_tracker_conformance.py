@@ -0,0 +1,174 @@
+import asyncio
+import bisect
+import unittest
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple
+
+from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book_message import AscendExOrderBookMessage
+from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book_tracker import AscendExOrderBookTracker
+from hummingbot.connector.exchange.hitbtc.hitbtc_order_book import HitbtcOrderBook
+from hummingbot.connector.exchange.hitbtc.hitbtc_order_book_tracker import HitbtcOrderBookTracker
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from test.hummingbot.core.data_type.test_order_book_tracker import RecordedDiffStream
+
+RowsConverter = Callable[[OrderBookMessage], Tuple[Any, Any]]
+
+
+async def legacy_track_single_book(tracker: OrderBookTracker,
+                                   trading_pair: str,
+                                   convert_diff: RowsConverter,
+                                   convert_snapshot: RowsConverter):
+    """
+    The _track_single_book loop the legacy connector trackers used to copy, kept as the reference of the conformance
+    test
+    """
+    past_diffs_window: Deque[OrderBookMessage] = deque()
+    message_queue: asyncio.Queue = tracker._tracking_message_queues[trading_pair]
+    order_book: OrderBook = tracker._order_books[trading_pair]
+
+    while True:
+        saved_messages: Deque[OrderBookMessage] = tracker._saved_message_queues[trading_pair]
+        if len(saved_messages) > 0:
+            message = saved_messages.popleft()
+        else:
+            message = await message_queue.get()
+
+        if message.type is OrderBookMessageType.DIFF:
+            bids, asks = convert_diff(message)
+            order_book.apply_diffs(bids, asks, message.update_id)
+            past_diffs_window.append(message)
+            while len(past_diffs_window) > tracker.PAST_DIFF_WINDOW_SIZE:
+                past_diffs_window.popleft()
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+            replay_position = bisect.bisect_right(past_diffs, message)
+            replay_diffs = past_diffs[replay_position:]
+            s_bids, s_asks = convert_snapshot(message)
+            order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+            for diff_message in replay_diffs:
+                d_bids, d_asks = convert_diff(diff_message)
+                order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+
+
+class OrderBookTrackerConformanceTest(unittest.TestCase):
+    """
+    Replays the same recorded feed through the legacy tracking loop and through the shared OrderBookTracker engine with
+    the parsing hooks of the connectors, and checks both produce the same order book.
+    """
+    level = 0
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.stream = RecordedDiffStream(self.trading_pair, diffs_count=120, seed=7)
+        self.tasks: List[asyncio.Task] = []
+
+    def tearDown(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def recorded_feed(self, to_connector_message: Callable[[OrderBookMessage], OrderBookMessage]):
+        """
+        The recorded diffs, with a periodic snapshot received while the diffs following it were already applied, and
+        the diffs received before the first snapshot was fetched
+        """
+        diffs = [to_connector_message(diff) for diff in self.stream.diffs]
+        saved_messages = diffs[:5]
+        feed = diffs[5:60] + [to_connector_message(self.stream.snapshot(55))] + diffs[60:]
+        return to_connector_message(self.stream.snapshot(3)), saved_messages, feed
+
+    def start_tracking(self,
+                       tracker: OrderBookTracker,
+                       initial_snapshot: OrderBookMessage,
+                       saved_messages: List[OrderBookMessage],
+                       tracking_coroutine: Awaitable):
+        order_book = tracker.data_source.order_book_create_function()
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        tracker._saved_message_queues[self.trading_pair].extend(saved_messages)
+        tracker._tracking_message_queues[self.trading_pair].put_nowait(initial_snapshot)
+        self.tasks.append(self.ev_loop.create_task(tracking_coroutine))
+
+    def replay(self, trackers: List[OrderBookTracker], feed: List[OrderBookMessage]):
+        async def feed_trackers():
+            for message in feed:
+                for tracker in trackers:
+                    tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+                await asyncio.sleep(0)
+            while any(not tracker._tracking_message_queues[self.trading_pair].empty() for tracker in trackers):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+
+        self.async_run_with_timeout(feed_trackers())
+
+    @staticmethod
+    def book_levels(order_book: OrderBook) -> Tuple[Dict[float, float], Dict[float, float]]:
+        return ({row.price: row.amount for row in order_book.bid_entries()},
+                {row.price: row.amount for row in order_book.ask_entries()})
+
+    def assert_conformance(self, legacy: OrderBookTracker, tracker: OrderBookTracker):
+        legacy_book = self.book_levels(legacy.order_books[self.trading_pair])
+        tracked_book = self.book_levels(tracker.order_books[self.trading_pair])
+        bids, asks, _ = self.stream.books[-1]
+        self.assertEqual(legacy_book, tracked_book)
+        self.assertEqual((bids, asks), tracked_book)
+
+    def test_active_order_tracker_connector(self):
+        def to_hitbtc_message(message: OrderBookMessage) -> OrderBookMessage:
+            content = {
+                "bid": [{"price": str(price), "size": str(amount)} for price, amount in message.content["bids"]],
+                "ask": [{"price": str(price), "size": str(amount)} for price, amount in message.content["asks"]],
+            }
+            message_from_exchange = (HitbtcOrderBook.diff_message_from_exchange
+                                     if message.type is OrderBookMessageType.DIFF
+                                     else HitbtcOrderBook.snapshot_message_from_exchange)
+            return message_from_exchange(content, message.timestamp, metadata={"trading_pair": self.trading_pair})
+
+        initial_snapshot, saved_messages, feed = self.recorded_feed(to_hitbtc_message)
+        legacy = HitbtcOrderBookTracker(trading_pairs=[self.trading_pair])
+        active_order_tracker = legacy._active_order_trackers[self.trading_pair]
+        tracker = HitbtcOrderBookTracker(trading_pairs=[self.trading_pair])
+        self.start_tracking(legacy, initial_snapshot, saved_messages, legacy_track_single_book(
+            legacy,
+            self.trading_pair,
+            active_order_tracker.convert_diff_message_to_order_book_row,
+            active_order_tracker.convert_snapshot_message_to_order_book_row))
+        self.start_tracking(tracker, initial_snapshot, saved_messages, tracker._track_single_book(self.trading_pair))
+
+        self.replay([legacy, tracker], feed)
+
+        self.assert_conformance(legacy, tracker)
+
+    def test_plain_rows_connector(self):
+        def to_ascend_ex_message(message: OrderBookMessage) -> OrderBookMessage:
+            content = {
+                "trading_pair": self.trading_pair,
+                "bids": [[str(price), str(amount)] for price, amount in message.content["bids"]],
+                "asks": [[str(price), str(amount)] for price, amount in message.content["asks"]],
+            }
+            return AscendExOrderBookMessage(message.type, content, timestamp=message.timestamp)
+
+        initial_snapshot, saved_messages, feed = self.recorded_feed(to_ascend_ex_message)
+        legacy = AscendExOrderBookTracker(trading_pairs=[self.trading_pair])
+        tracker = AscendExOrderBookTracker(trading_pairs=[self.trading_pair])
+        self.start_tracking(legacy, initial_snapshot, saved_messages, legacy_track_single_book(
+            legacy,
+            self.trading_pair,
+            lambda message: (message.bids, message.asks),
+            lambda message: (message.bids, message.asks)))
+        self.start_tracking(tracker, initial_snapshot, saved_messages, tracker._track_single_book(self.trading_pair))
+
+        self.replay([legacy, tracker], feed)
+
+        self.assert_conformance(legacy, tracker)
@@ -0,0 +1,147 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class SleepingIterator(PyTimeIterator):
+    def __init__(self, sleep_time: float):
+        super().__init__()
+        self.sleep_time = sleep_time
+
+    def tick(self, timestamp: float):
+        time.sleep(self.sleep_time)
+
+
+class ClockProfilerTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.profiler = ClockProfiler(tick_size=1.0)
+        self.profiler.logger().setLevel(1)
+        self.profiler.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.profiler.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_records_iterator_ticks(self):
+        fast_iterator = SleepingIterator(0)
+        slow_iterator = SleepingIterator(0)
+
+        self.profiler.tick_started(skipped_ticks=0)
+        self.profiler.record_iterator_tick(fast_iterator, 0.01)
+        self.profiler.record_iterator_tick(slow_iterator, 0.2)
+        self.profiler.tick_finished(timestamp=1, duration=0.21)
+
+        self.assertEqual(1, self.profiler.tick_histogram.count)
+        self.assertEqual(2, len(self.profiler.iterator_stats))
+        self.assertEqual("SleepingIterator", self.profiler.iterator_stats[0].name)
+        self.assertEqual(0.2, self.profiler.iterator_stats[1].histogram.max)
+        self.assertEqual(0, self.profiler.overruns_count)
+        self.assertEqual(0, len(self.log_records))
+
+    def test_overrun_and_skipped_ticks_are_counted_and_logged(self):
+        iterator = SleepingIterator(0)
+
+        self.profiler.tick_started(skipped_ticks=0)
+        self.profiler.record_iterator_tick(iterator, 2.5)
+        self.profiler.tick_finished(timestamp=1, duration=2.5)
+        self.profiler.tick_started(skipped_ticks=2)
+
+        self.assertEqual(1, self.profiler.overruns_count)
+        self.assertEqual(2, self.profiler.skipped_ticks_count)
+        self.assertEqual(2, len(self.log_records))
+        self.assertEqual(2.5, self.log_records[0].clock_tick_duration)
+        self.assertEqual("SleepingIterator", self.log_records[0].clock_slowest_iterator)
+        self.assertEqual(2, self.log_records[1].clock_skipped_ticks)
+        self.assertEqual("The clock skipped 2 tick(s), the previous tick took 2.500s, longer than the tick size of 1.0s.",
+                         self.log_records[1].getMessage())
+
+    def test_skipped_ticks_after_a_fast_tick_are_not_attributed_to_the_tick(self):
+        self.profiler.tick_started(skipped_ticks=0)
+        self.profiler.tick_finished(timestamp=1, duration=0.1)
+        self.profiler.tick_started(skipped_ticks=3)
+
+        self.assertEqual(0, self.profiler.overruns_count)
+        self.assertEqual(3, self.profiler.skipped_ticks_count)
+        self.assertEqual(1, len(self.log_records))
+        self.assertNotIn("previous tick took", self.log_records[0].getMessage())
+        self.assertIn("the clock loop was delayed", self.log_records[0].getMessage())
+        self.assertEqual(0.1, self.log_records[0].clock_previous_tick_duration)
+
+    def test_slow_tick_triggers_profile_of_next_tick(self):
+        self.profiler.profile_threshold = 0.1
+
+        self.profiler.tick_started(skipped_ticks=0)
+        self.profiler.tick_finished(timestamp=1, duration=0.2)
+        self.assertIsNone(self.profiler.last_profile_stats)
+
+        self.profiler.tick_started(skipped_ticks=0)
+        time.sleep(0.01)
+        self.profiler.tick_finished(timestamp=2, duration=0.01)
+
+        self.assertIn("sleep", self.profiler.last_profile_stats)
+        self.assertTrue(any("Profile of the clock tick at 2" in r.getMessage() for r in self.log_records))
+
+    def test_metrics(self):
+        self.profiler.tick_started(skipped_ticks=0)
+        self.profiler.record_iterator_tick(SleepingIterator(0), 2)
+        self.profiler.tick_finished(timestamp=1, duration=2)
+        self.profiler.tick_started(skipped_ticks=1)
+
+        metrics = {(name, tuple(labels.items())): value for name, labels, value in self.profiler.metrics()}
+
+        self.assertIs(self.profiler.tick_histogram, metrics[("clock_tick_seconds", ())])
+        self.assertEqual(1, metrics[("clock_overruns_total", ())])
+        self.assertEqual(1, metrics[("clock_skipped_ticks_total", ())])
+        self.assertEqual(2, metrics[("clock_iterator_tick_seconds", (("iterator", "SleepingIterator"),))].max)
+
+    def test_reset(self):
+        self.profiler.record_iterator_tick(SleepingIterator(0), 2)
+        self.profiler.tick_finished(timestamp=1, duration=2)
+        self.profiler.tick_started(skipped_ticks=1)
+
+        self.profiler.reset()
+
+        self.assertEqual(0, self.profiler.tick_histogram.count)
+        self.assertEqual(0, len(self.profiler.iterator_stats))
+        self.assertEqual(0, self.profiler.overruns_count)
+        self.assertEqual(0, self.profiler.skipped_ticks_count)
+
+    def test_clock_detects_overruns(self):
+        tick_size = 0.1
+        clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+        fast_iterator = SleepingIterator(0)
+        slow_iterator = SleepingIterator(0.25)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+
+        with clock:
+            self.async_run_with_timeout(clock.run_til(time.time() + 1))
+
+        profiler = clock.profiler
+        self.assertGreater(profiler.tick_histogram.count, 0)
+        self.assertEqual(profiler.tick_histogram.count, profiler.overruns_count)
+        self.assertGreaterEqual(profiler.skipped_ticks_count, 2 * (profiler.overruns_count - 1))
+        fast_stats, slow_stats = profiler.iterator_stats
+        self.assertLess(fast_stats.histogram.max, tick_size)
+        self.assertGreaterEqual(slow_stats.histogram.mean, 0.25)
@@ -1,8 +1,10 @@
 import unittest
 import gc
+import sys
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +91,43 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        # Same weak reference object as the one held by the pubsub
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        weakref_ref_count = sys.getrefcount(listener_zero_weakref)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual(weakref_ref_count - 1, sys.getrefcount(listener_zero_weakref))
+
+    def test_remove_listener_while_triggering_event(self):
+        test_case = self
+
+        class SelfRemovingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.event_log = []
+
+            def __call__(self, event_object):
+                self.event_log.append(event_object)
+                test_case.pubsub.remove_listener(test_case.event_tag_zero, self)
+                test_case.pubsub.remove_listener(test_case.event_tag_zero, test_case.listener_one)
+
+        self_removing_listener = SelfRemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, self_removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self_removing_listener.event_log))
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
 
 if __name__ == "__main__":
     unittest.main()
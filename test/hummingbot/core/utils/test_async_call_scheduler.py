@@ -0,0 +1,210 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List, Optional, Set, Tuple
+from unittest.mock import patch
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+
+
+class AsyncCallSchedulerTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.scheduler: Optional[AsyncCallScheduler] = None
+        self.calls: List[Tuple[str, str]] = []
+        self.running: Set[str] = set()
+        self.max_running = 0
+
+    def tearDown(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def call(self, name: str, duration: float = 0.02) -> str:
+        self.calls.append(("start", name))
+        self.running.add(name)
+        self.max_running = max(self.max_running, len(self.running))
+        await asyncio.sleep(duration)
+        self.running.discard(name)
+        self.calls.append(("end", name))
+        return name
+
+    def schedule(self, names_and_keys: List[Tuple[str, Optional[str]]]) -> List[str]:
+        return self.async_run_with_timeout(asyncio.gather(*[
+            self.scheduler.schedule_async_call(self.call(name), timeout_seconds=1, key=key)
+            for name, key in names_and_keys
+        ]))
+
+    def test_calls_run_one_at_a_time_by_default(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0)
+
+        results = self.schedule([("a", "1"), ("b", "2"), ("c", None)])
+
+        self.assertEqual(["a", "b", "c"], results)
+        self.assertEqual(1, self.max_running)
+        self.assertEqual(["a", "b", "c"], [name for event, name in self.calls if event == "start"])
+
+    def test_concurrent_calls_with_different_keys(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=3)
+
+        results = self.schedule([(str(i), str(i)) for i in range(6)] + [("none", None)])
+
+        self.assertEqual([str(i) for i in range(6)] + ["none"], results)
+        self.assertEqual(3, self.max_running)
+
+    def test_calls_with_the_same_key_keep_their_order(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=4)
+
+        self.schedule([("a1", "a"), ("b1", "b"), ("a2", "a"), ("a3", "a"), ("b2", "b")])
+
+        a_calls = [(event, name) for event, name in self.calls if name.startswith("a")]
+        self.assertEqual([("start", "a1"), ("end", "a1"), ("start", "a2"), ("end", "a2"), ("start", "a3"),
+                          ("end", "a3")], a_calls)
+        b_calls = [(event, name) for event, name in self.calls if name.startswith("b")]
+        self.assertEqual([("start", "b1"), ("end", "b1"), ("start", "b2"), ("end", "b2")], b_calls)
+        self.assertEqual(2, self.max_running)
+        self.assertEqual({}, self.scheduler._key_queues)
+
+    @patch("hummingbot.core.utils.async_call_scheduler.AsyncCallScheduler.logger")
+    def test_errors_do_not_block_the_key(self, _):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        async def failing_call():
+            raise IOError("API error")
+
+        async def run():
+            return await asyncio.gather(
+                self.scheduler.schedule_async_call(failing_call(), timeout_seconds=1, key="a"),
+                self.scheduler.schedule_async_call(self.call("a2"), timeout_seconds=1, key="a"),
+                return_exceptions=True
+            )
+
+        results = self.async_run_with_timeout(run())
+
+        self.assertIsInstance(results[0], IOError)
+        self.assertEqual("a2", results[1])
+
+    def test_stats(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        async def run():
+            calls = [asyncio.ensure_future(self.scheduler.schedule_async_call(self.call(str(i)), timeout_seconds=1))
+                     for i in range(4)]
+            await asyncio.sleep(0.01)
+            queue_depth, running_calls = self.scheduler.queue_depth, self.scheduler.running_calls
+            await asyncio.gather(*calls)
+            return queue_depth, running_calls
+
+        queue_depth, running_calls = self.async_run_with_timeout(run())
+
+        self.assertEqual(2, queue_depth)
+        self.assertEqual(2, running_calls)
+        self.assertEqual(0, self.scheduler.queue_depth)
+        self.assertEqual(0, self.scheduler.running_calls)
+        self.assertEqual(4, self.scheduler.wait_time_histogram.count)
+        self.assertGreater(self.scheduler.wait_time_histogram.max, 0.01)
+
+    def test_stop_cancels_the_waiting_calls(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        async def run():
+            calls = [asyncio.ensure_future(self.scheduler.schedule_async_call(self.call(str(i)), timeout_seconds=1,
+                                                                              key="a"))
+                     for i in range(3)]
+            await asyncio.sleep(0.01)
+            self.scheduler.stop()
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        results = self.async_run_with_timeout(run())
+
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+        self.assertEqual(0, self.scheduler.queue_depth)
+
+    def test_stop_cancels_the_calls_waiting_for_a_slot(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        async def run():
+            calls = [asyncio.ensure_future(self.scheduler.schedule_async_call(self.call(str(i)), timeout_seconds=1,
+                                                                              key=str(i)))
+                     for i in range(4)]
+            await asyncio.sleep(0.01)
+            self.scheduler.stop()
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        results = self.async_run_with_timeout(run())
+
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+        self.assertEqual(0, self.scheduler.queue_depth)
+        self.assertEqual(0, self.scheduler.running_calls)
+
+    def test_stop_cancels_waiting_calls_that_are_not_coroutines(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        async def run():
+            awaitables = [self.ev_loop.create_future() for _ in range(2)]
+            calls = [asyncio.ensure_future(self.scheduler.schedule_async_call(awaitable, timeout_seconds=1, key="a"))
+                     for awaitable in awaitables]
+            await asyncio.sleep(0.01)
+            self.scheduler.stop()
+            return awaitables, await asyncio.gather(*calls, return_exceptions=True)
+
+        awaitables, results = self.async_run_with_timeout(run())
+
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+        self.assertTrue(all(awaitable.cancelled() for awaitable in awaitables))
+        self.assertEqual(0, self.scheduler.queue_depth)
+
+    def test_executor_calls_without_key_run_concurrently(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0)
+        start_time = time.perf_counter()
+        timings: List[Tuple[str, float, float]] = []
+
+        def blocking_call(name: str) -> str:
+            call_start = time.perf_counter() - start_time
+            time.sleep(0.1)
+            timings.append((name, call_start, time.perf_counter() - start_time))
+            return name
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.call_async(blocking_call, "first", timeout_seconds=1),
+            self.scheduler.call_async(blocking_call, "second", timeout_seconds=1),
+        ))
+
+        self.assertEqual(["first", "second"], results)
+        (_, first_start, first_end), (_, second_start, second_end) = sorted(timings, key=lambda timing: timing[1])
+        self.assertLess(second_start, first_end)
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncCallScheduler(max_concurrency=0)
+
+    def test_executor_calls_with_the_same_key_do_not_overlap(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=4)
+        start_time = time.perf_counter()
+        timings: List[Tuple[str, float, float]] = []
+
+        def blocking_call(name: str, duration: float) -> str:
+            call_start = time.perf_counter() - start_time
+            time.sleep(duration)
+            timings.append((name, call_start, time.perf_counter() - start_time))
+            return name
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.call_async(blocking_call, "slow", 0.1, timeout_seconds=1, key="a"),
+            self.scheduler.call_async(blocking_call, "fast", 0.001, timeout_seconds=1, key="a"),
+        ))
+
+        self.assertEqual(["slow", "fast"], results)
+        self.assertEqual(["slow", "fast"], [name for name, _, _ in timings])
+        (_, _, slow_end), (_, fast_start, _) = timings
+        self.assertGreaterEqual(fast_start, slow_end)
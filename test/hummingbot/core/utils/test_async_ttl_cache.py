@@ -21,3 +21,85 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_concurrent_calls_share_one_call(self):
+        calls = []
+
+        @async_ttl_cache(ttl=10, maxsize=10)
+        async def fetch(key: str):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        results = self.async_run_with_timeout(asyncio.gather(*[fetch(key) for key in ("a", "b") * 5]))
+
+        self.assertEqual(["A", "B"] * 5, results)
+        self.assertEqual(["a", "b"], calls)
+        self.assertEqual("A", self.async_run_with_timeout(fetch("a")))
+        self.assertEqual(["a", "b"], calls)
+        info = fetch.cache_info()
+        self.assertEqual((1, 10, 0, 10, 2), (info.hits, info.misses, info.stale_hits, info.maxsize, info.currsize))
+
+    def test_least_recently_used_results_are_evicted(self):
+        calls = []
+
+        @async_ttl_cache(ttl=10, maxsize=2)
+        async def fetch(key: str):
+            calls.append(key)
+            return key
+
+        for key in ("a", "b", "a", "c", "a", "b"):
+            self.async_run_with_timeout(fetch(key))
+
+        self.assertEqual(["a", "b", "c", "b"], calls)
+        self.assertEqual(2, fetch.cache_info().currsize)
+
+    def test_errors_are_not_cached(self):
+        calls = []
+
+        @async_ttl_cache(ttl=10, maxsize=1)
+        async def fetch():
+            calls.append("fetch")
+            await asyncio.sleep(0.01)
+            raise IOError("API error")
+
+        results = self.async_run_with_timeout(asyncio.gather(fetch(), fetch(), return_exceptions=True))
+
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(1, len(calls))
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(fetch())
+        self.assertEqual(2, len(calls))
+
+    def test_stale_while_revalidate(self):
+        values = iter([1, 2, 3])
+
+        @async_ttl_cache(ttl=0.05, maxsize=1, stale_while_revalidate=10)
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return next(values)
+
+        self.assertEqual(1, self.async_run_with_timeout(fetch()))
+        time.sleep(0.06)
+        # The stale result is returned while it is refreshed in the background
+        self.assertEqual(1, self.async_run_with_timeout(fetch()))
+        self.assertEqual(1, self.async_run_with_timeout(fetch()))
+        self.async_run_with_timeout(asyncio.sleep(0.02))
+        self.assertEqual(2, self.async_run_with_timeout(fetch()))
+        self.assertEqual(2, fetch.cache_info().stale_hits)
+        self.assertEqual(1, fetch.cache_info().misses)
+
+    def test_unhashable_arguments(self):
+        @async_ttl_cache(ttl=10, maxsize=2)
+        async def fetch(keys):
+            return len(keys)
+
+        self.assertEqual(2, self.async_run_with_timeout(fetch(["a", "b"])))
+        self.assertEqual(2, self.async_run_with_timeout(fetch(["a", "b"])))
+        self.assertEqual(1, fetch.cache_info().hits)
+
+        fetch.cache_clear()
+        self.assertEqual((0, 0, 0, 2, 0), tuple(fetch.cache_info()))
@@ -0,0 +1,54 @@
+import unittest
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.percentile(50))
+
+    def test_add_values(self):
+        histogram = LatencyHistogram(bucket_bounds=[0.001, 0.01, 0.1])
+
+        for value in (0.0005, 0.005, 0.005, 0.05, 0.5):
+            histogram.add(value)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(0.5605, histogram.sum)
+        self.assertAlmostEqual(0.1121, histogram.mean)
+        self.assertEqual(0.5, histogram.max)
+        self.assertEqual([1, 2, 1, 1], histogram.bucket_counts)
+
+    def test_percentile_is_bucket_upper_bound(self):
+        histogram = LatencyHistogram(bucket_bounds=[0.001, 0.01, 0.1])
+
+        for _ in range(98):
+            histogram.add(0.0005)
+        histogram.add(0.05)
+        histogram.add(0.5)
+
+        self.assertEqual(0.001, histogram.percentile(50))
+        self.assertEqual(0.001, histogram.percentile(98))
+        self.assertEqual(0.1, histogram.percentile(99))
+        self.assertEqual(0.5, histogram.percentile(100))
+
+    def test_percentile_capped_by_max_value(self):
+        histogram = LatencyHistogram(bucket_bounds=[0.001, 0.01, 0.1])
+
+        histogram.add(0.002)
+
+        self.assertEqual(0.002, histogram.percentile(50))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.add(1)
+
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.max)
+        self.assertEqual(0, sum(histogram.bucket_counts))
@@ -0,0 +1,121 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, Dict, List
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor, task_name
+
+
+class LoopMonitorTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.monitor = LoopMonitor(lag_sample_interval=0.01, slow_callback_duration=0.05)
+        self.monitor.logger().setLevel(1)
+        self.monitor.logger().addHandler(self)
+        self.original_instance = LoopMonitor._shared_instance
+        LoopMonitor._shared_instance = self.monitor
+
+    def tearDown(self) -> None:
+        self.monitor.stop()
+        LoopMonitor._shared_instance = self.original_instance
+        self.monitor.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def metrics_by_name(samples) -> Dict[str, List]:
+        result = {}
+        for name, labels, value in samples:
+            result.setdefault(name, []).append((labels, value))
+        return result
+
+    async def blocking_coroutine(self):
+        await asyncio.sleep(0)
+        time.sleep(0.1)
+
+    def test_records_loop_lag_and_slow_callbacks(self):
+        self.monitor.start()
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.async_run_with_timeout(self.blocking_coroutine())
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertGreater(self.monitor.lag_histogram.count, 0)
+        self.assertGreaterEqual(self.monitor.lag_histogram.max, 0.05)
+        sources = list(self.monitor.slow_callbacks)
+        self.assertTrue(any(source.startswith("LoopMonitorTest.blocking_coroutine (") for source in sources))
+        self.assertTrue(any("LoopMonitorTest.blocking_coroutine" in r.getMessage() for r in self.log_records))
+
+    def test_stop_restores_the_loop_handles(self):
+        original_run = asyncio.events.Handle._run
+        self.monitor.start()
+
+        self.assertIsNot(original_run, asyncio.events.Handle._run)
+
+        self.monitor.stop()
+
+        self.assertIs(original_run, asyncio.events.Handle._run)
+        self.assertFalse(self.monitor.started)
+
+    def test_safe_ensure_future_tasks_are_named_after_their_coroutine(self):
+        self.monitor.start()
+        event = asyncio.Event()
+
+        async def waiting_coroutine():
+            await event.wait()
+
+        tasks = [safe_ensure_future(waiting_coroutine()) for _ in range(3)]
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        name = "LoopMonitorTest.test_safe_ensure_future_tasks_are_named_after_their_coroutine.<locals>.waiting_coroutine"
+        self.assertEqual(name, task_name(tasks[0]))
+        self.assertEqual(3, self.monitor.live_tasks()[name])
+        self.assertEqual(3, self.monitor.created_tasks[name])
+
+        event.set()
+        self.async_run_with_timeout(asyncio.gather(*tasks))
+
+        self.assertNotIn(name, self.monitor.live_tasks())
+        self.assertEqual(3, self.monitor.created_tasks[name])
+
+    def test_queue_backlogs(self):
+        queue_1 = asyncio.Queue()
+        queue_2 = asyncio.Queue()
+        self.monitor.register_queue(queue_1, "diff_stream")
+        self.monitor.register_queue(queue_2, "diff_stream")
+        queue_1.put_nowait(1)
+        queue_2.put_nowait(2)
+        queue_2.put_nowait(3)
+
+        self.assertEqual({"diff_stream": 3}, self.monitor.queue_backlogs())
+
+        del queue_1
+
+        self.assertEqual({"diff_stream": 2}, self.monitor.queue_backlogs())
+
+    def test_metrics(self):
+        self.monitor.register_queue(asyncio.Queue(), "unreferenced_queue")
+        queue = asyncio.Queue()
+        queue.put_nowait(1)
+        self.monitor.register_queue(queue, "user_stream")
+        self.monitor.lag_histogram.add(0.2)
+
+        metrics = self.metrics_by_name(self.monitor.metrics())
+
+        self.assertIn(({"stat": "max"}, 0.2), metrics["event_loop_lag_seconds"])
+        self.assertEqual([({"queue": "user_stream"}, 1)], metrics["queue_backlog"])
@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+import aiohttp
+
+from hummingbot.core.mock_api.mock_web_server import get_open_port
+from hummingbot.core.utils.metrics_exporter import METRICS_CONTENT_TYPE, MetricsExporter
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+
+
+class MetricsExporterTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = MetricsRegistry()
+        self.exporter = MetricsExporter(get_open_port(), self.registry)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.exporter.stop())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _get(self, path: str):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{self.exporter.port}{path}") as response:
+                return response.status, response.headers.get("Content-Type"), await response.text()
+
+    def test_serves_the_registry_metrics(self):
+        self.registry.counter("diffs_total", "Diffs applied.").inc(3)
+        self.async_run_with_timeout(self.exporter.start())
+
+        self.assertTrue(self.exporter.started)
+        status, content_type, body = self.async_run_with_timeout(self._get("/metrics"))
+
+        self.assertEqual(200, status)
+        self.assertEqual(METRICS_CONTENT_TYPE, content_type)
+        self.assertEqual(self.registry.render(), body)
+        self.assertIn("hummingbot_diffs_total 3\n", body)
+
+        status, _, _ = self.async_run_with_timeout(self._get("/other"))
+        self.assertEqual(404, status)
+
+    def test_stop(self):
+        self.async_run_with_timeout(self.exporter.start())
+        self.async_run_with_timeout(self.exporter.stop())
+
+        self.assertFalse(self.exporter.started)
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            self.async_run_with_timeout(self._get("/metrics"))
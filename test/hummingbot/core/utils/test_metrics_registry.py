@@ -0,0 +1,98 @@
+import unittest
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.metrics_registry import MetricsRegistry
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.registry = MetricsRegistry()
+        self.registry.logger().setLevel(1)
+        self.registry.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.registry.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def test_counter_and_gauge(self):
+        counter = self.registry.counter("diffs_total", "Diffs applied.", ("trading_pair",))
+        counter.labels("COINALPHA-HBOT").inc()
+        counter.labels("COINALPHA-HBOT").inc(2)
+        gauge = self.registry.gauge("queue_size", "Queue size.")
+        gauge.set(5)
+
+        rendered = self.registry.render()
+
+        self.assertIn("# HELP hummingbot_diffs_total Diffs applied.\n", rendered)
+        self.assertIn("# TYPE hummingbot_diffs_total counter\n", rendered)
+        self.assertIn('hummingbot_diffs_total{trading_pair="COINALPHA-HBOT"} 3\n', rendered)
+        self.assertIn("# TYPE hummingbot_queue_size gauge\n", rendered)
+        self.assertIn("hummingbot_queue_size 5\n", rendered)
+
+    def test_get_or_create_returns_the_registered_metric(self):
+        counter = self.registry.counter("diffs_total", "Diffs applied.", ("trading_pair",))
+
+        self.assertIs(counter, self.registry.counter("diffs_total", "Diffs applied.", ("trading_pair",)))
+        self.assertIs(counter.labels("COINALPHA-HBOT"), counter.labels("COINALPHA-HBOT"))
+        with self.assertRaises(ValueError):
+            self.registry.gauge("diffs_total", "Diffs applied.", ("trading_pair",))
+        with self.assertRaises(ValueError):
+            counter.labels("COINALPHA-HBOT", "extra")
+
+    def test_histogram_is_rendered_with_cumulative_buckets(self):
+        histogram = self.registry.histogram("request_seconds", "Request time.", ("endpoint",), bucket_bounds=(0.1, 1))
+        child = histogram.labels("/ticker")
+        child.add(0.05)
+        child.add(0.5)
+        child.add(2)
+
+        rendered = self.registry.render()
+
+        self.assertIn("# TYPE hummingbot_request_seconds histogram\n", rendered)
+        self.assertIn('hummingbot_request_seconds_bucket{endpoint="/ticker",le="0.1"} 1\n', rendered)
+        self.assertIn('hummingbot_request_seconds_bucket{endpoint="/ticker",le="1"} 2\n', rendered)
+        self.assertIn('hummingbot_request_seconds_bucket{endpoint="/ticker",le="+Inf"} 3\n', rendered)
+        self.assertIn('hummingbot_request_seconds_sum{endpoint="/ticker"} 2.55\n', rendered)
+        self.assertIn('hummingbot_request_seconds_count{endpoint="/ticker"} 3\n', rendered)
+
+    def test_collectors(self):
+        histogram = LatencyHistogram(bucket_bounds=(1,))
+        histogram.add(0.5)
+        self.registry.register_collector(lambda: [
+            ("created_tasks_total", {"coroutine": "listen"}, 4),
+            ("lag_seconds", {"stat": 'with "quotes"\n'}, 0.25),
+            ("tick_seconds", {}, histogram),
+        ])
+
+        rendered = self.registry.render()
+
+        self.assertIn("# TYPE hummingbot_created_tasks_total counter\n", rendered)
+        self.assertIn('hummingbot_created_tasks_total{coroutine="listen"} 4\n', rendered)
+        self.assertIn("# TYPE hummingbot_lag_seconds gauge\n", rendered)
+        self.assertIn('hummingbot_lag_seconds{stat="with \\"quotes\\"\\n"} 0.25\n', rendered)
+        self.assertIn("# TYPE hummingbot_tick_seconds histogram\n", rendered)
+        self.assertIn('hummingbot_tick_seconds_bucket{le="+Inf"} 1\n', rendered)
+
+    def test_failing_collector_is_logged(self):
+        def failing_collector():
+            raise Exception("Test error")
+
+        self.registry.register_collector(failing_collector)
+        self.registry.counter("diffs_total", "Diffs applied.").inc()
+
+        rendered = self.registry.render()
+
+        self.assertIn("hummingbot_diffs_total 1\n", rendered)
+        self.assertTrue(any(r.levelname == "ERROR" and r.getMessage() == "Unexpected error collecting metrics."
+                            for r in self.log_records))
+
+        self.registry.unregister_collector(failing_collector)
+        self.registry.render()
+        self.assertEqual(1, len(self.log_records))
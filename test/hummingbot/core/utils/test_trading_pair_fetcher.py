@@ -1,7 +1,10 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -31,6 +34,15 @@ class TestTradingPairFetcher(unittest.TestCase):
             else:
                 await asyncio.sleep(0)
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "trading_pairs_cache.json"
+        cache_path_patch = patch("hummingbot.core.utils.trading_pair_fetcher.TRADING_PAIRS_CACHE_PATH", self.cache_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
         ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
@@ -88,6 +100,110 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_all_stores_trading_pairs_in_cache(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+
+        fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        with open(self.cache_path) as fd:
+            cache = json.load(fd)
+        self.assertEqual(["MOCK-HBOT"], cache["mock_exchange_1"]["trading_pairs"])
+        self.assertAlmostEqual(time.time(), cache["mock_exchange_1"]["timestamp"], delta=10)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_all_serves_cached_trading_pairs_and_refreshes_expired_ones(self, mock_connector_settings):
+        fresh_connector = AsyncMock()
+        expired_connector = AsyncMock()
+        expired_connector.all_trading_pairs.return_value = ["NEW-PAIR"]
+        mock_connector_settings.return_value = {
+            "fresh_exchange": self.MockConnectorSetting(name="fresh_exchange", connector=fresh_connector),
+            "expired_exchange": self.MockConnectorSetting(name="expired_exchange", connector=expired_connector),
+        }
+        with open(self.cache_path, "w") as fd:
+            json.dump({
+                "fresh_exchange": {"timestamp": time.time(), "trading_pairs": ["CACHED-PAIR"]},
+                "expired_exchange": {"timestamp": time.time() - 2 * 24 * 60 * 60, "trading_pairs": ["OLD-PAIR"]},
+            }, fd)
+
+        fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(fetcher))
+
+        self.assertEqual(["CACHED-PAIR"], fetcher.trading_pairs["fresh_exchange"])
+
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        fresh_connector.all_trading_pairs.assert_not_called()
+        expired_connector.all_trading_pairs.assert_called_once()
+        self.assertEqual({"fresh_exchange": ["CACHED-PAIR"], "expired_exchange": ["NEW-PAIR"]}, fetcher.trading_pairs)
+        with open(self.cache_path) as fd:
+            cache = json.load(fd)
+        self.assertEqual(["NEW-PAIR"], cache["expired_exchange"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_failure_keeps_cached_trading_pairs(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = IOError("Test error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        with open(self.cache_path, "w") as fd:
+            json.dump({"mock_exchange_1": {"timestamp": 0, "trading_pairs": ["OLD-PAIR"]}}, fd)
+
+        fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["OLD-PAIR"]}, fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_all_fetches_trading_pairs_of_malformed_cache_entries(self, mock_connector_settings):
+        cached_connector = AsyncMock()
+        malformed_connector = AsyncMock()
+        malformed_connector.all_trading_pairs.return_value = ["NEW-PAIR"]
+        mock_connector_settings.return_value = {
+            "cached_exchange": self.MockConnectorSetting(name="cached_exchange", connector=cached_connector),
+            "no_pairs_exchange": self.MockConnectorSetting(name="no_pairs_exchange", connector=malformed_connector),
+            "bad_timestamp_exchange": self.MockConnectorSetting(name="bad_timestamp_exchange",
+                                                                connector=malformed_connector),
+        }
+        with open(self.cache_path, "w") as fd:
+            json.dump({
+                "cached_exchange": {"timestamp": time.time(), "trading_pairs": ["CACHED-PAIR"]},
+                "no_pairs_exchange": {"timestamp": time.time()},
+                "bad_timestamp_exchange": {"timestamp": None, "trading_pairs": ["OLD-PAIR"]},
+                "list_exchange": ["OLD-PAIR"],
+            }, fd)
+
+        fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertTrue(fetcher.ready)
+        cached_connector.all_trading_pairs.assert_not_called()
+        self.assertEqual(
+            {"cached_exchange": ["CACHED-PAIR"], "no_pairs_exchange": ["NEW-PAIR"], "bad_timestamp_exchange": ["NEW-PAIR"]},
+            fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_all_ignores_a_cache_that_is_not_a_mapping(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        with open(self.cache_path, "w") as fd:
+            json.dump(["mock_exchange_1"], fd)
+
+        fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertTrue(fetcher.ready)
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, fetcher.trading_pairs)
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     def test_fetch_all(self, mock_api, all_connector_settings_mock):
@@ -160,6 +160,8 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
             "order_refresh_time": "30",
             "inventory_target_base_pct": self.inventory_target_base_pct,
             "add_transaction_costs": "yes",
+            # The expected liquidity estimations are those of a curve fit on every estimation
+            "trading_intensity_curve_fit_interval": 1,
         }
         return config_settings
 
@@ -790,6 +792,7 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
             "risk_factor": self.risk_factor_infinite,
             "order_refresh_time": "60",
             "inventory_target_base_pct": self.inventory_target_base_pct,
+            "trading_intensity_curve_fit_interval": 1,
         }
         config_map = ClientConfigAdapter(AvellanedaMarketMakingConfigMap(**config_settings))
 
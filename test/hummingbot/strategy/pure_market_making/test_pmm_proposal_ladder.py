@@ -0,0 +1,104 @@
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "HBOT-ETH"
+
+
+def legacy_base_proposal(strategy: PureMarketMakingStrategy) -> Proposal:
+    """
+    Reference implementation of the per level Decimal computation the strategy used before the level ladder was
+    cached.
+    """
+    market = strategy.market_info.market
+    buys: List[PriceSize] = []
+    sells: List[PriceSize] = []
+    reference_price = strategy.get_price()
+    if not reference_price.is_nan():
+        for level in range(0, strategy.buy_levels):
+            price = reference_price * (Decimal("1") - strategy.bid_spread - (level * strategy.order_level_spread))
+            price = market.quantize_order_price(TRADING_PAIR, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = market.quantize_order_amount(TRADING_PAIR, size)
+            if size > 0:
+                buys.append(PriceSize(price, size))
+        for level in range(0, strategy.sell_levels):
+            price = reference_price * (Decimal("1") + strategy.ask_spread + (level * strategy.order_level_spread))
+            price = market.quantize_order_price(TRADING_PAIR, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = market.quantize_order_amount(TRADING_PAIR, size)
+            if size > 0:
+                sells.append(PriceSize(price, size))
+    return Proposal(buys, sells)
+
+
+def as_tuples(orders: List[PriceSize]):
+    return [(order.price, order.size) for order in orders]
+
+
+class PMMProposalLadderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.market.set_balanced_order_book(TRADING_PAIR,
+                                            mid_price=1234.5678,
+                                            min_price=1,
+                                            max_price=2500,
+                                            price_step_size=0.37,
+                                            volume_step_size=10)
+        self.market.set_quantization_param(QuantizationParams(TRADING_PAIR, 4, 3, 4, 3))
+        self.market_info = MarketTradingPairTuple(self.market, TRADING_PAIR, "HBOT", "ETH")
+        self.strategy = PureMarketMakingStrategy()
+        self.strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.0013"),
+            ask_spread=Decimal("0.0027"),
+            order_amount=Decimal("0.3333"),
+            order_levels=25,
+            order_level_spread=Decimal("0.00071"),
+            order_level_amount=Decimal("0.0777"),
+            order_refresh_time=5.0,
+            minimum_spread=-1,
+        )
+
+    def assert_same_proposal(self, expected: Proposal, actual: Proposal):
+        self.assertEqual(as_tuples(expected.buys), as_tuples(actual.buys))
+        self.assertEqual(as_tuples(expected.sells), as_tuples(actual.sells))
+
+    def test_base_proposal_matches_legacy_computation(self):
+        proposal = self.strategy.create_base_proposal()
+
+        self.assertEqual(25, len(proposal.buys))
+        self.assertEqual(25, len(proposal.sells))
+        self.assert_same_proposal(legacy_base_proposal(self.strategy), proposal)
+
+    def test_base_proposal_follows_configuration_changes(self):
+        self.strategy.create_base_proposal()
+
+        self.strategy.bid_spread = Decimal("0.005")
+        self.strategy.order_level_spread = Decimal("0.0011")
+        self.strategy.order_level_amount = Decimal("-0.02")
+        self.strategy.buy_levels = 30
+        self.strategy.sell_levels = 7
+        proposal = self.strategy.create_base_proposal()
+
+        self.assertEqual(7, len(proposal.sells))
+        self.assert_same_proposal(legacy_base_proposal(self.strategy), proposal)
+
+    def test_base_proposal_matches_legacy_computation_across_prices(self):
+        for mid_price in (0.000123, 0.98765, 17.3, 4321.123, 98765.4321):
+            self.market.set_balanced_order_book(TRADING_PAIR,
+                                                mid_price=mid_price,
+                                                min_price=mid_price / 2,
+                                                max_price=mid_price * 2,
+                                                price_step_size=mid_price / 100,
+                                                volume_step_size=10)
+            self.assert_same_proposal(legacy_base_proposal(self.strategy), self.strategy.create_base_proposal())
@@ -14,6 +14,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_tracker import OrderTracker
+from hummingbot.strategy.pure_market_making.pure_market_making_order_tracker import PureMarketMakingOrderTracker
 
 
 class OrderTrackerUnitTests(unittest.TestCase):
@@ -181,6 +182,55 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         self.assertTrue(len(self.order_tracker.active_asks) == len(self.limit_orders) / 2)
 
+    def test_active_bids_and_asks_follow_active_limit_orders_overrides(self):
+        order_tracker = PureMarketMakingOrderTracker()
+        self.clock.add_iterator(order_tracker)
+        for order in self.limit_orders:
+            self.simulate_place_order(order_tracker, order, self.market_info)
+            self.simulate_order_created(order_tracker, order)
+
+        # The pure market making tracker keeps the orders with a cancel in flight active
+        self.simulate_cancel_order(order_tracker, self.limit_orders[0])
+        self.simulate_cancel_order(order_tracker, self.limit_orders[1])
+
+        self.assertEqual(len(self.limit_orders) / 2, len(order_tracker.active_bids))
+        self.assertEqual(len(self.limit_orders) / 2, len(order_tracker.active_asks))
+
+    def test_get_active_limit_orders(self):
+        other_market_info: MarketTradingPairTuple = MarketTradingPairTuple(self.market, "ETH-USDT", "ETH", "USDT")
+        self.assertEqual([], self.order_tracker.get_active_limit_orders(self.market, self.trading_pair))
+
+        for order in self.limit_orders:
+            self.simulate_place_order(self.order_tracker, order, self.market_info)
+            self.simulate_order_created(self.order_tracker, order)
+        other_order = LimitOrder("other_order", "ETH-USDT", True, "ETH", "USDT", Decimal("10"), Decimal("1"))
+        self.simulate_place_order(self.order_tracker, other_order, other_market_info)
+
+        bid_ids = [order.client_order_id for order in self.limit_orders if order.is_buy]
+        ask_ids = [order.client_order_id for order in self.limit_orders if not order.is_buy]
+        self.assertEqual(bid_ids, [order.client_order_id for order in
+                                   self.order_tracker.get_active_bids(self.market, self.trading_pair)])
+        self.assertEqual(ask_ids, [order.client_order_id for order in
+                                   self.order_tracker.get_active_asks(self.market, self.trading_pair)])
+        self.assertEqual(len(self.limit_orders),
+                         len(self.order_tracker.get_active_limit_orders(self.market, self.trading_pair)))
+        self.assertEqual(["other_order"], [order.client_order_id for order in
+                                           self.order_tracker.get_active_limit_orders(self.market, "ETH-USDT")])
+        self.assertEqual([], self.order_tracker.get_active_asks(self.market, "ETH-USDT"))
+
+        # Orders with a cancel in flight are not active
+        self.simulate_cancel_order(self.order_tracker, self.limit_orders[0])
+        self.assertEqual(bid_ids[1:], [order.client_order_id for order in
+                                       self.order_tracker.get_active_bids(self.market, self.trading_pair)])
+
+        # Orders no longer tracked are removed from the index
+        for order in self.limit_orders:
+            self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+        self.assertEqual([], self.order_tracker.get_active_limit_orders(self.market, self.trading_pair))
+        self.assertEqual([(self.market, other_order.client_order_id)],
+                         [(market, order.client_order_id) for market, order in self.order_tracker.active_bids])
+        self.assertEqual([], self.order_tracker.active_asks)
+
     def test_tracked_limit_orders(self):
         # Check initial output
         self.assertTrue(len(self.order_tracker.tracked_limit_orders) == 0)
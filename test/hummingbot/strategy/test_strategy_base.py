@@ -440,3 +440,93 @@ class StrategyBaseUnitTests(unittest.TestCase):
 
         self.assertIn("(2021-06-17 00:00:00) Test message", cli_logs)
         self.assertIn("(2021-06-17 00:00:00) Test message", messages)
+
+    def test_snapshot_reads_market_outside_of_tick(self):
+        self.assertEqual(Decimal("500"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+        self.market.set_balance("COINALPHA", 20)
+
+        self.assertEqual(Decimal("20"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+    def test_snapshot_caches_market_state_within_tick(self):
+        self.strategy.tick(1640001112.223)
+
+        self.assertEqual(Decimal("500"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+        self.assertEqual(Decimal("500"), self.strategy.snapshot_balance(self.market, "COINALPHA"))
+        self.assertEqual(self.market_info.get_mid_price(),
+                         self.strategy.snapshot_mid_price(self.market, self.trading_pair))
+        self.assertEqual(self.market.ready, self.strategy.snapshot_markets_ready())
+
+        self.market.set_balance("COINALPHA", 20)
+        self.assertEqual(Decimal("500"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+        self.strategy.invalidate_snapshot()
+        self.assertEqual(Decimal("20"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+        self.market.set_balance("COINALPHA", 30)
+        self.strategy.tick(1640001113.223)
+        self.assertEqual(Decimal("30"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+    def test_snapshot_invalidated_by_order_events_and_tracking(self):
+        self.strategy.tick(1640001112.223)
+        self.assertEqual({}, self.strategy.snapshot_active_orders())
+
+        self.strategy.start_tracking_limit_order(self.market_info, "order_1", True, Decimal("99"), Decimal("1"))
+        active_orders = self.strategy.snapshot_active_orders()
+        self.assertEqual(["order_1"], [o.client_order_id for o in active_orders[self.market_info]])
+        self.assertIs(active_orders, self.strategy.snapshot_active_orders())
+
+        self.strategy.snapshot_available_balance(self.market, "COINALPHA")
+        self.market.set_balance("COINALPHA", 20)
+        limit_order = self.strategy.order_tracker.get_limit_order(self.market_info, "order_1")
+        self.simulate_order_filled(self.market_info, limit_order)
+
+        self.assertEqual(Decimal("20"), self.strategy.snapshot_available_balance(self.market, "COINALPHA"))
+
+    def test_snapshot_value(self):
+        values = iter([1, 2])
+        self.assertEqual(1, self.strategy.snapshot_value("key", lambda: next(values)))
+        self.assertEqual(2, self.strategy.snapshot_value("key", lambda: next(values)))
+
+        values = iter([3, 4])
+        self.strategy.tick(1640001112.223)
+        self.assertEqual(3, self.strategy.snapshot_value("key", lambda: next(values)))
+        self.assertEqual(3, self.strategy.snapshot_value("key", lambda: next(values)))
+
+    def test_batch_order_create_and_cancel(self):
+        orders_to_create = [
+            LimitOrder("", self.trading_pair, True, "COINALPHA", "HBOT", Decimal("99"), Decimal("1")),
+            LimitOrder("", self.trading_pair, False, "COINALPHA", "HBOT", Decimal("101"), Decimal("2")),
+        ]
+
+        created_orders = self.strategy.batch_order_create(self.market, orders_to_create)
+
+        self.assertEqual(2, len(created_orders))
+        self.assertTrue(all(order.client_order_id for order in created_orders))
+        active_orders = self.strategy.order_tracker.market_pair_to_active_orders[self.market_info]
+        self.assertEqual([(order.client_order_id, order.is_buy, order.price, order.quantity)
+                          for order in created_orders],
+                         [(order.client_order_id, order.is_buy, order.price, order.quantity)
+                          for order in active_orders])
+
+        self.strategy.batch_order_cancel(self.market, created_orders)
+
+        self.assertEqual([], self.strategy.order_tracker.market_pair_to_active_orders.get(self.market_info, []))
+
+    def test_batch_order_create_rejects_non_limit_orders(self):
+        orders_to_create = [LimitOrder("", self.trading_pair, True, "COINALPHA", "HBOT", Decimal("99"), Decimal("1"))]
+
+        with self.assertRaises(ValueError):
+            self.strategy.batch_order_create(self.market, orders_to_create, order_type=OrderType.MARKET)
+
+    def test_batch_order_create_rejects_non_decimal_amounts_and_prices(self):
+        orders_to_create = [LimitOrder("", self.trading_pair, True, "COINALPHA", "HBOT", 99.0, Decimal("1"))]
+
+        with self.assertRaises(TypeError):
+            self.strategy.batch_order_create(self.market, orders_to_create)
+
+        orders_to_create = [LimitOrder("", self.trading_pair, True, "COINALPHA", "HBOT", Decimal("99"), 1.0)]
+
+        with self.assertRaises(TypeError):
+            self.strategy.batch_order_create(self.market, orders_to_create)
+        self.assertEqual([], self.strategy.order_tracker.market_pair_to_active_orders.get(self.market_info, []))
@@ -107,3 +107,130 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_get_first_value(self):
+        buffer = RingBuffer(3)
+        self.assertTrue(np.isnan(buffer.get_first_value()))
+
+        for i in range(5):
+            buffer.add_value(i)
+            self.assertEqual(buffer.get_first_value(), buffer.get_as_numpy_array()[0])
+
+    def test_size(self):
+        buffer = RingBuffer(3)
+        self.assertEqual(len(buffer), 0)
+
+        for i in range(5):
+            buffer.add_value(i)
+            self.assertEqual(min(i + 1, 3), buffer.size)
+            self.assertEqual(buffer.size, len(buffer))
+
+    def test_running_stats_match_numpy(self):
+        np.random.seed(123456789)
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 10)
+
+        for sample in samples:
+            self.buffer.add_value(sample)
+            values = self.buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.sum(values), self.buffer.sum, 6)
+            self.assertAlmostEqual(np.mean(values), self.buffer.window_mean, 9)
+            self.assertAlmostEqual(np.var(values), self.buffer.window_variance, 9)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 9)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 9)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 9)
+
+    def test_window_stats_when_empty(self):
+        self.assertEqual(0, self.buffer.sum)
+        self.assertTrue(np.isnan(self.buffer.window_mean))
+        self.assertTrue(np.isnan(self.buffer.window_variance))
+
+    def test_running_stats_recover_after_nan(self):
+        buffer = RingBuffer(4)
+        buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(buffer.window_mean))
+
+        for i in range(4):
+            buffer.add_value(i)
+        self.assertEqual(1.5, buffer.mean_value)
+        self.assertEqual(1.25, buffer.variance)
+
+    def test_running_stats_after_length_change(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.arange(25, 30)))
+        self.assertEqual(27, self.buffer.mean_value)
+        self.assertEqual(2, self.buffer.variance)
+
+    def test_values_keep_double_precision(self):
+        value = 30123.456789012345
+        self.buffer.add_value(value)
+        self.assertEqual(value, self.buffer.get_last_value())
+
+    def test_large_window(self):
+        length = 100000
+        buffer = RingBuffer(length)
+        values = np.arange(length + 10, dtype=np.float64)
+
+        for value in values:
+            buffer.add_value(value)
+
+        self.assertTrue(np.array_equal(values[-length:], buffer.get_as_numpy_array()))
+        self.assertEqual(np.mean(values[-length:]), buffer.mean_value)
+
+    def test_add_values(self):
+        buffer = RingBuffer(5)
+        buffer.add_values(np.array([1, 2, 3]))
+        self.assertTrue(np.array_equal(np.array([1, 2, 3]), buffer.get_as_numpy_array()))
+        self.assertFalse(buffer.is_full)
+
+        buffer.add_values(np.array([4, 5, 6, 7]))
+        self.assertTrue(np.array_equal(np.array([3, 4, 5, 6, 7]), buffer.get_as_numpy_array()))
+        self.assertTrue(buffer.is_full)
+        self.assertEqual(5, buffer.mean_value)
+        self.assertEqual(2, buffer.variance)
+
+        buffer.add_values(np.arange(20, 40))
+        self.assertTrue(np.array_equal(np.arange(35, 40), buffer.get_as_numpy_array()))
+
+        buffer.add_value(40)
+        self.assertTrue(np.array_equal(np.arange(36, 41), buffer.get_as_numpy_array()))
+        self.assertEqual(38, buffer.mean_value)
+
+    def test_add_values_is_equivalent_to_add_value(self):
+        np.random.seed(123456789)
+        samples = np.random.normal(100, 10, 137)
+        bulk_buffer = RingBuffer(self.BUFFER_LENGTH)
+
+        for chunk in np.array_split(samples, 9):
+            bulk_buffer.add_values(chunk)
+            for sample in chunk:
+                self.buffer.add_value(sample)
+            self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), bulk_buffer.get_as_numpy_array()))
+            self.assertAlmostEqual(self.buffer.window_mean, bulk_buffer.window_mean, 9)
+            self.assertAlmostEqual(self.buffer.window_variance, bulk_buffer.window_variance, 9)
+
+    def test_get_views(self):
+        buffer = RingBuffer(4)
+        self.assertEqual(0, buffer.get_views()[0].size)
+
+        buffer.add_values(np.array([0, 1, 2]))
+        views = buffer.get_views()
+        self.assertEqual(1, len(views))
+        self.assertTrue(np.array_equal(np.array([0, 1, 2]), views[0]))
+
+        buffer.add_value(3)
+        views = buffer.get_views()
+        self.assertEqual(1, len(views))
+        self.assertTrue(np.array_equal(np.array([0, 1, 2, 3]), views[0]))
+
+        buffer.add_values(np.array([4, 5]))
+        views = buffer.get_views()
+        self.assertEqual(2, len(views))
+        self.assertTrue(np.array_equal(np.array([2, 3, 4, 5]), np.concatenate(views)))
+
+        with self.assertRaises(ValueError):
+            views[0][0] = 10
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_processing_length_should_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
+
+    def test_ema_matches_pandas(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+            window = indicator._sampling_buffer.get_as_numpy_array()
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 9)
+
+    def test_ema_after_sampling_length_change(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 2)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 10
+        indicator.add_sample(samples[-1])
+
+        window = indicator._sampling_buffer.get_as_numpy_array()
+        expected = pd.Series(window).ewm(span=10, adjust=True).mean().iloc[-1]
+        self.assertEqual(10, window.size)
+        self.assertAlmostEqual(expected, indicator.current_value, 9)
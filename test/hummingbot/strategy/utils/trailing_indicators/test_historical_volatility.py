@@ -66,3 +66,32 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_matches_full_window_calculation(self):
+        sampling_length = 50
+        processing_length = 10
+        returns = np.random.normal(0, 0.1, sampling_length * 5)
+        samples = 100 * np.exp(np.cumsum(returns))
+        self.indicator = HistoricalVolatilityIndicator(sampling_length, processing_length)
+
+        prices = []
+        variances = []
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            prices = (prices + [sample])[-sampling_length:]
+            variances = (variances + [np.var(np.diff(np.log(prices))) if len(prices) > 1 else 0])[-processing_length:]
+            self.assertAlmostEqual(np.sqrt(np.mean(variances)), self.indicator.current_value, 9)
+
+    def test_volatility_after_sampling_length_change(self):
+        returns = np.random.normal(0, 0.1, 100)
+        samples = 100 * np.exp(np.cumsum(returns))
+        self.indicator = HistoricalVolatilityIndicator(100, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 20
+        self.indicator.add_sample(samples[-1])
+
+        prices = self.indicator._sampling_buffer.get_as_numpy_array()
+        self.assertEqual(20, prices.size)
+        self.assertAlmostEqual(np.sqrt(np.var(np.diff(np.log(prices)))), self.indicator.current_value, 9)
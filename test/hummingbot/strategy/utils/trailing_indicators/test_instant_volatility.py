@@ -20,3 +20,29 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_matches_full_window_calculation(self):
+        sampling_length = 50
+        samples = np.random.normal(100, 10, sampling_length * 5)
+        self.indicator = InstantVolatilityIndicator(sampling_length, 1)
+
+        prices = []
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            prices = (prices + [sample])[-sampling_length:]
+            expected = np.sqrt(np.sum(np.square(np.diff(prices))) / len(prices))
+            self.assertAlmostEqual(expected, self.indicator.current_value, 9)
+
+    def test_volatility_after_sampling_length_change(self):
+        samples = np.random.normal(100, 10, 100)
+        self.indicator = InstantVolatilityIndicator(100, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 20
+        self.indicator.add_sample(samples[-1])
+
+        prices = self.indicator._sampling_buffer.get_as_numpy_array()
+        self.assertEqual(20, prices.size)
+        expected = np.sqrt(np.sum(np.square(np.diff(prices))) / prices.size)
+        self.assertAlmostEqual(expected, self.indicator.current_value, 9)
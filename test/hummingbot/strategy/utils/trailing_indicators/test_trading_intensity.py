@@ -259,3 +259,103 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_deterministic_closed_form(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+        ts = [curve_fn(p - last_price, a, b) for p in trade_price_levels]
+
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, curve_fit_interval=0)
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+
+        timestamp += 1
+
+        for p, t in zip(trade_price_levels, ts):
+            new_trade = OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=t,
+                type=TradeType.SELL,
+            )
+            trading_intensity_indicator.register_trade(new_trade)
+
+        trading_intensity_indicator.calculate(timestamp)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_are_assigned_to_the_latest_previous_quote(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2, curve_fit_interval=0)
+        indicator.last_quotes = [{"timestamp": 1, "price": 10}]
+
+        # Compared against the quote at timestamp 1, levels 1 and 3
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 11, 10))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 13, 1))
+        indicator.calculate(2)
+
+        self.assertEqual([2, 1], [quote["timestamp"] for quote in indicator.last_quotes])
+        self.assertFalse(indicator.is_sampling_buffer_full)
+
+        # Compared against the quote at timestamp 2, the mid price when calculating, levels 1 and 3 again
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 1, 10))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 3, 1))
+        indicator.calculate(3)
+
+        # Quotes older than the latest one used are discarded
+        self.assertEqual([3, 2], [quote["timestamp"] for quote in indicator.last_quotes])
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(20 * np.sqrt(10), alpha, 10)
+        self.assertAlmostEqual(np.log(10) / 2, kappa, 10)
+
+    def test_oldest_trade_samples_are_discarded(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, curve_fit_interval=0)
+        indicator.last_quotes = [{"timestamp": 1, "price": 10}]
+
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 11, 10))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 12, 1))
+        indicator.calculate(2)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(100, alpha, 10)
+        self.assertAlmostEqual(np.log(10), kappa, 10)
+
+        # The sample of the quote at timestamp 1 leaves the window, only the new trades are used
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 2, 4))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 4, 1))
+        indicator.calculate(3)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(16, alpha, 10)
+        self.assertAlmostEqual(np.log(4) / 2, kappa, 10)
+
+    def test_curve_fit_interval(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, curve_fit_interval=2)
+        indicator.last_quotes = [{"timestamp": 1, "price": 10}]
+
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 11, 10))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 1.5, TradeType.SELL, 12, 1))
+        indicator.calculate(2)
+        first_estimation = indicator.current_value
+        self.assertAlmostEqual(100, first_estimation[0], 4)
+        self.assertAlmostEqual(np.log(10), first_estimation[1], 4)
+
+        # Not refined on this estimation, the previous value is kept
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 2, 4))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 2.5, TradeType.SELL, self.initial_mid_price + 4, 1))
+        indicator.calculate(3)
+        self.assertEqual(first_estimation, indicator.current_value)
+
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 3.5, TradeType.SELL, self.initial_mid_price + 3, 4))
+        indicator.register_trade(OrderBookTradeEvent("COINALPHAHBOT", 3.5, TradeType.SELL, self.initial_mid_price + 5, 1))
+        indicator.calculate(4)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(32, alpha, 4)
+        self.assertAlmostEqual(np.log(4) / 2, kappa, 4)